@@ -2,6 +2,8 @@
 Desert Sands — gesture-controlled falling sand / fluid simulation.
 NumPy-accelerated grid for performance.
 """
+from collections import deque
+import heapq
 import math
 import os
 import random
@@ -11,7 +13,10 @@ import numpy as np
 
 _CELL = 5
 _FPS_SIM = 36
+_FPS_FRAME = 60     # main loop rate; the sim steps on every _sim_speed-th frame
 _PERF_CAP = 12000     # above this many active particles, process a random subset
+_GNOME_SCAN_CAP = 60  # above this many gnomes, each one scans its surroundings every 3rd tick
+_BEE_SEARCH_CAP = 32  # above this many bees, plant searches are spread over 4 ticks
 
 _BLACK = (0, 0, 0)
 _PALE_YELLOW = (255, 255, 153)
@@ -100,9 +105,59 @@ _FIRE_COLORS = [
 ]
 
 
+# Cells that set a gnome alight when within 2 cells of it
+_IGNITES_GNOME = frozenset((FIRE, NAPALM, MAGMA))
+_NOTHING_NEAR = frozenset()   # stand-in neighbourhood on ticks a gnome doesn't scan
+
+# What each mover treats as open space — hashed sets, so a per-cell test is
+# one lookup instead of a walk down a tuple of cell codes
+_GNOME_WALKABLE = frozenset((EMPTY, FIRE, NAPALM, WATER, POISON, HOLYWATER, MONEY, GRASS))
+_GNOME_FALLS_THROUGH = frozenset((EMPTY, FIRE, NAPALM, WATER, POISON, HOLYWATER))
+_GNOME_UNSTUCK = _GNOME_FALLS_THROUGH | {MONEY}         # not clipped into ground
+_SHOT_PASSES = frozenset((EMPTY, FIRE, NAPALM, TUNNEL, WATER, POISON, HOLYWATER))
+_MISSILE_PASSES = _SHOT_PASSES | {GRASS}
+_SHOT_SPARES = frozenset((EMPTY, CONCRETE, GLASS, TUNNEL))   # buckshot can't destroy
+_FLAME_BURNS = frozenset((WOOD, PLANT, DIRT, HEAVY, GRASS))
+
+
+def _find_nearest_money(grid, ix, iy):
+    """Closest MONEY cell on the every-other-cell lattice within 40 cells
+    (±40 across, ±20 down) of (ix, iy), as a grid (x, y) tuple or None.
+    Ties go to the leftmost column, then the topmost row."""
+    # Lattice points share the gnome's parity, so clip each start to the
+    # first in-world point of that parity and stride by 2
+    x0, y0 = max(ix - 40, ix % 2), max(iy - 20, iy % 2)
+    sub = grid[y0:max(iy + 21, 0):2, x0:ix + 41:2]
+    cols, rows = np.nonzero(sub.T == MONEY)
+    if not cols.size:
+        return None
+    xs = x0 + 2 * cols
+    ys = y0 + 2 * rows
+    d2 = (xs - ix) ** 2 + (ys - iy) ** 2
+    k = d2.argmin()
+    if d2[k] >= 1600:
+        return None
+    return (int(xs[k]), int(ys[k]))
+
+
+# Burning gnome/zombie sprite tints (RGBA multiply)
+_FIRE_TINTS = ((255, 80, 0, 140), (255, 0, 0, 140), (255, 180, 0, 140))
+
+
 class _Gnome:
     """A tiny stick figure that falls with gravity, lands on surfaces, and walks."""
 
+    __slots__ = (
+        'gx', 'gy', 'vy', 'dir', 'grounded', 'walk_timer', 'hp',
+        '_last_hit_tick', 'color', 'hat_color', 'alive', 'on_fire',
+        'fire_start_time', 'bee_stung', 'bee_sting_time', 'held', 'fall_start',
+        'has_parachute', 'parachute_open', 'celebrating', 'celebrate_start',
+        'is_zombie', 'zombie_target', 'frozen', 'freeze_start',
+        'zombie_pending', 'ice_frozen', '_original_color', '_original_hat',
+        'money_target', 'collecting_money', 'collect_start', 'money_happy',
+        'money_happy_start',
+    )
+
     def __init__(self, gx, gy):
         self.gx = float(gx)
         self.gy = float(gy)
@@ -143,28 +198,29 @@ class _Gnome:
         self.money_happy = False        # hopping after collecting
         self.money_happy_start = 0.0
 
-    def _can_walk(self, ix, iy, direction, grid):
+    def _can_walk(self, ix, iy, direction, grid, w):
         """Check if we can walk one step in the given direction.
         Returns (new_gx, new_gy) or None."""
-        _passable = (EMPTY, FIRE, NAPALM, WATER, POISON, HOLYWATER, MONEY, GRASS)
-        h, w = grid.shape
         next_x = ix + direction
         if next_x < 0 or next_x >= w:
             return None  # edge of world
-        if grid[iy, next_x] in _passable:
+        if grid.item(iy, next_x) in _GNOME_WALKABLE:
             return (float(next_x), float(iy))
         else:
             # Blocked — try climbing 1 cell
             climb_y = iy - 1
-            if climb_y >= 0 and grid[climb_y, next_x] in _passable:
+            if climb_y >= 0 and grid.item(climb_y, next_x) in _GNOME_WALKABLE:
                 return (float(next_x), float(climb_y))
             else:
                 return None  # can't climb
 
-    def step(self, grid):
+    def step(self, grid, h, w, scan=True):
+        """Advance one sim tick; h, w is grid.shape, hoisted by the caller.
+        With scan=False (crowd mode) the contact and money scans are skipped
+        and the gnome keeps whatever they decided last time."""
         if self.held:
             return  # being carried, skip physics
-        h, w = grid.shape
+        now = time.time()   # one clock read serves every timer check below
         ix, iy = int(self.gx), int(self.gy)
 
         # Off-screen check
@@ -174,7 +230,7 @@ class _Gnome:
 
         # --- Frozen (zombie bite freeze) ---
         if self.frozen:
-            if time.time() - self.freeze_start >= 2.0:
+            if now - self.freeze_start >= 2.0:
                 self.frozen = False
                 # Convert to zombie now that freeze is over
                 if self.zombie_pending:
@@ -188,17 +244,19 @@ class _Gnome:
             else:
                 return  # can't move while frozen
 
+        # Every material within 2 cells (clipped to the world), gathered once.
+        # The grid is uint8, so the slice's raw bytes are the cell codes and
+        # each contact check below is a set lookup rather than a 5×5 scan
+        x0, x1 = max(ix - 2, 0), ix + 3
+        if scan:
+            near = set(grid[max(iy - 2, 0):max(iy + 3, 0), x0:x1].tobytes())
+        elif self.ice_frozen:
+            return  # stays frozen until its next scan
+        else:
+            near = _NOTHING_NEAR
+
         # --- Ice freeze: check if touching ice ---
-        touching_ice = False
-        for dx in range(-2, 3):
-            for dy in range(-2, 3):
-                cx, cy = ix + dx, iy + dy
-                if 0 <= cx < w and 0 <= cy < h and grid[cy, cx] == ICE:
-                    touching_ice = True
-                    break
-            if touching_ice:
-                break
-        if touching_ice:
+        if ICE in near:
             if not self.ice_frozen:
                 # Freeze solid — save original colors, turn light blue
                 self.ice_frozen = True
@@ -217,127 +275,73 @@ class _Gnome:
                 self._original_hat = None
 
         # Check if standing in or near fire (2-cell radius)
-        if not self.on_fire:
-            for dx in range(-2, 3):
-                for dy in range(-2, 3):
-                    cx, cy = ix + dx, iy + dy
-                    if 0 <= cx < w and 0 <= cy < h and grid[cy, cx] in (FIRE, NAPALM, MAGMA):
-                        self.on_fire = True
-                        self.fire_start_time = time.time()
-                        break
-                if self.on_fire:
-                    break
+        if not self.on_fire and not near.isdisjoint(_IGNITES_GNOME):
+            self.on_fire = True
+            self.fire_start_time = now
 
         # Check if touching poison — freeze 2s then turn zombie
         if not self.is_zombie and not self.on_fire and not self.frozen:
-            touched_poison = False
-            for dx in range(-2, 3):
-                for dy in range(-2, 3):
-                    cx, cy = ix + dx, iy + dy
-                    if 0 <= cx < w and 0 <= cy < h and grid[cy, cx] == POISON:
-                        touched_poison = True
-                        break
-                if touched_poison:
-                    break
-            if touched_poison:
+            if POISON in near:
                 self.frozen = True
-                self.freeze_start = time.time()
+                self.freeze_start = now
                 self.zombie_pending = True
 
         # Check if zombie touching holy water — cured!
-        if self.is_zombie:
-            for dx in range(-2, 3):
-                for dy in range(-2, 3):
-                    cx, cy = ix + dx, iy + dy
-                    if 0 <= cx < w and 0 <= cy < h and grid[cy, cx] == HOLYWATER:
-                        self.is_zombie = False
-                        self.color = random.choice(_GNOME_COLORS)
-                        self.hat_color = random.choice(_HAT_COLORS)
-                        self.has_parachute = True
-                        break
-                if not self.is_zombie:
-                    break
+        if self.is_zombie and HOLYWATER in near:
+            self.is_zombie = False
+            self.color = random.choice(_GNOME_COLORS)
+            self.hat_color = random.choice(_HAT_COLORS)
+            self.has_parachute = True
 
         # Check if touching confetti — triggers celebration hop
         if not self.celebrating and not self.on_fire and not self.is_zombie:
-            for dx in range(-2, 3):
-                for dy in range(-2, 3):
-                    cx, cy = ix + dx, iy + dy
-                    if 0 <= cx < w and 0 <= cy < h and grid[cy, cx] == CONFETTI:
-                        self.celebrating = True
-                        self.celebrate_start = time.time()
-                        break
-                if self.celebrating:
-                    break
+            if CONFETTI in near:
+                self.celebrating = True
+                self.celebrate_start = now
 
         # --- Money collection behavior (non-zombie, non-fire gnomes) ---
         if not self.is_zombie and not self.on_fire and not self.celebrating:
             # If currently collecting money — slowly destroy money under feet
             if self.collecting_money:
-                # Check if still touching money
-                touching_money = False
-                for dx in range(-2, 3):
-                    for dy in range(-1, 3):
-                        cx2, cy2 = ix + dx, iy + dy
-                        if 0 <= cx2 < w and 0 <= cy2 < h and grid[cy2, cx2] == MONEY:
-                            touching_money = True
-                            break
-                    if touching_money:
-                        break
-                if touching_money:
-                    # Slowly destroy one money cell every ~8 ticks
+                # Check if still touching money (feet box: 1 up, 2 down)
+                feet = grid[max(iy - 1, 0):max(iy + 3, 0), x0:x1]
+                if MONEY in feet.tobytes():
+                    # Slowly destroy one money cell every ~8 ticks —
+                    # leftmost column first, top-down within it
                     if random.random() < 0.12:
-                        for dx in range(-2, 3):
-                            for dy in range(-1, 3):
-                                cx2, cy2 = ix + dx, iy + dy
-                                if 0 <= cx2 < w and 0 <= cy2 < h and grid[cy2, cx2] == MONEY:
-                                    grid[cy2, cx2] = EMPTY
-                                    break
-                            else:
-                                continue
-                            break
+                        cols, rows = np.nonzero(feet.T == MONEY)
+                        feet[rows[0], cols[0]] = EMPTY
                 else:
                     # All money gone — happy hop!
                     self.collecting_money = False
                     self.money_target = None
                     self.money_happy = True
-                    self.money_happy_start = time.time()
+                    self.money_happy_start = now
             elif self.money_happy:
                 # Hop for 2 seconds after collecting
-                if time.time() - self.money_happy_start >= 2.0:
+                if now - self.money_happy_start >= 2.0:
                     self.money_happy = False
-            elif self.money_target is None:
+            elif self.money_target is None and scan:
                 # Scan for nearby money (wide radius)
-                best_money = None
-                best_dist = 40.0  # max detection range in grid cells
-                for dx in range(-40, 41, 2):
-                    for dy in range(-20, 21, 2):
-                        cx2, cy2 = ix + dx, iy + dy
-                        if 0 <= cx2 < w and 0 <= cy2 < h and grid[cy2, cx2] == MONEY:
-                            d = math.hypot(dx, dy)
-                            if d < best_dist:
-                                best_dist = d
-                                best_money = (cx2, cy2)
-                if best_money:
-                    self.money_target = best_money
+                self.money_target = _find_nearest_money(grid, ix, iy)
 
         # Water puts out a burning gnome
-        if self.on_fire and 0 <= ix < w and 0 <= iy < h and grid[iy, ix] == WATER:
+        if self.on_fire and 0 <= ix < w and 0 <= iy < h and grid.item(iy, ix) == WATER:
             self.on_fire = False
 
         # Die after 3 seconds on fire
-        if self.on_fire and (time.time() - self.fire_start_time) > 3.0:
+        if self.on_fire and (now - self.fire_start_time) > 3.0:
             self.alive = False
             return
 
         # Die after 5 seconds of bee stings
-        if self.bee_stung and (time.time() - self.bee_sting_time) > 5.0:
+        if self.bee_stung and (now - self.bee_sting_time) > 5.0:
             self.alive = False
             return
 
         # Walk speed: every 5 ticks normally, every 3 on fire/stung, every 10 in water
         # Zombies always walk at 7 (don't speed up on fire)
-        in_water = (0 <= ix < w and 0 <= iy < h and grid[iy, ix] == WATER)
+        in_water = (0 <= ix < w and 0 <= iy < h and grid.item(iy, ix) == WATER)
         if self.is_zombie:
             walk_interval = 7
         elif self.on_fire or self.bee_stung:
@@ -352,8 +356,9 @@ class _Gnome:
         on_ground = False
         if below_y >= h:
             on_ground = True          # bottom of screen
-        elif grid[below_y, ix] != EMPTY and grid[below_y, ix] not in (FIRE, NAPALM, WATER, POISON, HOLYWATER):
-            on_ground = True          # standing on wall or sand (water is passable)
+        else:
+            if grid.item(below_y, ix) not in _GNOME_FALLS_THROUGH:
+                on_ground = True      # standing on wall or sand (water is passable)
 
         if on_ground:
             self.vy = 0.0
@@ -363,20 +368,19 @@ class _Gnome:
             self.parachute_open = False
 
             # Push gnome up if clipping into solid terrain
-            _solid_pass = (EMPTY, FIRE, NAPALM, WATER, POISON, HOLYWATER, MONEY)
             cix, ciy = int(self.gx), int(self.gy)
-            if 0 <= cix < w and 0 <= ciy < h and grid[ciy, cix] not in _solid_pass:
+            if 0 <= cix < w and 0 <= ciy < h and grid.item(ciy, cix) not in _GNOME_UNSTUCK:
                 # Inside solid ground — scan upward for first empty row
                 for scan_y in range(ciy - 1, max(ciy - 8, -1), -1):
                     if scan_y < 0:
                         break
-                    if grid[scan_y, cix] in _solid_pass:
+                    if grid.item(scan_y, cix) in _GNOME_UNSTUCK:
                         self.gy = float(scan_y)
                         break
 
             # --- celebration hop ---
             if self.celebrating:
-                if time.time() - self.celebrate_start >= 3.5:
+                if now - self.celebrate_start >= 3.5:
                     self.celebrating = False
                 else:
                     self.vy = -2.5
@@ -386,7 +390,7 @@ class _Gnome:
 
             # --- money happy hop ---
             if self.money_happy:
-                if time.time() - self.money_happy_start >= 2.0:
+                if now - self.money_happy_start >= 2.0:
                     self.money_happy = False
                 else:
                     self.vy = -2.0
@@ -414,12 +418,11 @@ class _Gnome:
             # Non-zombie gnomes chase money
             if not self.is_zombie and self.money_target is not None:
                 mx, my = self.money_target
-                if 0 <= mx < w and 0 <= my < h and grid[my, mx] == MONEY:
-                    dist = math.hypot(mx - ix, my - iy)
-                    if dist < 3:
+                if 0 <= mx < w and 0 <= my < h and grid.item(my, mx) == MONEY:
+                    if (mx - ix) ** 2 + (my - iy) ** 2 < 9:
                         # Close enough — start collecting
                         self.collecting_money = True
-                        self.collect_start = time.time()
+                        self.collect_start = now
                     else:
                         self.dir = 1 if mx > self.gx else -1
                 else:
@@ -431,14 +434,14 @@ class _Gnome:
                 self.walk_timer = 0
 
                 # Try current direction
-                result = self._can_walk(ix, iy, self.dir, grid)
+                result = self._can_walk(ix, iy, self.dir, grid, w)
                 if result:
                     self.gx, self.gy = result
                 else:
                     # Can't go forward — reverse immediately
                     self.dir *= -1
                     # Try the other direction right away
-                    result2 = self._can_walk(ix, iy, self.dir, grid)
+                    result2 = self._can_walk(ix, iy, self.dir, grid, w)
                     if result2:
                         self.gx, self.gy = result2
                     # else: stuck on both sides, just stand still
@@ -446,11 +449,11 @@ class _Gnome:
             # Falling
             self.grounded = False
             if self.fall_start == 0.0:
-                self.fall_start = time.time()
+                self.fall_start = now
 
             # Deploy parachute after 1.25s of falling (if still available)
             # Don't deploy while doing a confetti celebration hop
-            fall_dur = time.time() - self.fall_start
+            fall_dur = now - self.fall_start
             if fall_dur >= 1.25 and self.has_parachute and not self.parachute_open and not self.celebrating and not self.is_zombie:
                 self.parachute_open = True
 
@@ -461,16 +464,10 @@ class _Gnome:
 
             # Check if fire/napalm nearby burns the parachute
             if self.parachute_open:
-                for ddx in range(-2, 3):
-                    for ddy in range(-4, 1):
-                        cx, cy = ix + ddx, iy + ddy
-                        if 0 <= cx < w and 0 <= cy < h and grid[cy, cx] in (FIRE, NAPALM):
-                            self.has_parachute = False
-                            self.parachute_open = False
-                            break
-                    else:
-                        continue
-                    break
+                canopy = grid[max(iy - 4, 0):max(iy + 1, 0), x0:x1].tobytes()
+                if FIRE in canopy or NAPALM in canopy:
+                    self.has_parachute = False
+                    self.parachute_open = False
 
             if self.parachute_open:
                 # Parachute: slow descent
@@ -484,12 +481,11 @@ class _Gnome:
             # Check each cell we'd pass through
             target_y = int(new_y)
             for check_y in range(iy + 1, min(target_y + 1, h)):
-                cell = grid[check_y, ix]
-                if cell != EMPTY and cell not in (FIRE, NAPALM, WATER, POISON, HOLYWATER):
+                if grid.item(check_y, ix) not in _GNOME_FALLS_THROUGH:
                     # Hard landing death — fell 1.4s+ without parachute
                     if (self.fall_start > 0
                             and not self.parachute_open
-                            and time.time() - self.fall_start >= 1.4):
+                            and now - self.fall_start >= 1.4):
                         self.alive = False
                         return
                     # Land on top of this cell
@@ -503,6 +499,29 @@ class _Gnome:
             self.gy = new_y
 
 
+def _gnome_xy(gnomes):
+    """Column snapshot of gnome positions: (gx, gy) float64 arrays, so
+    picking and targeting queries run vectorized instead of per gnome."""
+    n = len(gnomes)
+    return (np.fromiter((g.gx for g in gnomes), np.float64, n),
+            np.fromiter((g.gy for g in gnomes), np.float64, n))
+
+
+_BEE_BUCKET = 4   # side of the square cells gnomes are bucketed by for bees
+
+
+def _gnome_buckets(gnomes):
+    """Spatial hash of the gnomes a bee could sting, keyed by
+    _BEE_BUCKET-cell square.  Entries are (index, gnome) so a lookup can
+    still pick the first match in list order."""
+    buckets = {}
+    for i, gnome in enumerate(gnomes):
+        if gnome.alive and not gnome.on_fire:
+            key = (int(gnome.gx // _BEE_BUCKET), int(gnome.gy // _BEE_BUCKET))
+            buckets.setdefault(key, []).append((i, gnome))
+    return buckets
+
+
 # ────────────────────────────────────────────
 # Gibs — bouncing body pieces from explosions
 # ────────────────────────────────────────────
@@ -511,70 +530,165 @@ _GIB_COLORS = [
     (200, 60, 60), (180, 50, 50), (160, 40, 40),
     (220, 80, 80), (140, 30, 30), (190, 70, 50),
 ]
-
-
-class _Gib:
-    """A small bouncing chunk that sprays out when a gnome dies."""
-
-    def __init__(self, x, y, color=None):
-        self.x = float(x)
-        self.y = float(y)
-        self.vx = random.uniform(-3.0, 3.0)
-        self.vy = random.uniform(-5.0, -1.0)
-        self.color = color or random.choice(_GIB_COLORS)
-        self.alive = True
-        self.rest_timer = 0  # frames at rest
+# Blood spray from buckshot hits
+_BLOOD_COLORS = ((200, 30, 30), (180, 20, 20), (220, 50, 40), (160, 10, 10))
+
+
+class _Pooled:
+    """Free-list base for short-lived effect objects. spawn() re-initialises
+    a dead instance from the class pool when one is available, and
+    recycle() hands dead instances back — explosion bursts, splashes and
+    weapon fire then stop churning the allocator and the GC.
+    Subclasses set their own ``_pool = []``."""
+
+    __slots__ = ()
+    _POOL_MAX = 1024
+
+    @classmethod
+    def spawn(cls, *args, **kwargs):
+        pool = cls._pool
+        obj = pool.pop() if pool else cls.__new__(cls)
+        obj.__init__(*args, **kwargs)
+        return obj
+
+    @classmethod
+    def recycle(cls, items):
+        """Return the live items; dead ones go back to the pool."""
+        live = []
+        pool = cls._pool
+        for it in items:
+            if it.alive:
+                live.append(it)
+            elif len(pool) < cls._POOL_MAX:
+                pool.append(it)
+        return live
+
+
+class _ParticleField:
+    """Particles kept as parallel arrays (position, velocity, colour plus
+    any per-class extras in _EXTRA) instead of one object each, so a
+    whole burst steps in a handful of NumPy ops."""
+
+    _EXTRA = ()   # (name, dtype[, width]) of subclass-specific per-particle arrays
+
+    def __init__(self, cap=1024):
+        self._names = ('x', 'y', 'vx', 'vy', 'color') + tuple(name for name, *_ in self._EXTRA)
+        self.x = np.empty(cap)
+        self.y = np.empty(cap)
+        self.vx = np.empty(cap)
+        self.vy = np.empty(cap)
+        self.color = np.empty((cap, 3), dtype=np.uint8)
+        for name, dtype, *width in self._EXTRA:
+            setattr(self, name, np.empty((cap, *width), dtype=dtype))
+        self.n = 0
+
+    def __len__(self):
+        return self.n
+
+    def clear(self):
+        self.n = 0
+
+    def _claim(self, k=1):
+        """Reserve k new particle slots, growing as needed; returns the first."""
+        i = self.n
+        if i + k > len(self.x):
+            cap = max(2 * len(self.x), i + k)
+            for name in self._names:
+                old = getattr(self, name)
+                arr = np.empty((cap,) + old.shape[1:], dtype=old.dtype)
+                arr[:i] = old[:i]
+                setattr(self, name, arr)
+        self.n = i + k
+        return i
+
+    def _keep(self, alive):
+        """Compact the particles flagged in `alive` to the front."""
+        keep = np.flatnonzero(alive)
+        m = len(keep)
+        if m < self.n:
+            for name in self._names:
+                arr = getattr(self, name)
+                arr[:m] = arr[keep]
+            self.n = m
+
+    def splat(self, buf):
+        """Rasterize into the render buffer, see _splat_cells."""
+        n = self.n
+        _splat_cells(buf, self.x[:n], self.y[:n], self.color[:n])
+
+
+# Cells a gib flies through instead of bouncing off
+_GIB_PASS = np.zeros(256, dtype=bool)
+_GIB_PASS[[EMPTY, FIRE, NAPALM, WATER]] = True
+
+
+class _GibField(_ParticleField):
+    """Every live gib — small bouncing chunks that spray out when a gnome
+    dies.  They bounce off walls and solids, losing speed each time, and
+    vanish once they've rested for 30 frames."""
+
+    _EXTRA = (('rest', np.int32),)   # consecutive frames spent resting
+
+    def burst(self, x, y, n, colors, vx=None, vy=None):
+        """Emit n gibs from (x, y) in one go.  colors is one RGB or an
+        (n, 3) array; vx/vy are length-n arrays (default: random spray)."""
+        i = self._claim(n)
+        j = i + n
+        self.x[i:j] = x
+        self.y[i:j] = y
+        self.vx[i:j] = np.random.uniform(-3.0, 3.0, n) if vx is None else vx
+        self.vy[i:j] = np.random.uniform(-5.0, -1.0, n) if vy is None else vy
+        self.color[i:j] = colors
+        self.rest[i:j] = 0
 
     def step(self, grid):
+        n = self.n
+        if not n:
+            return
         h, w = grid.shape
+        x, y, vx, vy = self.x[:n], self.y[:n], self.vx[:n], self.vy[:n]
         # Gravity
-        self.vy += 0.35
-        # Move X
-        new_x = self.x + self.vx
-        ix, iy = int(new_x), int(self.y)
-        if ix < 0 or ix >= w:
-            self.vx = -self.vx * 0.6  # bounce off side walls
-            new_x = self.x + self.vx
-        elif 0 <= iy < h and grid[iy, ix] not in (EMPTY, FIRE, NAPALM, WATER):
-            self.vx = -self.vx * 0.6  # bounce off solid
-            new_x = self.x
-        self.x = new_x
-
-        # Move Y
-        new_y = self.y + self.vy
-        ix2 = int(self.x)
-        iy2 = int(new_y)
-        if iy2 >= h:
-            # Hit bottom — rest on floor
-            self.y = float(h - 1)
-            self.vy = 0.0
-            self.vx *= 0.5
-            self.rest_timer += 1
-        elif 0 <= iy2 < h and 0 <= ix2 < w and grid[iy2, ix2] not in (EMPTY, FIRE, NAPALM, WATER):
-            # Hit something solid — bounce
-            if self.vy > 0:
-                self.vy = -self.vy * 0.4
-                self.vx *= 0.8
-                self.rest_timer += 1
-            else:
-                self.vy = 0.0
-                self.rest_timer += 1
-            new_y = self.y
-        else:
-            self.rest_timer = 0
-        self.y = new_y
+        vy += 0.35
+        # Move X — side walls reflect the step, solids cancel it
+        new_x = x + vx
+        ix = new_x.astype(np.intp)   # truncates toward zero, like int()
+        iy = y.astype(np.intp)
+        side = (ix < 0) | (ix >= w)
+        vx[side] *= -0.6
+        new_x[side] = x[side] + vx[side]
+        k = np.flatnonzero(~side & (iy >= 0) & (iy < h))
+        k = k[~_GIB_PASS[grid[iy[k], ix[k]]]]
+        vx[k] *= -0.6
+        new_x[k] = x[k]
+        x[:] = new_x
+
+        # Move Y — dropping past the bottom row counts as resting
+        new_y = y + vy
+        ix = x.astype(np.intp)
+        iy = new_y.astype(np.intp)
+        resting = iy >= h
+        vy[resting] = 0.0
+        vx[resting] *= 0.5
+        k = np.flatnonzero(~resting & (iy >= 0) & (ix >= 0) & (ix < w))
+        k = k[~_GIB_PASS[grid[iy[k], ix[k]]]]
+        # Hit something solid — bounce if falling, else stop dead
+        falling = k[vy[k] > 0]
+        bounce = vy[falling] * -0.4
+        vy[k] = 0.0
+        vy[falling] = bounce
+        vx[falling] *= 0.8
+        new_y[k] = y[k]
+        y[:] = new_y
+        resting[k] = True
+        rest = self.rest[:n]
+        rest[:] = np.where(resting, rest + 1, 0)
 
         # Clamp
-        if self.x < 0:
-            self.x = 0.0
-        if self.x >= w:
-            self.x = float(w - 1)
-
-        # Die after resting long enough (30 frames ≈ 1s)
-        if self.rest_timer > 30:
-            # Check if effectively stopped
-            if abs(self.vx) < 0.1 and abs(self.vy) < 0.5:
-                self.alive = False
+        x[x < 0] = 0.0
+        x[x >= w] = float(w - 1)
+
+        # Die after resting long enough (30 frames ≈ 1s) once effectively stopped
+        self._keep((rest <= 30) | (np.abs(vx) >= 0.1) | (np.abs(vy) >= 0.5))
 
 
 # ────────────────────────────────────────────
@@ -586,39 +700,44 @@ _SPARK_COLORS = [
     (255, 150, 0), (255, 255, 200), (255, 200, 80),
 ]
 
-class _Spark:
-    """A tiny spark that flies outward from an explosion.
-    Dies instantly on touching anything or leaving bounds."""
-
-    def __init__(self, x, y):
-        self.x = float(x)
-        self.y = float(y)
-        angle = random.uniform(0, 2 * math.pi)
-        speed = random.uniform(2.0, 8.0)
-        self.vx = math.cos(angle) * speed
-        self.vy = math.sin(angle) * speed - random.uniform(1.0, 3.0)  # bias upward
-        self.color = random.choice(_SPARK_COLORS)
-        self.alive = True
-        self.life = 0
+class _SparkField(_ParticleField):
+    """Every live spark — sparks fly outward from an explosion and die
+    instantly on touching anything, leaving bounds or after 40 frames."""
+
+    _EXTRA = (('life', np.int32),)
+
+    def burst(self, x, y, n):
+        """Emit n sparks from (x, y) in random directions, all in one go."""
+        i = self._claim(n)
+        j = i + n
+        angle = np.random.uniform(0, 2 * math.pi, n)
+        speed = np.random.uniform(2.0, 8.0, n)
+        self.x[i:j] = x
+        self.y[i:j] = y
+        self.vx[i:j] = np.cos(angle) * speed
+        self.vy[i:j] = np.sin(angle) * speed - np.random.uniform(1.0, 3.0, n)  # bias upward
+        self.color[i:j] = _sample_palette(_SPARK_COLORS, n)
+        self.life[i:j] = 0
 
     def step(self, grid):
-        h, w = grid.shape
-        self.vy += 0.25  # lighter gravity than gibs
-        self.x += self.vx
-        self.y += self.vy
-        self.life += 1
-        ix, iy = int(self.x), int(self.y)
-        # Die if out of bounds
-        if ix < 0 or ix >= w or iy < 0 or iy >= h:
-            self.alive = False
+        n = self.n
+        if not n:
             return
+        h, w = grid.shape
+        x, y, vy = self.x[:n], self.y[:n], self.vy[:n]
+        vy += 0.25  # lighter gravity than gibs
+        x += self.vx[:n]
+        y += vy
+        self.life[:n] += 1
+        ix = x.astype(np.intp)   # truncates toward zero, like int()
+        iy = y.astype(np.intp)
+        # Die if out of bounds or after 40 frames max (~1s)
+        alive = (ix >= 0) & (ix < w) & (iy >= 0) & (iy < h) & (self.life[:n] <= 40)
         # Die if touching anything solid (TUNNEL is open space)
-        if grid[iy, ix] != EMPTY and grid[iy, ix] != TUNNEL:
-            self.alive = False
-            return
-        # Die after 40 frames max (~1s)
-        if self.life > 40:
-            self.alive = False
+        inb = np.flatnonzero(alive)
+        cell = grid[iy[inb], ix[inb]]
+        alive[inb] = (cell == EMPTY) | (cell == TUNNEL)
+        self._keep(alive)
 
 
 # ────────────────────────────────────────────
@@ -630,10 +749,14 @@ _BUCKSHOT_COLORS = [
     (255, 200, 60), (220, 200, 80),
 ]
 
-class _Buckshot:
+class _Buckshot(_Pooled):
     """A single pellet of buckshot. Travels fast in a direction, destroys
     terrain it hits, and dies on impact or after max range."""
 
+    _pool = []
+
+    __slots__ = ('x', 'y', 'vx', 'vy', 'color', 'alive', 'life', 'damage')
+
     def __init__(self, x, y, vx, vy, damage=1):
         self.x = float(x)
         self.y = float(y)
@@ -655,20 +778,17 @@ class _Buckshot:
         if ix < 0 or ix >= w or iy < 0 or iy >= h:
             self.alive = False
             return
-        cell = grid[iy, ix]
         # Pass through empty, fire, tunnel, water, poison, holywater
-        if cell in (EMPTY, FIRE, NAPALM, TUNNEL, WATER, POISON, HOLYWATER):
+        if grid.item(iy, ix) in _SHOT_PASSES:
             pass
         else:
             # Hit something solid — destroy a small area and die
-            for dx in range(-1, 2):
-                for dy in range(-1, 2):
-                    cx, cy = ix + dx, iy + dy
-                    if 0 <= cx < w and 0 <= cy < h:
-                        c = grid[cy, cx]
-                        # Don't destroy concrete/glass (tough materials)
-                        if c not in (EMPTY, CONCRETE, GLASS, TUNNEL):
-                            grid[cy, cx] = EMPTY
+            for dx, dy in _STAMP_OFFSETS:
+                cx, cy = ix + dx, iy + dy
+                if 0 <= cx < w and 0 <= cy < h:
+                    # Don't destroy concrete/glass (tough materials)
+                    if grid.item(cy, cx) not in _SHOT_SPARES:
+                        grid[cy, cx] = EMPTY
             self.alive = False
             return
         # Die after max range (~60 cells)
@@ -686,6 +806,8 @@ _MISSILE_RADIUS = 8  # explosion radius in grid cells
 class _Missile:
     """A missile projectile. Flies straight, explodes on hitting solid terrain."""
 
+    __slots__ = ('x', 'y', 'vx', 'vy', 'alive', 'exploded', 'life', 'trail')
+
     def __init__(self, x, y, vx, vy):
         self.x = float(x)
         self.y = float(y)
@@ -713,9 +835,7 @@ class _Missile:
         if ix < 0 or ix >= w or iy < 0 or iy >= h:
             self.alive = False
             return
-        cell = grid[iy, ix]
-        _passable_missile = (EMPTY, FIRE, NAPALM, TUNNEL, WATER, POISON, HOLYWATER, GRASS)
-        if cell not in _passable_missile:
+        if grid.item(iy, ix) not in _MISSILE_PASSES:
             # Hit something solid — explode
             self.exploded = True
             self.alive = False
@@ -730,11 +850,15 @@ class _Missile:
 # FlameParticle — short-lived fire particle for flamethrower weapon
 # ────────────────────────────────────────────
 
-class _FlameParticle:
+class _FlameParticle(_Pooled):
     """A single flame particle from the flamethrower. Travels fast, plants FIRE
     (not napalm).  Fire rises — no downward gravity.  After 30 grid cells of
     horizontal travel, a gentle upward drift kicks in so flames arc up."""
 
+    _pool = []
+
+    __slots__ = ('x', 'y', 'vx', 'vy', 'alive', 'life', 'color', '_start_x')
+
     def __init__(self, x, y, vx, vy):
         self.x = float(x)
         self.y = float(y)
@@ -759,15 +883,15 @@ class _FlameParticle:
         if ix < 0 or ix >= w or iy < 0 or iy >= h:
             self.alive = False
             return
-        cell = grid[iy, ix]
+        cell = grid.item(iy, ix)
         # If we hit something burnable — set it on fire
-        if cell in (WOOD, PLANT, DIRT, HEAVY, GRASS):
+        if cell in _FLAME_BURNS:
             grid[iy, ix] = FIRE
             colors[iy, ix] = random.choice(_FIRE_COLORS)
             self.alive = False
             return
         # If we hit solid non-burnable — place fire just before and die
-        if cell not in (EMPTY, FIRE, NAPALM, TUNNEL, WATER, POISON, HOLYWATER):
+        if cell not in _SHOT_PASSES:
             px, py = int(self.x - self.vx), int(self.y - self.vy)
             if 0 <= px < w and 0 <= py < h and grid[py, px] == EMPTY:
                 grid[py, px] = FIRE
@@ -796,6 +920,11 @@ class _HomingMissile:
     position (in grid coords).  The camera follows it until it hits something
     and explodes."""
 
+    __slots__ = (
+        'x', 'y', 'vx', 'vy', 'alive', 'exploded', 'life', 'trail',
+        'target_gx', 'target_gy',
+    )
+
     def __init__(self, x, y, vx, vy):
         self.x = float(x)
         self.y = float(y)
@@ -814,7 +943,7 @@ class _HomingMissile:
         # Steer toward target
         dx = self.target_gx - self.x
         dy = self.target_gy - self.y
-        if math.hypot(dx, dy) > 0.1:
+        if dx * dx + dy * dy > 0.01:
             desired_angle = math.atan2(dy, dx)
             current_angle = math.atan2(self.vy, self.vx)
             # Signed angle difference
@@ -850,9 +979,7 @@ class _HomingMissile:
             self.alive = False
             self.exploded = True
             return
-        cell = grid[iy, ix]
-        _passable = (EMPTY, FIRE, NAPALM, TUNNEL, WATER, POISON, HOLYWATER, GRASS)
-        if cell not in _passable:
+        if grid.item(iy, ix) not in _MISSILE_PASSES:
             self.exploded = True
             self.alive = False
             return
@@ -863,7 +990,7 @@ class _HomingMissile:
 
 
 # ────────────────────────────────────────────
-# SplashDrop — water droplet flung upward by an impact
+# Splash drops — fluid flung upward by an impact
 # ────────────────────────────────────────────
 
 _SPLASH_COLORS = [
@@ -871,54 +998,77 @@ _SPLASH_COLORS = [
     (150, 200, 255), (200, 230, 255),
 ]
 
-class _SplashDrop:
-    """A droplet of water ejected by a splash.  Arcs upward then falls
-    back down, re-inserting itself as a water particle when it lands."""
+class _SplashField(_ParticleField):
+    """Every live splash droplet — fluid flung upward by an impact.  Each
+    arcs up then falls back down, re-inserting its fluid where it lands."""
 
-    def __init__(self, x, y, fluid_type=WATER, fluid_color=None):
-        self.x = float(x)
-        self.y = float(y)
+    _EXTRA = (
+        ('life', np.int32),
+        ('fluid_type', np.uint8),
+        ('fluid_color', np.uint8, 3),   # colour of the cell it was lifted from
+    )
+
+    def emit(self, x, y, fluid_type=WATER, fluid_color=None):
+        i = self._claim()
         angle = random.uniform(math.pi * 0.15, math.pi * 0.85)  # upward arc
         speed = random.uniform(2.0, 5.0)
-        self.vx = math.cos(angle) * speed * random.choice([-1, 1])
-        self.vy = -math.sin(angle) * speed  # upward
-        self.color = random.choice(_SPLASH_COLORS)
-        self.fluid_type = fluid_type
-        self.fluid_color = fluid_color if fluid_color is not None else self.color
-        self.alive = True
-        self.life = 0
+        self.x[i] = x
+        self.y[i] = y
+        self.vx[i] = math.cos(angle) * speed * random.choice([-1, 1])
+        self.vy[i] = -math.sin(angle) * speed  # upward
+        self.color[i] = random.choice(_SPLASH_COLORS)
+        self.fluid_type[i] = fluid_type
+        self.fluid_color[i] = self.color[i] if fluid_color is None else fluid_color
+        self.life[i] = 0
 
     def step(self, grid, colors):
-        h, w = grid.shape
-        self.vy += 0.3  # gravity
-        self.x += self.vx
-        self.y += self.vy
-        self.life += 1
-        ix, iy = int(self.x), int(self.y)
-
-        # Out of bounds — die without placing
-        if ix < 0 or ix >= w or iy >= h:
-            self.alive = False
+        n = self.n
+        if not n:
             return
-        if iy < 0:
-            return  # still rising above screen, keep going
-
-        # Falling and hit something? Place water on top
-        if self.vy > 0 and grid[iy, ix] != EMPTY:
-            # Find the empty cell right above
-            place_y = iy - 1
-            if 0 <= place_y < h and grid[place_y, ix] == EMPTY:
-                grid[place_y, ix] = self.fluid_type
-                colors[place_y, ix] = self.fluid_color
-            self.alive = False
-            return
-
-        # Die after 60 frames (~1.7s) — place water at current spot
-        if self.life > 60:
-            if 0 <= iy < h and 0 <= ix < w and grid[iy, ix] == EMPTY:
-                grid[iy, ix] = self.fluid_type
-                colors[iy, ix] = self.fluid_color
-            self.alive = False
+        h, w = grid.shape
+        x, y = self.x[:n], self.y[:n]
+        vy, life = self.vy[:n], self.life[:n]
+        vy += 0.3  # gravity
+        x += self.vx[:n]
+        y += vy
+        life += 1
+        ix = x.astype(np.intp)   # truncates toward zero, like int()
+        iy = y.astype(np.intp)
+
+        # Out of bounds — die without placing; above the top keeps rising
+        alive = (ix >= 0) & (ix < w) & (iy < h)
+        onscreen = alive & (iy >= 0)
+        falling = onscreen & (vy > 0)
+
+        # Only drops that hit something or time out touch the grid.  Those
+        # are settled one at a time in index order, since a placement can
+        # fill the cell a later drop is falling into this same frame.
+        due = onscreen & (life > 60)
+        k = np.flatnonzero(falling)
+        due[k] |= grid[iy[k], ix[k]] != EMPTY
+        queue = np.flatnonzero(due).tolist()
+        while queue:
+            i = heapq.heappop(queue)
+            cx, cy = int(ix[i]), int(iy[i])
+            alive[i] = False
+            if vy[i] > 0 and grid.item(cy, cx) != EMPTY:
+                # Falling and hit something — place fluid in the cell above
+                cy -= 1
+                if cy < 0 or grid.item(cy, cx) != EMPTY:
+                    continue
+            elif life[i] <= 60:
+                alive[i] = True
+                continue
+            elif grid.item(cy, cx) != EMPTY:
+                continue   # timed out over something — just vanish
+            grid[cy, cx] = self.fluid_type[i]
+            colors[cy, cx] = self.fluid_color[i]
+            for j in np.flatnonzero(falling[i + 1:] & (ix[i + 1:] == cx) & (iy[i + 1:] == cy)):
+                j += i + 1
+                if not due[j]:
+                    due[j] = True
+                    heapq.heappush(queue, j)
+        self._keep(alive)
 
 
 # ────────────────────────────────────────────
@@ -927,11 +1077,17 @@ class _SplashDrop:
 
 _WORM_COLORS = [(200, 120, 150), (180, 100, 130), (220, 140, 160), (190, 110, 140)]
 _TUNNEL_COLOR = (30, 20, 15)   # dark background for tunnels
+_TUNNEL_RGB = np.array(_TUNNEL_COLOR, dtype=np.uint8)   # array form for per-cell writes
 
 class _Worm:
     """A worm that moves through dirt, eating it and leaving TUNNEL cells behind.
     Moves 3 cells per sim tick in a wandering direction, carving 3×3 tunnels."""
 
+    __slots__ = (
+        'gx', 'gy', 'dx', 'dy', 'color', 'alive', 'life', 'max_life', '_trail',
+        '_trail_max',
+    )
+
     def __init__(self, gx, gy):
         self.gx = gx
         self.gy = gy
@@ -943,19 +1099,22 @@ class _Worm:
         self.alive = True
         self.life = 0
         self.max_life = random.randint(80, 200)  # how far it burrows
-        # Body trail for drawing (list of recent (gx,gy) positions)
-        self._trail = []
+        # Body trail for drawing (recent (gx,gy) positions, oldest drop off)
         self._trail_max = 7
+        self._trail = deque(maxlen=self._trail_max)
+
+    # 3×3 windows are too small for slice + mask to beat a scalar loop
+    # (NumPy call overhead dominates), so these stay per-cell with item()
 
     def _carve(self, grid, colors, cx, cy):
         """Carve a 3×3 area of dirt into tunnel around (cx, cy)."""
         h, w = grid.shape
-        for ddx in range(-1, 2):
-            for ddy in range(-1, 2):
-                tx, ty = cx + ddx, cy + ddy
-                if 0 <= tx < w and 0 <= ty < h and grid[ty, tx] == DIRT:
-                    grid[ty, tx] = TUNNEL
-                    colors[ty, tx] = _TUNNEL_COLOR
+        item = grid.item
+        for ddx, ddy in _STAMP_OFFSETS:
+            tx, ty = cx + ddx, cy + ddy
+            if 0 <= tx < w and 0 <= ty < h and item(ty, tx) == DIRT:
+                grid[ty, tx] = TUNNEL
+                colors[ty, tx] = _TUNNEL_RGB
 
     def _can_move(self, grid, nx, ny):
         """Check if center (nx, ny) has at least some dirt in 3×3 area."""
@@ -963,11 +1122,11 @@ class _Worm:
         if nx < 0 or nx >= w or ny < 0 or ny >= h:
             return False
         # Need at least 1 dirt cell in the 3×3 to keep digging
-        for ddx in range(-1, 2):
-            for ddy in range(-1, 2):
-                tx, ty = nx + ddx, ny + ddy
-                if 0 <= tx < w and 0 <= ty < h and grid[ty, tx] == DIRT:
-                    return True
+        item = grid.item
+        for ddx, ddy in _STAMP_OFFSETS:
+            tx, ty = nx + ddx, ny + ddy
+            if 0 <= tx < w and 0 <= ty < h and item(ty, tx) == DIRT:
+                return True
         return False
 
     def step(self, grid, colors):
@@ -994,26 +1153,18 @@ class _Worm:
 
             if self._can_move(grid, nx, ny):
                 self._trail.append((self.gx, self.gy))
-                if len(self._trail) > self._trail_max:
-                    self._trail.pop(0)
                 self._carve(grid, colors, self.gx, self.gy)
                 self.gx = nx
                 self.gy = ny
             else:
                 # Try random adjacent cells
-                neighbors = []
-                for ddx in range(-1, 2):
-                    for ddy in range(-1, 2):
-                        if ddx == 0 and ddy == 0:
-                            continue
-                        cx, cy = self.gx + ddx, self.gy + ddy
-                        if self._can_move(grid, cx, cy):
-                            neighbors.append((cx, cy, ddx, ddy))
+                gx, gy = self.gx, self.gy
+                can_move = self._can_move
+                neighbors = [(gx + ddx, gy + ddy, ddx, ddy) for ddx, ddy in _NBR8
+                             if can_move(grid, gx + ddx, gy + ddy)]
                 if neighbors:
                     cx, cy, ddx, ddy = random.choice(neighbors)
                     self._trail.append((self.gx, self.gy))
-                    if len(self._trail) > self._trail_max:
-                        self._trail.pop(0)
                     self._carve(grid, colors, self.gx, self.gy)
                     self.gx = cx
                     self.gy = cy
@@ -1050,6 +1201,12 @@ class _Worm:
 class _Bee:
     """A bee that orbits its hive and flies to nearby plants to pollinate them."""
 
+    __slots__ = (
+        'hive_gx', 'hive_gy', 'x', 'y', 'alive', 'vx', 'vy', 'target',
+        '_search_cooldown', '_flower_cooldown', '_swarm_gnome', 'body_color',
+        'stripe_color',
+    )
+
     def __init__(self, hive_gx, hive_gy):
         self.hive_gx = hive_gx
         self.hive_gy = hive_gy
@@ -1069,21 +1226,16 @@ class _Bee:
         self.body_color = (240, 210, 40)
         self.stripe_color = (40, 30, 5)
 
-    def step(self, grid, colors, gnomes=None):
+    def step(self, grid, colors, gnome_buckets=None, search=True):
         h, w = grid.shape
+        x, y = self.x, self.y   # position is only stored back at the end
+        rand = random.random    # flutter below is inlined uniform(-a, a)
 
         # Check if hive still exists nearby (within 5 cells of original pos)
+        # (one byte search over the 5×5 window beats 25 per-cell reads)
         hx, hy = int(round(self.hive_gx)), int(round(self.hive_gy))
-        hive_alive = False
-        for dx in range(-2, 3):
-            for dy in range(-2, 3):
-                cx, cy = hx + dx, hy + dy
-                if 0 <= cx < w and 0 <= cy < h and grid[cy, cx] == BEEHIVE:
-                    hive_alive = True
-                    break
-            if hive_alive:
-                break
-        if not hive_alive:
+        window = grid[max(hy - 2, 0):max(hy + 3, 0), max(hx - 2, 0):max(hx + 3, 0)]
+        if BEEHIVE not in window.tobytes():
             self.alive = False
             return
 
@@ -1096,73 +1248,82 @@ class _Bee:
                 # Orbit the gnome tightly
                 gx_t = self._swarm_gnome.gx
                 gy_t = self._swarm_gnome.gy
-                dx = gx_t - self.x
-                dy = gy_t - self.y
-                dist = math.hypot(dx, dy)
-                if dist > 3:
-                    self.vx += (dx / dist) * 0.6
-                    self.vy += (dy / dist) * 0.6
+                dx = gx_t - x
+                dy = gy_t - y
+                d2 = dx * dx + dy * dy
+                vx, vy = self.vx, self.vy
+                if d2 > 9.0:
+                    dist = math.sqrt(d2)
+                    vx += (dx / dist) * 0.6
+                    vy += (dy / dist) * 0.6
                 # Buzzy flutter
-                self.vx += random.uniform(-0.8, 0.8)
-                self.vy += random.uniform(-0.8, 0.8)
+                vx += -0.8 + 1.6 * rand()
+                vy += -0.8 + 1.6 * rand()
                 # Apply velocity and clamp (skip the rest of normal logic)
-                speed = math.hypot(self.vx, self.vy)
-                if speed > 2.5:
-                    self.vx = (self.vx / speed) * 2.5
-                    self.vy = (self.vy / speed) * 2.5
-                self.x += self.vx
-                self.y += self.vy
-                self.x = max(0, min(w - 1, self.x))
-                self.y = max(0, min(h - 1, self.y))
+                sp2 = vx * vx + vy * vy
+                if sp2 > 6.25:
+                    speed = math.sqrt(sp2)
+                    vx = (vx / speed) * 2.5
+                    vy = (vy / speed) * 2.5
+                self.vx, self.vy = vx, vy
+                self.x = max(0, min(w - 1, x + vx))
+                self.y = max(0, min(h - 1, y + vy))
                 return
 
-        # Check for nearby gnomes to sting (within 3 cells)
-        if gnomes:
-            bx, by = int(round(self.x)), int(round(self.y))
-            for gnome in gnomes:
-                if not gnome.alive or gnome.on_fire:
-                    continue
-                d = math.hypot(gnome.gx - bx, gnome.gy - by)
-                if d < 3:
-                    # Sting!
-                    if not gnome.bee_stung:
-                        gnome.bee_stung = True
-                        gnome.bee_sting_time = time.time()
-                    self._swarm_gnome = gnome
-                    return
+        # Check for nearby gnomes to sting (within 3 cells) — only the
+        # buckets around the bee can hold one
+        if gnome_buckets:
+            bx, by = int(round(x)), int(round(y))
+            kx, ky = bx // _BEE_BUCKET, by // _BEE_BUCKET
+            first = None
+            for bkx in (kx - 1, kx, kx + 1):
+                for bky in (ky - 1, ky, ky + 1):
+                    for i, gnome in gnome_buckets.get((bkx, bky), ()):
+                        gdx, gdy = gnome.gx - bx, gnome.gy - by
+                        if (first is None or i < first[0]) and gdx * gdx + gdy * gdy < 9.0:
+                            first = (i, gnome)
+            if first is not None:
+                # Sting!
+                gnome = first[1]
+                if not gnome.bee_stung:
+                    gnome.bee_stung = True
+                    gnome.bee_sting_time = time.time()
+                self._swarm_gnome = gnome
+                return
 
-        # Search for nearby plant — always searching when idle
+        # Search for nearby plant — always searching when idle (in a big
+        # swarm, only on this bee's turn; see _BEE_SEARCH_CAP)
         self._search_cooldown -= 1
-        if self._search_cooldown <= 0 and self.target is None:
+        if self._search_cooldown <= 0 and self.target is None and search:
             self._search_cooldown = random.randint(10, 20)
-            # Scan within 40 cells for PLANT
-            best_dist = 999
-            best_pos = None
+            # Scan within 40 cells for PLANT — 60 random probes (for
+            # performance), drawn and tested as one batch; nearest hit wins
             scan_r = 40
-            for _ in range(60):  # random sampling for performance
-                sx = int(self.x) + random.randint(-scan_r, scan_r)
-                sy = int(self.y) + random.randint(-scan_r, scan_r)
-                if 0 <= sx < w and 0 <= sy < h and grid[sy, sx] == PLANT:
-                    d = abs(sx - self.x) + abs(sy - self.y)
-                    if d < best_dist:
-                        best_dist = d
-                        best_pos = (sx, sy)
-            if best_pos:
-                self.target = best_pos
+            ix, iy = int(x), int(y)
+            sx = np.random.randint(ix - scan_r, ix + scan_r + 1, 60)
+            sy = np.random.randint(iy - scan_r, iy + scan_r + 1, 60)
+            inb = (sx >= 0) & (sx < w) & (sy >= 0) & (sy < h)
+            sx, sy = sx[inb], sy[inb]
+            hit = grid[sy, sx] == PLANT
+            if hit.any():
+                sx, sy = sx[hit], sy[hit]
+                k = np.argmin(np.abs(sx - x) + np.abs(sy - y))
+                self.target = (int(sx[k]), int(sy[k]))
 
         # Tick flower cooldown
         if self._flower_cooldown > 0:
             self._flower_cooldown -= 1
 
-        # Movement
+        # Movement — velocity lives in locals until the single store below
+        vx, vy = self.vx, self.vy
         if self.target:
             tx, ty = self.target
             # Check target still valid
             if 0 <= tx < w and 0 <= ty < h and grid[ty, tx] == PLANT:
-                dx = tx - self.x
-                dy = ty - self.y
-                dist = math.hypot(dx, dy)
-                if dist < 1.5:
+                dx = tx - x
+                dy = ty - y
+                d2 = dx * dx + dy * dy
+                if d2 < 2.25:
                     # Arrived at plant — place flower if cooldown ready
                     if self._flower_cooldown <= 0:
                         # Place flower on this plant cell (change its color)
@@ -1183,39 +1344,41 @@ class _Bee:
                     self._search_cooldown = random.randint(5, 15)
                 else:
                     # Fly toward target
-                    self.vx += (dx / dist) * 0.4 + random.uniform(-0.2, 0.2)
-                    self.vy += (dy / dist) * 0.4 + random.uniform(-0.2, 0.2)
+                    dist = math.sqrt(d2)
+                    vx += (dx / dist) * 0.4 + (-0.2 + 0.4 * rand())
+                    vy += (dy / dist) * 0.4 + (-0.2 + 0.4 * rand())
             else:
                 self.target = None  # plant was destroyed
         else:
             # Orbit the hive — gentle circular wandering
-            dx = self.hive_gx - self.x
-            dy = self.hive_gy - self.y
-            dist = math.hypot(dx, dy)
-            if dist > 8:
+            dx = self.hive_gx - x
+            dy = self.hive_gy - y
+            d2 = dx * dx + dy * dy
+            if d2 > 64.0:
                 # Pull back toward hive
-                self.vx += (dx / dist) * 0.3
-                self.vy += (dy / dist) * 0.3
+                dist = math.sqrt(d2)
+                vx += (dx / dist) * 0.3
+                vy += (dy / dist) * 0.3
             # Random flutter
-            self.vx += random.uniform(-0.5, 0.5)
-            self.vy += random.uniform(-0.5, 0.5)
+            vx += -0.5 + rand()
+            vy += -0.5 + rand()
 
         # Damping
-        speed = math.hypot(self.vx, self.vy)
+        # (squared distances here — sqrt only when a vector is normalised)
+        sp2 = vx * vx + vy * vy
         max_spd = 2.0
-        if speed > max_spd:
-            self.vx = (self.vx / speed) * max_spd
-            self.vy = (self.vy / speed) * max_spd
-
-        self.x += self.vx
-        self.y += self.vy
+        if sp2 > max_spd * max_spd:
+            speed = math.sqrt(sp2)
+            vx = (vx / speed) * max_spd
+            vy = (vy / speed) * max_spd
 
-        # Clamp to grid
-        self.x = max(0, min(w - 1, self.x))
-        self.y = max(0, min(h - 1, self.y))
+        # Move, clamped to grid
+        x = max(0, min(w - 1, x + vx))
+        y = max(0, min(h - 1, y + vy))
+        self.x, self.y, self.vx, self.vy = x, y, vx, vy
 
         # Fire / magma kills bees
-        gx, gy = int(round(self.x)), int(round(self.y))
+        gx, gy = int(round(x)), int(round(y))
         if 0 <= gx < w and 0 <= gy < h:
             cell = grid[gy, gx]
             if cell in (FIRE, NAPALM, MAGMA):
@@ -1244,40 +1407,58 @@ class _Bee:
 _BOMB_RADIUS = 28   # explosion radius in grid cells
 _BOMB_FUSE = 2.0    # seconds before detonation
 
-class _Bomb:
-    """A pixelated bomb that falls with gravity and explodes after 2 seconds.
+class _Bomb(_Pooled):
+    """A pixelated bomb that falls with gravity and explodes after _BOMB_FUSE
+    seconds. The fuse burns down by the sim step length on each step().
     is_fire: if True, this is a firebomb that sprays napalm."""
 
+    _pool = []
+
+    __slots__ = (
+        'x', 'y', 'vx', 'vy', 'fuse', 'alive', 'exploded', 'is_fire',
+        'landed', '_slope_wait',
+    )
+
     def __init__(self, gx, gy, is_fire=False):
         self.x = float(gx)
         self.y = float(gy)
         self.vx = 0.0
         self.vy = 0.0
-        self.spawn_time = time.time()
+        self.fuse = _BOMB_FUSE  # seconds of fuse left
         self.alive = True
         self.exploded = False
         self.is_fire = is_fire  # firebomb variant
         self.landed = False  # True once bomb touches ground — stays put
+        self._slope_wait = 0  # ticks until a landed bomb re-checks for a slope
 
-    def step(self, grid):
+    def step(self, grid, dt):
+        """Advance one sim step; dt is the step length in seconds."""
         h, w = grid.shape
+        item = grid.item   # plain-int cell reads
+        self.fuse -= dt
 
         # Check if on ground right now
         ix_c = int(self.x)
         iy_c = int(self.y)
         below = iy_c + 1
         on_ground = (below >= h or
-                     (0 <= ix_c < w and 0 <= below < h and grid[below, ix_c] != EMPTY))
+                     (0 <= ix_c < w and 0 <= below < h and item(below, ix_c) != EMPTY))
 
         if self.landed:
-            # Check if we should start rolling (slope beneath us)
-            if on_ground and 0 <= ix_c < w and below < h:
+            # Check if we should start rolling (slope beneath us).  Terrain
+            # under a resting bomb rarely changes, so the slope is only
+            # re-read every 6-12 ticks (jittered so bombs don't sync up);
+            # losing the ground is still noticed on the next tick.
+            if self._slope_wait > 0 and on_ground:
+                self._slope_wait -= 1
+            elif on_ground and 0 <= ix_c < w and below < h:
+                self._slope_wait = random.randint(6, 12)
                 left_empty = (ix_c - 1 >= 0
-                              and grid[below, ix_c - 1] == EMPTY
-                              and (iy_c < 0 or iy_c >= h or grid[iy_c, ix_c - 1] == EMPTY))
+                              and item(below, ix_c - 1) == EMPTY
+                              and (iy_c < 0 or iy_c >= h or item(iy_c, ix_c - 1) == EMPTY))
                 right_empty = (ix_c + 1 < w
-                               and grid[below, ix_c + 1] == EMPTY
-                               and (iy_c < 0 or iy_c >= h or grid[iy_c, ix_c + 1] == EMPTY))
+                               and item(below, ix_c + 1) == EMPTY
+                               and (iy_c < 0 or iy_c >= h or item(iy_c, ix_c + 1) == EMPTY))
                 if left_empty or right_empty:
                     # Slope detected — un-land and start rolling
                     self.landed = False
@@ -1295,101 +1476,91 @@ class _Bomb:
 
             if self.landed:
                 # Still landed — just check fuse
-                if time.time() - self.spawn_time >= _BOMB_FUSE:
+                if self.fuse <= 0.0:
                     self.exploded = True
                     self.alive = False
                 return
 
-        # Airborne / rolling: apply gravity
-        self.vy += 0.55
+        # Airborne / rolling — work in locals, store back once at the end
+        x, y, vx, vy = self.x, self.y, self.vx, self.vy
 
-        if on_ground:
-            self.vx *= 0.80  # ground friction
-        else:
-            self.vx *= 0.99  # air resistance
+        # Gravity, then ground friction or air resistance
+        vy += 0.55
+        vx *= 0.80 if on_ground else 0.99
 
         # Clamp velocity — high enough for fast falls, scan row-by-row
-        max_vy = 4.0
-        max_vx = 2.5
-        if self.vy > max_vy:
-            self.vy = max_vy
-        if self.vy < -max_vy:
-            self.vy = -max_vy
-        if self.vx > max_vx:
-            self.vx = max_vx
-        if self.vx < -max_vx:
-            self.vx = -max_vx
+        vy = max(-4.0, min(4.0, vy))
+        vx = max(-2.5, min(2.5, vx))
 
         # Move X
-        new_x = self.x + self.vx
+        new_x = x + vx
         ix_new = int(new_x)
-        iy_cur = int(self.y)
+        iy_cur = iy_c   # y hasn't moved yet this tick
         if ix_new < 0 or ix_new >= w:
-            self.vx = -self.vx * 0.4
-            new_x = max(0.0, min(float(w - 1), self.x))
-        elif 0 <= iy_cur < h and grid[iy_cur, ix_new] != EMPTY:
-            if iy_cur - 1 >= 0 and grid[iy_cur - 1, ix_new] == EMPTY:
-                self.y -= 1.0
+            vx = -vx * 0.4
+            new_x = max(0.0, min(float(w - 1), x))
+        elif 0 <= iy_cur < h and item(iy_cur, ix_new) != EMPTY:
+            if iy_cur - 1 >= 0 and item(iy_cur - 1, ix_new) == EMPTY:
+                y -= 1.0
             else:
-                self.vx = -self.vx * 0.3
-                new_x = self.x
-        self.x = new_x
+                vx = -vx * 0.3
+                new_x = x
+        x = new_x
 
         # Move Y — scan each row to land properly
-        new_y = self.y + self.vy
-        ix2 = int(self.x)
-        iy_from = int(self.y)
+        new_y = y + vy
+        ix2 = int(x)
+        iy_from = int(y)
+        landed = False
         if 0 <= ix2 < w:
-            if self.vy > 0:
+            if vy > 0:
                 iy_to = int(new_y)
                 for check_y in range(max(0, iy_from + 1), min(h, iy_to + 1)):
-                    if grid[check_y, ix2] != EMPTY:
+                    if item(check_y, ix2) != EMPTY:
                         new_y = float(check_y - 1)
-                        self.vy = 0.0
-                        self.vx = 0.0
-                        self.landed = True
+                        landed = True
                         break
                 else:
                     if iy_to >= h:
                         new_y = float(h - 1)
-                        self.vy = 0.0
-                        self.vx = 0.0
-                        self.landed = True
-            elif self.vy < 0:
+                        landed = True
+            elif vy < 0:
                 check_row = int(new_y)
                 if check_row < 0:
                     new_y = 0.0
-                    self.vy = 0.0
-                elif 0 <= check_row < h and grid[check_row, ix2] != EMPTY:
-                    self.vy = 0.0
-                    new_y = self.y
-        else:
-            if new_y >= h:
-                new_y = float(h - 1)
-                self.vy = 0.0
-                self.vx = 0.0
-                self.landed = True
+                    vy = 0.0
+                elif 0 <= check_row < h and item(check_row, ix2) != EMPTY:
+                    vy = 0.0
+                    new_y = y
+        elif new_y >= h:
+            new_y = float(h - 1)
+            landed = True
 
         # Safety: if inside a solid, push up
         fy = int(new_y)
-        if 0 <= ix2 < w and 0 <= fy < h and grid[fy, ix2] != EMPTY:
-            while fy > 0 and grid[fy, ix2] != EMPTY:
+        if 0 <= ix2 < w and 0 <= fy < h and item(fy, ix2) != EMPTY:
+            while fy > 0 and item(fy, ix2) != EMPTY:
                 fy -= 1
             new_y = float(fy)
-            self.vy = 0.0
-            self.vx = 0.0
-            self.landed = True
+            landed = True
 
-        self.y = new_y
+        if landed:
+            vx = vy = 0.0
+            self.landed = True
+            self._slope_wait = 0   # check the new resting spot right away
 
         # Clamp
-        if self.x < 0:
-            self.x = 0.0
-        if self.x >= w:
-            self.x = float(w - 1)
+        if x < 0:
+            x = 0.0
+        elif x >= w:
+            x = float(w - 1)
+        self.x = x
+        self.y = new_y
+        self.vx = vx
+        self.vy = vy
 
         # Check fuse
-        if time.time() - self.spawn_time >= _BOMB_FUSE:
+        if self.fuse <= 0.0:
             self.exploded = True
             self.alive = False
 
@@ -1397,7 +1568,7 @@ class _Bomb:
         """Draw a pixelated bomb sprite."""
         cx = int(self.x * _CELL * cam_z + _CELL // 2 * cam_z + cam_ox)
         cy = int(self.y * _CELL * cam_z + _CELL // 2 * cam_z + cam_oy)
-        remaining = _BOMB_FUSE - (time.time() - self.spawn_time)
+        remaining = self.fuse
         # Body
         if self.is_fire:
             body_c = (120, 30, 0)
@@ -1425,6 +1596,28 @@ class _Bomb:
             surface.blit(txt, (cx - int(12 * cam_z), cy + int(12 * cam_z)))
 
 
+_BLAST_MASKS = {}   # radius → (crater, napalm fill, scorch ring) masks
+
+# Materials the blast's ring of fire can set alight
+_BLAST_SCORCHES = np.zeros(256, dtype=bool)
+_BLAST_SCORCHES[[WOOD, PLANT, DIRT, HEAVY, STATIC, GRASS]] = True
+
+
+def _blast_masks(radius):
+    """Boolean masks over the (2r+5)² window of a blast: the crater
+    (dist <= r), the firebomb napalm fill (dist <= 0.8r) and the scorched
+    ring (r-2 < dist < r+2).  Built once per radius."""
+    masks = _BLAST_MASKS.get(radius)
+    if masks is None:
+        reach = radius + 2
+        dy, dx = np.ogrid[-reach:reach + 1, -reach:reach + 1]
+        dist = np.hypot(dx, dy)
+        masks = _BLAST_MASKS[radius] = (
+            dist <= radius, dist <= radius * 0.8,
+            (dist > radius - 2) & (dist < radius + 2))
+    return masks
+
+
 def _explode_bomb(state, bx, by, gnomes, gibs, sparks, is_fire=False, radius=None):
     """Explosion: destroys everything in a circle, leaves stable cavity.
     is_fire: if True, fills the blast area with napalm instead of just clearing.
@@ -1436,74 +1629,64 @@ def _explode_bomb(state, bx, by, gnomes, gibs, sparks, is_fire=False, radius=Non
     if radius is None:
         radius = _BOMB_RADIUS
 
-    # Destroy everything inside the blast radius — leave EMPTY
-    for dy in range(-radius, radius + 1):
-        for dx in range(-radius, radius + 1):
-            dist = math.hypot(dx, dy)
-            if dist > radius:
-                continue
-            nx, ny = cx + dx, cy + dy
-            if 0 <= nx < w and 0 <= ny < h:
-                cell = g[ny, nx]
-                if cell == EMPTY or cell == TUNNEL:
-                    g[ny, nx] = EMPTY
-                    c[ny, nx] = (0, 0, 0)
-                    continue
-                # Leave fire and napalm alone — bombs don't extinguish flames
-                if cell == FIRE or cell == NAPALM:
-                    continue
-                # Chain-react gunpowder — just light it, fuse will burn slowly
-                if cell == GUNPOWDER:
-                    g[ny, nx] = FIRE
-                    c[ny, nx] = random.choice(_FIRE_COLORS)
-                    continue
-                # Clear the cell
-                g[ny, nx] = EMPTY
-                c[ny, nx] = (0, 0, 0)
-
-    # Ring of fire at the blast edge — looks like the shockwave scorched it
-    for dy in range(-radius - 2, radius + 3):
-        for dx in range(-radius - 2, radius + 3):
-            dist = math.hypot(dx, dy)
-            if radius - 2 < dist < radius + 2:
-                nx, ny = cx + dx, cy + dy
-                if 0 <= nx < w and 0 <= ny < h:
-                    cell = g[ny, nx]
-                    if cell in (WOOD, PLANT, DIRT, HEAVY, STATIC, GRASS):
-                        if random.random() < 0.5:
-                            g[ny, nx] = FIRE
-                            c[ny, nx] = random.choice(_FIRE_COLORS)
-
-    # Fill blast area: firebomb sprays napalm, regular bomb just clears
-    if is_fire:
-        # Napalm fills most of the blast
-        for dy in range(-radius, radius + 1):
-            for dx in range(-radius, radius + 1):
-                if math.hypot(dx, dy) > radius * 0.8:
-                    continue
-                nx, ny = cx + dx, cy + dy
-                if 0 <= nx < w and 0 <= ny < h and g[ny, nx] == EMPTY:
-                    g[ny, nx] = NAPALM
-                    c[ny, nx] = random.choice(_NAPALM_COLORS)
+    # Blast window clipped to the grid, and the matching slice of the masks
+    reach = radius + 2
+    y0, y1 = max(cy - reach, 0), min(cy + reach + 1, h)
+    x0, x1 = max(cx - reach, 0), min(cx + reach + 1, w)
+    if y0 < y1 and x0 < x1:
+        crater, fill, ring = _blast_masks(radius)
+        ms = np.s_[y0 - cy + reach:y1 - cy + reach, x0 - cx + reach:x1 - cx + reach]
+        gs = g[y0:y1, x0:x1]
+        cs = c[y0:y1, x0:x1]
+
+        # Destroy everything inside the blast radius — leave EMPTY.
+        # Fire and napalm are left alone (bombs don't extinguish flames);
+        # gunpowder is just lit, its fuse will burn slowly.
+        inside = crater[ms]
+        lit = inside & (gs == GUNPOWDER)
+        clear = inside & (gs != FIRE) & (gs != NAPALM) & ~lit
+        gs[clear] = EMPTY
+        cs[clear] = 0
+        n_lit = np.count_nonzero(lit)
+        if n_lit:
+            gs[lit] = FIRE
+            cs[lit] = _sample_palette(_FIRE_COLORS, n_lit)
+
+        # Ring of fire at the blast edge — looks like the shockwave scorched
+        # it; each flammable cell on the ring catches with 50% chance
+        scorch = ring[ms] & _BLAST_SCORCHES[gs]
+        scorch[scorch] = np.random.random(np.count_nonzero(scorch)) < 0.5
+        n_scorch = np.count_nonzero(scorch)
+        if n_scorch:
+            gs[scorch] = FIRE
+            cs[scorch] = _sample_palette(_FIRE_COLORS, n_scorch)
+
+        # Fill blast area: firebomb sprays napalm, regular bomb just clears
+        if is_fire:
+            # Napalm fills most of the blast
+            napalm = fill[ms] & (gs == EMPTY)
+            n_napalm = np.count_nonzero(napalm)
+            if n_napalm:
+                gs[napalm] = NAPALM
+                cs[napalm] = _sample_palette(_NAPALM_COLORS, n_napalm)
 
     # Big shower of sparks — radial burst
-    for _ in range(random.randint(120, 180)):
-        sparks.append(_Spark(cx, cy))
+    sparks.burst(cx, cy, random.randint(120, 180))
 
     # Kill gnomes in blast radius — gibs fly out
     for gnome in gnomes:
         if not gnome.alive:
             continue
-        dist = math.hypot(gnome.gx - cx, gnome.gy - cy)
-        if dist < radius * 1.2:
+        dx, dy = gnome.gx - cx, gnome.gy - cy
+        if dx * dx + dy * dy < (radius * 1.2) ** 2:
             gnome.alive = False
-            for _ in range(random.randint(8, 15)):
-                gb = _Gib(int(gnome.gx), int(gnome.gy), gnome.color)
-                angle = math.atan2(gnome.gy - cy, gnome.gx - cx)
-                speed = random.uniform(3.0, 7.0)
-                gb.vx = math.cos(angle) * speed + random.uniform(-1.5, 1.5)
-                gb.vy = math.sin(angle) * speed + random.uniform(-4.0, -1.0)
-                gibs.append(gb)
+            # One batch per gnome, flung away from the blast centre
+            n = random.randint(8, 15)
+            angle = math.atan2(dy, dx)
+            speed = np.random.uniform(3.0, 7.0, n)
+            gibs.burst(int(gnome.gx), int(gnome.gy), n, gnome.color,
+                       math.cos(angle) * speed + np.random.uniform(-1.5, 1.5, n),
+                       math.sin(angle) * speed + np.random.uniform(-4.0, -1.0, n))
 
 
 # ────────────────────────────────────────────
@@ -1534,6 +1717,19 @@ _HOOK_MAX_PULL_VEL = 1.2   # max speed while being pulled — slower than hook s
 _HOOK_ROPE_LEN_MIN = 1.5   # stop pulling when this close (arrive)
 _PLAYER_CAMERA_ZOOM = 1.5   # how much the view zooms in when player is active
 
+# Cells the player's body can overlap
+_PLAYER_PASSABLE = frozenset((EMPTY, FIRE, NAPALM, WATER, POISON, HOLYWATER, TUNNEL, GRASS))
+
+
+def _player_body_clear(grid, gx, gy):
+    """True if the player body (feet at row gy, centred on column gx) fits
+    without overlapping a solid cell.  Off-grid cells count as open, so
+    the window is just clipped and its bytes checked in one pass."""
+    fix, fiy = int(gx), int(gy)
+    body = grid[max(fiy - _PLAYER_HEIGHT + 1, 0):max(fiy + 1, 0),
+                max(fix - _PLAYER_WIDTH + 1, 0):max(fix + _PLAYER_WIDTH, 0)]
+    return _PLAYER_PASSABLE.issuperset(body.tobytes())
+
 
 class _Player:
     """A player-controlled character that responds to WASD + spacebar."""
@@ -1648,33 +1844,14 @@ class _Player:
             grav *= 2.5  # fast-fall when holding S
         self.vy = min(self.vy + grav, _PLAYER_TERMINAL_VEL)
 
-        _passable = (EMPTY, FIRE, NAPALM, WATER, POISON, HOLYWATER, TUNNEL, GRASS)
-
-        def _solid(cy, cx):
-            return (0 <= cx < w and 0 <= cy < h and
-                    grid[cy, cx] not in _passable)
-
-        def _body_clear(gx, gy):
-            """Return True if the player body fits at (gx, gy) without
-            overlapping any solid cell."""
-            fix = int(gx)
-            fiy = int(gy)
-            for dy in range(-_PLAYER_HEIGHT + 1, 1):
-                cy = fiy + dy
-                for dx in range(-_PLAYER_WIDTH + 1, _PLAYER_WIDTH):
-                    cx = fix + dx
-                    if _solid(cy, cx):
-                        return False
-            return True
-
         # ── Move X ──
         new_gx = self.gx + self.vx
         if self.vx != 0.0:
-            if _body_clear(new_gx, self.gy):
+            if _player_body_clear(grid, new_gx, self.gy):
                 self.gx = new_gx
             else:
                 # Try stepping up 1 cell (walk over small bumps)
-                if _body_clear(new_gx, self.gy - 1.0):
+                if _player_body_clear(grid, new_gx, self.gy - 1.0):
                     self.gx = new_gx
                     self.gy -= 1.0
                 else:
@@ -1693,25 +1870,22 @@ class _Player:
             fix = int(self.gx)
             scan_from = max(0, start_iy)
             scan_to = min(h - 2, end_iy)  # -2 because we check foot_below = y+1
-            for test_y in range(scan_from, scan_to + 1):
-                foot_below = test_y + 1
-                if foot_below >= h:
-                    landed_y = float(h - 2)
-                    break
-                for dx in range(-_PLAYER_WIDTH + 1, _PLAYER_WIDTH):
-                    if _solid(foot_below, fix + dx):
-                        landed_y = float(test_y)
-                        break
-                if landed_y is not None:
+            # The rows under the feet for the whole move come out in one
+            # slice; the first row with a solid cell is the landing row
+            feet = grid[scan_from + 1:scan_to + 2,
+                        max(fix - _PLAYER_WIDTH + 1, 0):max(fix + _PLAYER_WIDTH, 0)]
+            for test_y, row in enumerate(feet.tolist(), scan_from):
+                if not _PLAYER_PASSABLE.issuperset(row):
+                    landed_y = float(test_y)
                     break
             if landed_y is not None:
                 new_gy = landed_y
                 on_ground = True
             # Also make sure we didn't clip INTO a solid cell
-            if not _body_clear(self.gx, new_gy):
+            if not _player_body_clear(grid, self.gx, new_gy):
                 # Push upward until clear
                 for nudge in range(1, _PLAYER_HEIGHT + 4):
-                    if _body_clear(self.gx, new_gy - nudge):
+                    if _player_body_clear(grid, self.gx, new_gy - nudge):
                         new_gy -= nudge
                         on_ground = True
                         break
@@ -1721,7 +1895,7 @@ class _Player:
             end_iy = int(new_gy)
             blocked = False
             for test_y in range(start_iy, max(-1, end_iy - 1), -1):
-                if not _body_clear(self.gx, float(test_y)):
+                if not _player_body_clear(grid, self.gx, float(test_y)):
                     # Hit ceiling — stop just below
                     new_gy = float(test_y + 1)
                     self.vy = 0.0
@@ -1729,7 +1903,7 @@ class _Player:
                     break
             if not blocked:
                 # Check final destination too
-                if not _body_clear(self.gx, new_gy):
+                if not _player_body_clear(grid, self.gx, new_gy):
                     self.vy = 0.0
                     new_gy = self.gy
 
@@ -1751,7 +1925,7 @@ class _Player:
                 # Out of bounds — deactivate
                 if hix < 0 or hix >= w or hiy < 0 or hiy >= h:
                     self.hook_active = False
-                elif grid[hiy, hix] not in _passable:
+                elif grid.item(hiy, hix) not in _PLAYER_PASSABLE:
                     # Hit solid terrain — latch on!
                     self.hook_attached = True
                     self.hook_reeling = True
@@ -1763,7 +1937,7 @@ class _Player:
                     rope_len = math.hypot(dx, dy)
                     if rope_len < _HOOK_ROPE_LEN_MIN:
                         # Arrived at hook point — snap there and detach
-                        if _body_clear(self.hook_x, self.hook_y):
+                        if _player_body_clear(grid, self.hook_x, self.hook_y):
                             self.gx = self.hook_x
                             self.gy = self.hook_y
                         self.vx = 0.0
@@ -1785,19 +1959,19 @@ class _Player:
                         # Apply movement
                         rope_gx = self.gx + self.vx
                         rope_gy = self.gy + self.vy
-                        if _body_clear(rope_gx, rope_gy):
+                        if _player_body_clear(grid, rope_gx, rope_gy):
                             self.gx = rope_gx
                             self.gy = rope_gy
                             self.grounded = False
-                        elif _body_clear(rope_gx, self.gy):
+                        elif _player_body_clear(grid, rope_gx, self.gy):
                             self.gx = rope_gx
-                        elif _body_clear(self.gx, rope_gy):
+                        elif _player_body_clear(grid, self.gx, rope_gy):
                             self.gy = rope_gy
 
         # ── Final anti-clip: if body is stuck in solid, push up ──
-        if not _body_clear(self.gx, self.gy):
+        if not _player_body_clear(grid, self.gx, self.gy):
             for nudge in range(1, _PLAYER_HEIGHT + 4):
-                if _body_clear(self.gx, self.gy - nudge):
+                if _player_body_clear(grid, self.gx, self.gy - nudge):
                     self.gy -= nudge
                     self.grounded = False
                     break
@@ -1831,7 +2005,7 @@ class _Player:
             spd = base_speed + random.uniform(-0.8, 0.8)
             pvx = math.cos(a) * spd
             pvy = math.sin(a) * spd
-            buckshots_list.append(_Buckshot(gx, gy, pvx, pvy))
+            buckshots_list.append(_Buckshot.spawn(gx, gy, pvx, pvy))
 
     def cycle_weapon(self, direction):
         """Cycle through weapons. direction: +1 = next, -1 = previous."""
@@ -1902,8 +2076,8 @@ class _Player:
             spd = random.uniform(2.5, 3.5)
             fvx = math.cos(a) * spd
             fvy = math.sin(a) * spd
-            flame_list.append(_FlameParticle(gx + dx * spawn_offset,
-                                             gy + dy * spawn_offset, fvx, fvy))
+            flame_list.append(_FlameParticle.spawn(gx + dx * spawn_offset,
+                                                   gy + dy * spawn_offset, fvx, fvy))
 
     def _fire_mp5(self, target_wx, target_wy, buckshots_list):
         """Rapid-fire single bullet toward target (continuous fire with cooldown)."""
@@ -1930,7 +2104,7 @@ class _Player:
         spd = 5.0  # fast bullets
         bvx = math.cos(a) * spd
         bvy = math.sin(a) * spd
-        buckshots_list.append(_Buckshot(gx + dx * 2, gy + dy * 2, bvx, bvy, damage=0.5))
+        buckshots_list.append(_Buckshot.spawn(gx + dx * 2, gy + dy * 2, bvx, bvy, damage=0.5))
 
     def _fire_homing(self, target_wx, target_wy, homing_list):
         """Fire a single homing missile toward target. Only one at a time."""
@@ -2062,6 +2236,22 @@ class _Player:
         surface.blit(p1_lbl, (cx - p1_lbl.get_width() // 2, sy - int(28 * z)))
 
 
+# ──────────────────────────────────────────────
+# Brush stamps — offsets for the square block brushes
+# ──────────────────────────────────────────────
+_BLOCK3_DX, _BLOCK3_DY = np.mgrid[-1:2, -1:2].reshape(2, -1)
+_BLOCK5_DX, _BLOCK5_DY = np.mgrid[-2:3, -2:3].reshape(2, -1)
+# Beehive: 5×5 block with the corners knocked off for roundness
+_HIVE_KEEP = (abs(_BLOCK5_DX) < 2) | (abs(_BLOCK5_DY) < 2)
+_HIVE_DX, _HIVE_DY = _BLOCK5_DX[_HIVE_KEEP], _BLOCK5_DY[_HIVE_KEEP]
+
+
+def _sample_palette(palette, n):
+    """Pick n random colors from a palette in one shot → (n, 3) uint8."""
+    pal = np.asarray(palette, dtype=np.uint8)
+    return pal[np.random.randint(0, len(pal), n)]
+
+
 class _SandState:
     """NumPy grid-based sand sim. Much faster than dict."""
 
@@ -2080,6 +2270,16 @@ class _SandState:
             self.grid[y, x] = ptype
             self.colors[y, x] = color
 
+    def add_batch(self, ptype, xs, ys, colors):
+        """Vectorized add: write ptype at every in-bounds (xs[i], ys[i]).
+        colors is either one RGB triple or an (N, 3) array matching xs/ys."""
+        keep = (xs >= 0) & (xs < self.width) & (ys >= 0) & (ys < self.height)
+        xs = xs[keep]
+        ys = ys[keep]
+        self.grid[ys, xs] = ptype
+        colors = np.asarray(colors, dtype=np.uint8)
+        self.colors[ys, xs] = colors[keep] if colors.ndim == 2 else colors
+
     def erase_circle(self, cx, cy, radius):
         ys, xs = np.ogrid[max(0, cy - radius):min(self.height, cy + radius + 1),
                           max(0, cx - radius):min(self.width, cx + radius + 1)]
@@ -2109,6 +2309,75 @@ class _SandState:
                     self.colors[py, px] = _CONCRETE_COLOR
 
 
+# 8-neighbourhood offsets, shared by the fire/napalm/magma steps
+_NBR8 = ((-1, 0), (1, 0), (0, -1), (0, 1), (-1, -1), (1, -1), (-1, 1), (1, 1))
+# Full 3×3 block (centre first) for per-cell stamp/destroy loops
+_STAMP_OFFSETS = ((0, 0),) + _NBR8
+
+# Render mask: per-material RGB AND-mask — 0xFF keeps the cell's color,
+# 0 shows it black.  Viewed as 3-byte records so one np.take gathers a
+# whole pixel's mask per cell.
+_SHOWN_MASK = np.full((256, 3), 255, dtype=np.uint8)
+_SHOWN_MASK[[EMPTY, TUNNEL]] = 0
+_SHOWN_MASK_V3 = _SHOWN_MASK.view('V3').ravel()
+
+
+def _splat_cells(buf, xs, ys, cols):
+    """Rasterize one-cell particles straight into the (h, w, 3) render
+    buffer — one scatter instead of a pygame draw call per particle.
+    Positions round to the nearest cell; off-grid particles are dropped."""
+    h, w = buf.shape[:2]
+    ix = np.floor(xs + 0.5).astype(np.intp)
+    iy = np.floor(ys + 0.5).astype(np.intp)
+    keep = (ix >= 0) & (ix < w) & (iy >= 0) & (iy < h)
+    buf[iy[keep], ix[keep]] = cols[keep]
+
+
+# Per-material ignition chance when touching napalm / magma (0 = won't catch).
+# One list lookup replaces the per-neighbor == chain in the hot loops.
+_NAPALM_IGNITE_P = [0.0] * 256
+_NAPALM_IGNITE_P[WOOD] = 0.06
+_NAPALM_IGNITE_P[PLANT] = 0.15
+_NAPALM_IGNITE_P[DIRT] = 0.07
+_NAPALM_IGNITE_P[HEAVY] = 0.009
+_NAPALM_IGNITE_P[STATIC] = 0.009
+_NAPALM_IGNITE_P[GUNPOWDER] = 0.12    # fuse: slowly ignite adjacent gunpowder
+_NAPALM_IGNITE_P[GASOLINE] = 1.0      # always; callers skip the roll at 1.0
+_MAGMA_IGNITE_P = list(_NAPALM_IGNITE_P)
+_MAGMA_IGNITE_P[HEAVY] = 0.0          # magma turns sand into glass instead
+# Plain fire: sand glasses instead and gasoline goes up without a roll
+_FIRE_IGNITE_P = [0.0] * 256
+_FIRE_IGNITE_P[WOOD] = 0.06           # wood catches fire readily
+_FIRE_IGNITE_P[PLANT] = 0.15          # plants burn aggressively
+_FIRE_IGNITE_P[GRASS] = 0.20          # grass burns very easily
+_FIRE_IGNITE_P[DIRT] = 0.07           # dirt ignites easily
+_FIRE_IGNITE_P[STATIC] = 0.009        # wall burns slow
+_FIRE_IGNITE_P[GUNPOWDER] = 0.12      # fuse: burns cell by cell
+
+
+# Falling particles: sand, gasoline, water, confetti, poison, holy water, money, dirt, seed, treeseed, grassseed
+# (GUNPOWDER is static — painted like a fuse line, does not fall)
+_FALLING_LUT = np.zeros(256, dtype=bool)
+_FALLING_LUT[[HEAVY, GASOLINE, WATER, CONFETTI, POISON, HOLYWATER, MONEY, DIRT, SEED, TREESEED, GRASSSEED]] = True
+_FLUID_LUT = np.zeros(256, dtype=bool)
+_FLUID_LUT[[WATER, GASOLINE, POISON, HOLYWATER]] = True
+
+# Scalar counterparts for the per-particle loop
+_FALLING = frozenset((HEAVY, GASOLINE, WATER, CONFETTI, POISON, HOLYWATER, MONEY, DIRT, SEED, TREESEED, GRASSSEED))
+_FLUIDS = frozenset((WATER, GASOLINE, POISON, HOLYWATER))
+_FLUTTERS = frozenset((CONFETTI, MONEY))
+
+# Chance a blocked particle slides sideways.  Gasoline and water are
+# more fluid; confetti and money flutter — very high lateral drift.
+_SLIDE_CHANCE = [0.3] * 256
+_SLIDE_CHANCE[CONFETTI] = 0.85
+_SLIDE_CHANCE[MONEY] = 0.85
+_SLIDE_CHANCE[GASOLINE] = 0.7
+_SLIDE_CHANCE[WATER] = 0.7
+_SLIDE_CHANCE[POISON] = 0.7
+_SLIDE_CHANCE[HOLYWATER] = 0.7
+
+
 def _throttle(ys, xs, cap=_PERF_CAP):
     """If there are more particles than cap, randomly sample a subset.
     Returns (ys, xs) — possibly trimmed."""
@@ -2124,85 +2393,65 @@ def _step(state, wind_active=False, wind_dir=1, reverse_gravity=False, splash_dr
     """Vectorized physics step using numpy."""
     g = state.grid
     c = state.colors
+    cv3 = c.view('V3')[..., 0]   # (h, w) 3-byte records: one copy moves a colour
     h, w = g.shape
 
-    # Find all falling particles: sand, gasoline, water, confetti, poison, holy water, money, dirt, seed, treeseed, grassseed
-    # (GUNPOWDER is static — painted like a fuse line, does not fall)
-    falling = (g == HEAVY) | (g == GASOLINE) | (g == WATER) | (g == CONFETTI) | (g == POISON) | (g == HOLYWATER) | (g == MONEY) | (g == DIRT) | (g == SEED) | (g == TREESEED) | (g == GRASSSEED)
-    if not np.any(falling):
+    # Find all falling particles in one table lookup over the grid
+    idx = np.flatnonzero(_FALLING_LUT[g])
+    if not len(idx):
         return
 
-    ys, xs = np.where(falling)
-
     # Shuffle order to avoid directional bias
-    order = np.arange(len(ys))
-    np.random.shuffle(order)
-    ys = ys[order]
-    xs = xs[order]
+    np.random.shuffle(idx)
+    ys, xs = np.divmod(idx, w)
 
     # Throttle: skip particles when count is very high
     ys, xs = _throttle(ys, xs)
 
     grav = -1 if reverse_gravity else 1
+    item = g.item
+    rand = random.random
 
-    for i in range(len(ys)):
-        y, x = int(ys[i]), int(xs[i])
-        ptype = g[y, x]
-        if ptype not in (HEAVY, GASOLINE, WATER, CONFETTI, POISON, HOLYWATER, MONEY, DIRT, SEED, TREESEED, GRASSSEED):
+    for y, x in zip(ys.tolist(), xs.tolist()):
+        ptype = item(y, x)
+        if ptype not in _FALLING:
             continue  # already moved by another particle this step
-        col = c[y, x].copy()
-
-        # Gasoline and water are more fluid — higher lateral slide chance
-        # Confetti and money flutter — very high lateral drift
-        if ptype in (CONFETTI, MONEY):
-            slide_chance = 0.85
-        elif ptype in (GASOLINE, WATER, POISON, HOLYWATER):
-            slide_chance = 0.7
-        else:
-            slide_chance = 0.3
+        col = cv3[y, x]
 
         ny = y + grav
         moved = False
-        _fluids_for_splash = {WATER, GASOLINE, POISON, HOLYWATER}
 
         # Dirt cannot fall into TUNNEL cells (tunnels hold their shape);
         # everything else treats TUNNEL as open space.
         # Dirt does not fall through FIRE/NAPALM (burning supports material above).
-        def _is_open(cy, cx):
-            """Return True if cell (cy,cx) is open space this particle can move into."""
-            cell = g[cy, cx]
-            if cell == EMPTY:
-                return True
-            if cell == TUNNEL and ptype != DIRT:
-                return True
-            return False
+        opens = (EMPTY,) if ptype == DIRT else (EMPTY, TUNNEL)
 
         # Confetti/money flutters — 50% chance to skip falling, just drift sideways
-        if ptype in (CONFETTI, MONEY) and random.random() < 0.5:
-            lx = x + (1 if random.random() < 0.5 else -1)
-            if 0 <= lx < w and _is_open(y, lx):
+        if ptype in _FLUTTERS and rand() < 0.5:
+            lx = x + (1 if rand() < 0.5 else -1)
+            if 0 <= lx < w and item(y, lx) in opens:
                 g[y, x] = EMPTY
                 g[y, lx] = ptype
-                c[y, lx] = col
+                cv3[y, lx] = col
             continue
 
         # Try straight down
-        if 0 <= ny < h and _is_open(ny, x):
+        if 0 <= ny < h and item(ny, x) in opens:
             g[y, x] = EMPTY
             g[ny, x] = ptype
-            c[ny, x] = col
+            cv3[ny, x] = col
             y = ny
             moved = True
-        elif (0 <= ny < h and g[ny, x] in _fluids_for_splash
-              and ptype not in _fluids_for_splash):
+        elif (0 <= ny < h and item(ny, x) in _FLUIDS
+              and ptype not in _FLUIDS):
             # ── Splash! Non-fluid particle falls into fluid ──
-            fluid_t = g[ny, x]
-            fluid_c = c[ny, x].copy()
+            fluid_t = item(ny, x)
+            fluid_c = cv3[ny, x]
             # Swap: particle sinks, fluid goes up
             g[ny, x] = ptype
-            c[ny, x] = col
+            cv3[ny, x] = col
             g[y, x] = fluid_t
-            c[y, x] = fluid_c
+            cv3[y, x] = fluid_c
             y = ny
             moved = True
 
@@ -2217,13 +2466,12 @@ def _step(state, wind_active=False, wind_dir=1, reverse_gravity=False, splash_dr
                         continue
                     # Find topmost fluid cell in this column near impact
                     for sy in range(max(0, ny - 6), ny + 1):
-                        if g[sy, sx] in _fluids_for_splash:
-                            ft = g[sy, sx]
+                        ft = item(sy, sx)
+                        if ft in _FLUIDS:
                             fc = c[sy, sx].copy()
                             g[sy, sx] = EMPTY
                             c[sy, sx] = (0, 0, 0)
-                            splash_drops.append(
-                                _SplashDrop(sx, sy, ft, fc))
+                            splash_drops.emit(sx, sy, ft, fc)
                             n_drops -= 1
                             break
         else:
@@ -2233,76 +2481,73 @@ def _step(state, wind_active=False, wind_dir=1, reverse_gravity=False, splash_dr
                 c[y, x] = (0, 0, 0)
                 continue
             # Try diagonal left/right (random order)
-            if random.random() < 0.5:
+            if rand() < 0.5:
                 tries = [(x - 1, ny), (x + 1, ny)]
             else:
                 tries = [(x + 1, ny), (x - 1, ny)]
             for tx, ty in tries:
-                if 0 <= tx < w and 0 <= ty < h and _is_open(ty, tx):
+                if 0 <= tx < w and 0 <= ty < h and item(ty, tx) in opens:
                     g[y, x] = EMPTY
                     g[ty, tx] = ptype
-                    c[ty, tx] = col
+                    cv3[ty, tx] = col
                     x, y = tx, ty
                     moved = True
                     break
 
-        is_fluid = ptype in (GASOLINE, WATER, POISON, HOLYWATER)
+        is_fluid = ptype in _FLUIDS
 
         # Fluids: try to slide sideways when blocked (just 1 cell, keep it simple)
         if not moved and is_fluid:
-            direction = 1 if random.random() < 0.5 else -1
+            direction = 1 if rand() < 0.5 else -1
             lx = x + direction
-            if 0 <= lx < w and _is_open(y, lx):
+            if 0 <= lx < w and item(y, lx) in opens:
                 g[y, x] = EMPTY
                 g[y, lx] = ptype
-                c[y, lx] = col
+                cv3[y, lx] = col
                 x = lx
                 moved = True
             else:
                 lx = x - direction
-                if 0 <= lx < w and _is_open(y, lx):
+                if 0 <= lx < w and item(y, lx) in opens:
                     g[y, x] = EMPTY
                     g[y, lx] = ptype
-                    c[y, lx] = col
+                    cv3[y, lx] = col
                     x = lx
                     moved = True
         elif not moved:
             # Non-fluid: only try lateral if didn't move at all
-            if random.random() < slide_chance:
-                lx = x + (1 if random.random() < 0.5 else -1)
-                if 0 <= lx < w and _is_open(y, lx):
+            if rand() < _SLIDE_CHANCE[ptype]:
+                lx = x + (1 if rand() < 0.5 else -1)
+                if 0 <= lx < w and item(y, lx) in opens:
                     g[y, x] = EMPTY
                     g[y, lx] = ptype
-                    c[y, lx] = col
+                    cv3[y, lx] = col
                     x = lx
                     moved = True
 
         # Wind push
         if wind_active and moved:
             wx = x + wind_dir
-            if 0 <= wx < w and g[y, wx] == EMPTY:
+            if 0 <= wx < w and item(y, wx) == EMPTY:
                 g[y, x] = EMPTY
                 g[y, wx] = ptype
-                c[y, wx] = col
+                cv3[y, wx] = col
 
     # ── Seed sprouting ───────────────────────────────────────────
     # Seeds touching water convert to PLANT and spawn vine tips
     # that grow gradually (1 cell per tick).
     _water_set = {WATER, HOLYWATER}
-    seed_ys, seed_xs = np.where(g == SEED)
+    seed_ys, seed_xs = np.divmod(np.flatnonzero(g == SEED), w)
     for si in range(len(seed_ys)):
         sy, sx = int(seed_ys[si]), int(seed_xs[si])
         if g[sy, sx] != SEED:
             continue
         # Check all 8 neighbors for water — collect water cells to consume
         water_neighbors = []
-        for dy in (-1, 0, 1):
-            for dx in (-1, 0, 1):
-                if dy == 0 and dx == 0:
-                    continue
-                ny2, nx2 = sy + dy, sx + dx
-                if 0 <= ny2 < h and 0 <= nx2 < w and g[ny2, nx2] in _water_set:
-                    water_neighbors.append((ny2, nx2))
+        for dx, dy in _NBR8:
+            ny2, nx2 = sy + dy, sx + dx
+            if 0 <= ny2 < h and 0 <= nx2 < w and g[ny2, nx2] in _water_set:
+                water_neighbors.append((ny2, nx2))
         if not water_neighbors:
             continue
 
@@ -2504,20 +2749,17 @@ def _step(state, wind_active=False, wind_dir=1, reverse_gravity=False, splash_dr
     # ── Tree seed sprouting ──────────────────────────────────────
     # TREESEED touching water starts growing a tree gradually using vine_tips.
     # Trunk tips grow straight up (WOOD), then spawn canopy tips (PLANT).
-    ts_ys, ts_xs = np.where(g == TREESEED)
+    ts_ys, ts_xs = np.divmod(np.flatnonzero(g == TREESEED), w)
     for ti in range(len(ts_ys)):
         ty, tx = int(ts_ys[ti]), int(ts_xs[ti])
         if g[ty, tx] != TREESEED:
             continue
         # Check all 8 neighbors for water — collect water cells to consume
         water_neighbors = []
-        for dy in (-1, 0, 1):
-            for dx in (-1, 0, 1):
-                if dy == 0 and dx == 0:
-                    continue
-                ny2, nx2 = ty + dy, tx + dx
-                if 0 <= ny2 < h and 0 <= nx2 < w and g[ny2, nx2] in _water_set:
-                    water_neighbors.append((ny2, nx2))
+        for dx, dy in _NBR8:
+            ny2, nx2 = ty + dy, tx + dx
+            if 0 <= ny2 < h and 0 <= nx2 < w and g[ny2, nx2] in _water_set:
+                water_neighbors.append((ny2, nx2))
         if not water_neighbors:
             continue
 
@@ -2548,20 +2790,17 @@ def _step(state, wind_active=False, wind_dir=1, reverse_gravity=False, splash_dr
     # ── Grass seed sprouting ───────────────────────────────────────
     # GRASSSEED touching water starts growing grass gradually using vine_tips.
     # Each grass seed spawns 1-3 short upward tips that place GRASS cells.
-    gs_ys, gs_xs = np.where(g == GRASSSEED)
+    gs_ys, gs_xs = np.divmod(np.flatnonzero(g == GRASSSEED), w)
     for gi in range(len(gs_ys)):
         gy2, gx2 = int(gs_ys[gi]), int(gs_xs[gi])
         if g[gy2, gx2] != GRASSSEED:
             continue
         # Check all 8 neighbors for water — collect water cells to consume
         water_neighbors = []
-        for dy in (-1, 0, 1):
-            for dx in (-1, 0, 1):
-                if dy == 0 and dx == 0:
-                    continue
-                ny2, nx2 = gy2 + dy, gx2 + dx
-                if 0 <= ny2 < h and 0 <= nx2 < w and g[ny2, nx2] in _water_set:
-                    water_neighbors.append((ny2, nx2))
+        for dx, dy in _NBR8:
+            ny2, nx2 = gy2 + dy, gx2 + dx
+            if 0 <= ny2 < h and 0 <= nx2 < w and g[ny2, nx2] in _water_set:
+                water_neighbors.append((ny2, nx2))
         if not water_neighbors:
             continue
 
@@ -2591,69 +2830,63 @@ def _step(state, wind_active=False, wind_dir=1, reverse_gravity=False, splash_dr
     # into any adjacent empty cell that also has support below it,
     # OR into an adjacent empty cell with nothing below (waterfall).
     # This is the "cellular automaton" approach — simple and fast.
-    _fluids_set = {WATER, GASOLINE, POISON, HOLYWATER}
-
+    # Moves are purely sideways, so the rows holding fluid never change
+    # and only the fluid cells of those rows need visiting.  A surface
+    # cell (no fluid above) could only level into an open neighbour of
+    # height 0 from its own height 1, which never passes the >= 2 test,
+    # so without pressure a cell only moves toward a drop.
     _open_set = {EMPTY, TUNNEL}   # cells that fluid can flow into
+    item = g.item
+    rows = np.flatnonzero(_FLUID_LUT[g].any(axis=1))[::-1].tolist()
 
     for _pass in range(4):
-        for y in range(h - 1, -1, -1):
-            # Alternate left-to-right vs right-to-left each pass
-            if _pass % 2 == 0:
-                col_range = range(w)
-            else:
-                col_range = range(w - 1, -1, -1)
+        # Alternate left-to-right vs right-to-left each pass
+        step = 1 if _pass % 2 == 0 else -1
+        fluid = _FLUID_LUT[g]
+        for y in rows:
+            below = y + 1
+            row_xs = np.flatnonzero(fluid[y]).tolist()
+            if step < 0:
+                row_xs.reverse()
+
+            for x in row_xs:
+                while True:
+                    # Already falling? Skip — gravity handles it
+                    if below < h and item(below, x) in _open_set:
+                        break
 
-            for x in col_range:
-                if g[y, x] not in _fluids_set:
-                    continue
+                    # Only flow sideways if under pressure (fluid above)
+                    # or if the neighbor empty cell leads to a drop.
+                    # This prevents surface particles from jiggling.
+                    has_pressure = (y > 0 and item(y - 1, x) in _FLUIDS)
 
-                # Already falling? Skip — gravity handles it
-                below = y + 1
-                if below < h and g[below, x] in _open_set:
-                    continue
+                    d = 1 if rand() < 0.5 else -1
+                    nx = -1
+                    for direction in (d, -d):
+                        tx = x + direction
+                        if tx < 0 or tx >= w or item(y, tx) not in _open_set:
+                            continue
+                        # Empty below target = waterfall
+                        if has_pressure or (below < h and item(below, tx) in _open_set):
+                            nx = tx
+                            break
+                    if nx < 0:
+                        break
 
-                # Only flow sideways if under pressure (fluid above)
-                # or if the neighbor empty cell leads to a drop.
-                # This prevents surface particles from jiggling.
-                has_pressure = (y > 0 and g[y - 1, x] in _fluids_set)
+                    g[y, nx] = item(y, x)
+                    g[y, x] = EMPTY
+                    cv3[y, nx] = cv3[y, x]
+                    # A cell carried along the sweep is visited again there
+                    if nx - x != step:
+                        break
+                    x = nx
 
-                d = 1 if random.random() < 0.5 else -1
-                for direction in (d, -d):
-                    nx = x + direction
-                    if nx < 0 or nx >= w:
-                        continue
-                    if g[y, nx] not in _open_set:
-                        continue
 
-                    # Check if the target cell leads to a drop
-                    # (empty below target = waterfall)
-                    target_below = y + 1
-                    drops = (target_below < h and g[target_below, nx] in _open_set)
-
-                    if not has_pressure and not drops:
-                        # Surface particle with nowhere to fall —
-                        # only move if it actually levels the column.
-                        # Count fluid height at current x vs neighbor.
-                        cur_h = 0
-                        sy = y
-                        while sy >= 0 and g[sy, x] in _fluids_set:
-                            cur_h += 1
-                            sy -= 1
-                        # Neighbor height
-                        nb_h = 0
-                        sy = y
-                        while sy >= 0 and g[sy, nx] in _fluids_set:
-                            nb_h += 1
-                            sy -= 1
-                        if cur_h - nb_h < 2:
-                            continue  # already level, don't jiggle
-
-                    pt = g[y, x]
-                    cl = c[y, x]
-                    g[y, x] = EMPTY
-                    g[y, nx] = pt
-                    c[y, nx] = cl
-                    break
+# Neighbours that keep a fire cell burning longer (see _step_fire)
+_FIRE_LINGER_PLANT = np.zeros(256, dtype=bool)
+_FIRE_LINGER_PLANT[[PLANT, GRASS]] = True
+_FIRE_LINGER_FUEL = np.zeros(256, dtype=bool)
+_FIRE_LINGER_FUEL[[WOOD, DIRT]] = True
 
 
 def _step_fire(state):
@@ -2692,21 +2925,29 @@ def _step_fire(state):
     # Throttle fire processing when particle count is huge
     ys, xs = _throttle(ys, xs)
 
-    for i in range(len(ys)):
-        y, x = int(ys[i]), int(xs[i])
-        if g[y, x] != FIRE:
+    item = g.item
+    rand = random.random
+    live_ys = []
+    live_xs = []
+    for y, x in zip(ys.tolist(), xs.tolist()):
+        if item(y, x) != FIRE:
             continue
-        col = tuple(random.choice(_FIRE_COLORS))
+        col = random.choice(_FIRE_COLORS)
 
         # Consume neighbors — spread to adjacent flammable cells
         # CONCRETE is fireproof.  WOOD burns slowly.  HEAVY/STATIC burn faster.
         # WATER extinguishes fire on contact.
         extinguished = False
-        for dx, dy in [(-1, 0), (1, 0), (0, -1), (0, 1), (-1, -1), (1, -1), (-1, 1), (1, 1)]:
+        for dx, dy in _NBR8:
             nx, ny2 = x + dx, y + dy
             if 0 <= nx < w and 0 <= ny2 < h:
-                cell = g[ny2, nx]
-                if cell == WATER:
+                cell = item(ny2, nx)
+                p = _FIRE_IGNITE_P[cell]
+                if p:
+                    if rand() < p:
+                        g[ny2, nx] = FIRE
+                        c[ny2, nx] = random.choice(_FIRE_COLORS)
+                elif cell == WATER:
                     # Fire + water = steam (both cells)
                     g[ny2, nx] = STEAM
                     c[ny2, nx] = random.choice(_STEAM_COLORS)
@@ -2723,35 +2964,10 @@ def _step_fire(state):
                     fa[y, x] = 0
                     extinguished = True
                     break
-                elif cell == WOOD:
-                    if random.random() < 0.06:       # wood catches fire readily
-                        g[ny2, nx] = FIRE
-                        c[ny2, nx] = random.choice(_FIRE_COLORS)
-                elif cell == PLANT:
-                    if random.random() < 0.15:       # plants burn aggressively
-                        g[ny2, nx] = FIRE
-                        c[ny2, nx] = random.choice(_FIRE_COLORS)
-                elif cell == GRASS:
-                    if random.random() < 0.20:       # grass burns very easily
-                        g[ny2, nx] = FIRE
-                        c[ny2, nx] = random.choice(_FIRE_COLORS)
-                elif cell == DIRT:
-                    if random.random() < 0.07:       # dirt ignites easily
-                        g[ny2, nx] = FIRE
-                        c[ny2, nx] = random.choice(_FIRE_COLORS)
                 elif cell == HEAVY:
-                    if random.random() < 0.08:       # fire + sand = glass
+                    if rand() < 0.08:  # fire + sand = glass
                         g[ny2, nx] = GLASS
                         c[ny2, nx] = random.choice(_GLASS_COLORS)
-                elif cell == STATIC:
-                    if random.random() < 0.009:      # wall burns slow
-                        g[ny2, nx] = FIRE
-                        c[ny2, nx] = random.choice(_FIRE_COLORS)
-                elif cell == GUNPOWDER:
-                    # Fuse: slowly ignite adjacent gunpowder (burns cell by cell)
-                    if random.random() < 0.12:
-                        g[ny2, nx] = FIRE
-                        c[ny2, nx] = random.choice(_FIRE_COLORS)
                 elif cell == GASOLINE:
                     # Gasoline ignites instantly on contact with fire
                     g[ny2, nx] = FIRE
@@ -2767,9 +2983,9 @@ def _step_fire(state):
         moved = False
 
         # Check if fuel is directly above — anchor the fire
-        fuel_above = (0 <= ny < h and g[ny, x] in (WOOD, DIRT, GRASS))
+        fuel_above = (0 <= ny < h and item(ny, x) in (WOOD, DIRT, GRASS))
 
-        if not fuel_above and 0 <= ny < h and g[ny, x] == EMPTY:
+        if not fuel_above and 0 <= ny < h and item(ny, x) == EMPTY:
             fa[ny, x] = fa[y, x]
             fa[y, x] = 0
             g[y, x] = EMPTY
@@ -2780,12 +2996,12 @@ def _step_fire(state):
         else:
             # Try diagonal up-left/up-right (only if no fuel anchoring)
             if not fuel_above:
-                if random.random() < 0.5:
+                if rand() < 0.5:
                     tries = [(x - 1, ny), (x + 1, ny)]
                 else:
                     tries = [(x + 1, ny), (x - 1, ny)]
                 for tx, ty in tries:
-                    if 0 <= tx < w and 0 <= ty < h and g[ty, tx] == EMPTY:
+                    if 0 <= tx < w and 0 <= ty < h and item(ty, tx) == EMPTY:
                         fa[ty, tx] = fa[y, x]
                         fa[y, x] = 0
                         g[y, x] = EMPTY
@@ -2797,9 +3013,9 @@ def _step_fire(state):
 
         # Random lateral drift
         if not moved:
-            if random.random() < 0.4:
-                lx = x + (1 if random.random() < 0.5 else -1)
-                if 0 <= lx < w and g[y, lx] == EMPTY:
+            if rand() < 0.4:
+                lx = x + (1 if rand() < 0.5 else -1)
+                if 0 <= lx < w and item(y, lx) == EMPTY:
                     fa[y, lx] = fa[y, x]
                     fa[y, x] = 0
                     g[y, x] = EMPTY
@@ -2807,30 +3023,51 @@ def _step_fire(state):
                     c[y, lx] = col
                     moved = True
 
-        # Fire has a chance to die out — ramps up aggressively with age
-        # Fire adjacent to fuel (plant/wood/dirt) uses a longer lifetime
-        age = fa[y, x]
-        near_plant = False
-        near_fuel = False
-        for dx2, dy2 in ((-1,0),(1,0),(0,-1),(0,1)):
-            nx2, ny2 = x + dx2, y + dy2
-            if 0 <= nx2 < w and 0 <= ny2 < h:
-                nc = g[ny2, nx2]
-                if nc in (PLANT, GRASS):
-                    near_plant = True
-                    break
-                elif nc in (WOOD, DIRT):
-                    near_fuel = True
-        if near_plant:
-            max_age = _FIRE_MAX_AGE_PLANT
-        elif near_fuel:
-            max_age = _FIRE_MAX_AGE_FUEL
-        else:
-            max_age = _FIRE_MAX_AGE
-        die_chance = 0.08 + (age / max_age) * 0.80
-        if random.random() < die_chance:
-            g[y, x] = EMPTY
-            fa[y, x] = 0
+        live_ys.append(y)
+        live_xs.append(x)
+
+    # Fire has a chance to die out — ramps up aggressively with age.
+    # Fire adjacent to fuel (plant/wood/dirt) uses a longer lifetime.
+    # Rolled for all surviving cells at once, after they have moved.
+    if not live_ys:
+        return
+    ly = np.array(live_ys)
+    lx = np.array(live_xs)
+    gp = np.pad(g, 1)     # gp[y + 1, x + 1] is g[y, x]; the border reads as EMPTY
+    nbrs = np.stack([gp[ly + 1, lx], gp[ly + 1, lx + 2], gp[ly, lx + 1], gp[ly + 2, lx + 1]])
+    max_age = np.where(_FIRE_LINGER_PLANT[nbrs].any(axis=0), _FIRE_MAX_AGE_PLANT,
+                       np.where(_FIRE_LINGER_FUEL[nbrs].any(axis=0), _FIRE_MAX_AGE_FUEL, _FIRE_MAX_AGE))
+    die_chance = 0.08 + (fa[ly, lx] / max_age) * 0.80
+    dying = np.random.random(len(ly)) < die_chance
+    g[ly[dying], lx[dying]] = EMPTY
+    fa[ly[dying], lx[dying]] = 0
+
+
+def _napalm_check_extinguish(g, c, x, y, w, h):
+    """Spread napalm's fire to the 8 neighbours of (x, y).
+    WATER puts the napalm out on contact and ICE melts into water;
+    returns True (napalm cell cleared) as soon as either is found."""
+    # Interior cells (the vast majority) skip the per-neighbor bounds test.
+    interior = 0 < x < w - 1 and 0 < y < h - 1
+    for dx, dy in _NBR8:
+        nx, ny2 = x + dx, y + dy
+        if interior or (0 <= nx < w and 0 <= ny2 < h):
+            cell = g[ny2, nx]
+            p = _NAPALM_IGNITE_P[cell]
+            if p:
+                if p >= 1.0 or random.random() < p:   # gasoline: no roll
+                    g[ny2, nx] = FIRE
+                    c[ny2, nx] = random.choice(_FIRE_COLORS)
+            elif cell == WATER:
+                g[y, x] = EMPTY
+                return True
+            elif cell == ICE:
+                # Napalm melts ice into water
+                g[ny2, nx] = WATER
+                c[ny2, nx] = random.choice(_WATER_COLORS)
+                g[y, x] = EMPTY
+                return True
+    return False
 
 
 def _step_napalm(state):
@@ -2861,47 +3098,7 @@ def _step_napalm(state):
 
         # Spread fire to neighbors just like regular fire
         # WATER extinguishes napalm on contact.
-        extinguished = False
-        for dx, dy in [(-1, 0), (1, 0), (0, -1), (0, 1), (-1, -1), (1, -1), (-1, 1), (1, 1)]:
-            nx, ny2 = x + dx, y + dy
-            if 0 <= nx < w and 0 <= ny2 < h:
-                cell = g[ny2, nx]
-                if cell == WATER:
-                    g[y, x] = EMPTY
-                    extinguished = True
-                    break
-                elif cell == ICE:
-                    # Napalm melts ice into water
-                    g[ny2, nx] = WATER
-                    c[ny2, nx] = random.choice(_WATER_COLORS)
-                    g[y, x] = EMPTY
-                    extinguished = True
-                    break
-                elif cell == WOOD:
-                    if random.random() < 0.06:
-                        g[ny2, nx] = FIRE
-                        c[ny2, nx] = random.choice(_FIRE_COLORS)
-                elif cell == PLANT:
-                    if random.random() < 0.15:
-                        g[ny2, nx] = FIRE
-                        c[ny2, nx] = random.choice(_FIRE_COLORS)
-                elif cell == DIRT:
-                    if random.random() < 0.07:
-                        g[ny2, nx] = FIRE
-                        c[ny2, nx] = random.choice(_FIRE_COLORS)
-                elif cell == HEAVY or cell == STATIC:
-                    if random.random() < 0.009:
-                        g[ny2, nx] = FIRE
-                        c[ny2, nx] = random.choice(_FIRE_COLORS)
-                elif cell == GUNPOWDER:
-                    # Fuse: slowly ignite adjacent gunpowder
-                    if random.random() < 0.12:
-                        g[ny2, nx] = FIRE
-                        c[ny2, nx] = random.choice(_FIRE_COLORS)
-                elif cell == GASOLINE:
-                    g[ny2, nx] = FIRE
-                    c[ny2, nx] = random.choice(_FIRE_COLORS)
-        if extinguished:
+        if _napalm_check_extinguish(g, c, x, y, w, h):
             continue
 
         # Napalm FALLS downward (like sand, but fire)
@@ -3022,7 +3219,12 @@ def _step_magma(state):
                 nx, ny2 = x + dx, y + dy
                 if 0 <= nx < w and 0 <= ny2 < h:
                     cell = g[ny2, nx]
-                    if cell == ICE:
+                    p = _MAGMA_IGNITE_P[cell]
+                    if p:
+                        if p >= 1.0 or random.random() < p:   # gasoline: no roll
+                            g[ny2, nx] = FIRE
+                            c[ny2, nx] = random.choice(_FIRE_COLORS)
+                    elif cell == ICE:
                         g[ny2, nx] = WATER
                         c[ny2, nx] = random.choice(_WATER_COLORS)
                     elif cell == WATER:
@@ -3030,34 +3232,10 @@ def _step_magma(state):
                         if random.random() < 0.15:
                             g[ny2, nx] = STEAM
                             c[ny2, nx] = random.choice(_STEAM_COLORS)
-                    elif cell == WOOD:
-                        if random.random() < 0.06:
-                            g[ny2, nx] = FIRE
-                            c[ny2, nx] = random.choice(_FIRE_COLORS)
-                    elif cell == PLANT:
-                        if random.random() < 0.15:
-                            g[ny2, nx] = FIRE
-                            c[ny2, nx] = random.choice(_FIRE_COLORS)
-                    elif cell == DIRT:
-                        if random.random() < 0.07:
-                            g[ny2, nx] = FIRE
-                            c[ny2, nx] = random.choice(_FIRE_COLORS)
                     elif cell == HEAVY:
                         if random.random() < 0.08:       # magma + sand = glass
                             g[ny2, nx] = GLASS
                             c[ny2, nx] = random.choice(_GLASS_COLORS)
-                    elif cell == STATIC:
-                        if random.random() < 0.009:
-                            g[ny2, nx] = FIRE
-                            c[ny2, nx] = random.choice(_FIRE_COLORS)
-                    elif cell == GUNPOWDER:
-                        # Fuse: slowly ignite adjacent gunpowder
-                        if random.random() < 0.12:
-                            g[ny2, nx] = FIRE
-                            c[ny2, nx] = random.choice(_FIRE_COLORS)
-                    elif cell == GASOLINE:
-                        g[ny2, nx] = FIRE
-                        c[ny2, nx] = random.choice(_FIRE_COLORS)
 
         if extinguished:
             continue
@@ -3076,12 +3254,15 @@ def _step_magma(state):
                 moved = True
             elif below in _magma_displace:
                 # Magma sinks through lighter fluids (swap)
+                # Scalar temps — avoids allocating a 3-element array per swap
                 fluid_t = g[ny, x]
-                fluid_c = c[ny, x].copy()
+                fr, fgr, fb = int(c[ny, x, 0]), int(c[ny, x, 1]), int(c[ny, x, 2])
                 g[ny, x] = MAGMA
                 c[ny, x] = col
                 g[y, x] = fluid_t
-                c[y, x] = fluid_c
+                c[y, x, 0] = fr
+                c[y, x, 1] = fgr
+                c[y, x, 2] = fb
                 y = ny
                 moved = True
 
@@ -3104,11 +3285,13 @@ def _step_magma(state):
                         break
                     elif tcell in _magma_displace:
                         fluid_t = g[ty, tx]
-                        fluid_c = c[ty, tx].copy()
+                        fr, fgr, fb = int(c[ty, tx, 0]), int(c[ty, tx, 1]), int(c[ty, tx, 2])
                         g[ty, tx] = MAGMA
                         c[ty, tx] = col
                         g[y, x] = fluid_t
-                        c[y, x] = fluid_c
+                        c[y, x, 0] = fr
+                        c[y, x, 1] = fgr
+                        c[y, x, 2] = fb
                         x, y = tx, ty
                         moved = True
                         break
@@ -3256,24 +3439,55 @@ def _step_steam(state):
 
 
 def _bresenham(x0, y0, x1, y1):
-    points = []
+    """Grid line from (x0, y0) to (x1, y1) inclusive, as (xs, ys) int arrays.
+    Closed form: one point per step along the major axis, the minor offset
+    rounded in integer math with .5 ties going back toward the start —
+    the exact pixels the classic Bresenham loop picks."""
     dx = abs(x1 - x0)
     dy = abs(y1 - y0)
-    sx = 1 if x0 < x1 else -1
-    sy = 1 if y0 < y1 else -1
-    err = dx - dy
-    while True:
-        points.append((x0, y0))
-        if x0 == x1 and y0 == y1:
-            break
-        e2 = 2 * err
-        if e2 > -dy:
-            err -= dy
-            x0 += sx
-        if e2 < dx:
-            err += dx
-            y0 += sy
-    return points
+    m = max(dx, dy, 1)
+    i2 = np.arange(max(dx, dy) + 1, dtype=np.int32) * 2
+    xs = (i2 * dx + (m - 1)) // (2 * m)
+    ys = (i2 * dy + (m - 1)) // (2 * m)
+    xs = x0 - xs if x1 < x0 else x0 + xs
+    ys = y0 - ys if y1 < y0 else y0 + ys
+    return xs, ys
+
+
+def _scanline_fill(g, gx, gy, ptype, cap, stack):
+    """Scanline flood fill of the EMPTY region containing (gx, gy), in place.
+    Each seed grows into its whole horizontal run of EMPTY cells, written
+    in one slice; filled cells are no longer EMPTY, so the grid itself is
+    the visited set. Seeds are packed y * w + x ints on *stack* (a list,
+    cleared first) and popped depth-first, so consecutive spans tend to
+    sit in neighbouring rows. Stops after *cap* cells. Returns the filled
+    spans as a list of (y, x1, x2) — colors are left to the caller."""
+    h, w = g.shape
+    stack.clear()
+    stack.append(gy * w + gx)
+    spans = []
+    filled = 0
+    while stack and filled < cap:
+        sy, sx = divmod(stack.pop(), w)
+        row = g[sy]
+        if row[sx] != EMPTY:
+            continue   # already covered by an earlier span
+        # Extend left/right to the nearest non-empty cell
+        left = np.flatnonzero(row[:sx] != EMPTY)
+        x1 = int(left[-1]) + 1 if len(left) else 0
+        right = np.flatnonzero(row[sx + 1:] != EMPTY)
+        x2 = sx + int(right[0]) if len(right) else w - 1
+        x2 = min(x2, x1 + cap - filled - 1)
+        row[x1:x2 + 1] = ptype
+        spans.append((sy, x1, x2))
+        filled += x2 - x1 + 1
+        # One seed per EMPTY run in the rows above and below
+        for ny in (sy - 1, sy + 1):
+            if 0 <= ny < h:
+                seg = (g[ny, x1:x2 + 1] == EMPTY).view(np.int8)
+                starts = np.flatnonzero(np.diff(seg, prepend=0) == 1)
+                stack.extend((starts + (ny * w + x1)).tolist())
+    return spans
 
 
 class _Button:
@@ -3309,6 +3523,18 @@ class _Button:
         return expanded.collidepoint(int(px), int(py))
 
 
+# Squared pick radii — compared against squared distances, no sqrt needed
+_HAND_RADIUS_SQ = 6.0 * 6.0      # hand tool grabs gnomes within 6 cells
+_CHUTE_RADIUS_SQ = 30 * 30       # tap within 30 px of a canopy pops it
+
+# One-shot pinch tools — bits in SandWindow._pinch_once, cleared on release
+_PINCH_SPAWNED = 1   # gnome / bomb / tree / worm / hive dropped this pinch
+_PINCH_FILLED = 2    # flood fill already ran this pinch
+
+# Zombie-bite bin offsets: a gnome's own 3-cell bin plus its 8 neighbours
+_BITE_BINS = ((0, 0),) + _NBR8
+
+
 class SandWindow:
     MODE_POUR = 0
     MODE_WALL = 1
@@ -3340,6 +3566,111 @@ class SandWindow:
     MODE_TREE = 27
     MODE_GRASS = 28
 
+    # Tools whose material the paint-bucket fill picks up when selected
+    _FILL_MATERIAL_MODES = frozenset((
+        MODE_POUR, MODE_WOOD, MODE_CONCRETE, MODE_FIRE, MODE_GUNPOWDER,
+        MODE_NAPALM, MODE_GASOLINE, MODE_WATER, MODE_DIRT, MODE_GLASS,
+    ))
+    # Solid brushes: mode → (ptype, palette, tap block radius).
+    # Pinch strokes always use the 3×3 block and interpolate between
+    # frames, so these are also the modes that keep a stroke anchor.
+    _SOLID_BRUSH = {
+        MODE_WOOD: (WOOD, _WOOD_COLORS, 1),
+        MODE_CONCRETE: (CONCRETE, (_CONCRETE_COLOR,), 1),
+        MODE_GLASS: (GLASS, _GLASS_COLORS, 1),
+        # Gunpowder paints as a static fuse line (like wood)
+        MODE_GUNPOWDER: (GUNPOWDER, _GUNPOWDER_COLORS, 1),
+        MODE_ICE: (ICE, _ICE_COLORS, 2),
+    }
+
+    # Menu-toggle label showing the current tool
+    _MODE_LABELS = {
+        MODE_POUR: "☰ SND", MODE_HAND: "☰ HND", MODE_WOOD: "☰ WOD",
+        MODE_CONCRETE: "☰ CON", MODE_ERASE: "☰ ERS", MODE_GNOME: "☰ GNM",
+        MODE_FIRE: "☰ FIR", MODE_GUNPOWDER: "☰ GUN", MODE_NAPALM: "☰ NAP",
+        MODE_GASOLINE: "☰ GAS", MODE_WATER: "☰ WTR", MODE_CONFETTI: "☰ CNF",
+        MODE_POISON: "☰ ZMB", MODE_HOLYWATER: "☰ HLY", MODE_ICE: "☰ ICE",
+        MODE_BOMB: "☰ BMB", MODE_MONEY: "☰ $$$", MODE_FIREBOMB: "☰ FBM",
+        MODE_DIRT: "☰ DRT", MODE_MATCH: "☰ MCH", MODE_MAGMA: "☰ MAG",
+        MODE_FILL: "☰ FIL", MODE_SEED: "☰ SED",
+        MODE_WORM: "☰ WRM", MODE_GLASS: "☰ GLS",
+        MODE_BEE: "☰ BEE",
+        MODE_TREE: "☰ TRE", MODE_GRASS: "☰ GRS",
+    }
+
+    # Fill button label — shows what material fill will use
+    _FILL_NAMES = {
+        MODE_POUR: "FILL:S",
+        MODE_WOOD: "FILL:Wd", MODE_CONCRETE: "FILL:C",
+        MODE_FIRE: "FILL:F", MODE_GUNPOWDER: "FILL:GP",
+        MODE_NAPALM: "FILL:N", MODE_GASOLINE: "FILL:G",
+        MODE_WATER: "FILL:Wt", MODE_DIRT: "FILL:D",
+        MODE_GLASS: "FILL:Gl",
+    }
+
+    # Speed buttons — highlight when not at normal speed.
+    # sim speed → (slow label, slow active, fast label, fast active)
+    _SPEED_BUTTONS = {
+        1: ("SLOW", False, "FST 2x", True),
+        2: ("SLOW", False, "FAST", False),
+        3: ("SLO .6x", True, "FAST", False),
+        4: ("SLO .5x", True, "FAST", False),
+        5: ("SLO 0.4x", True, "FAST", False),
+        6: ("SLO .3x", True, "FAST", False),
+    }
+
+    # Paint-bucket materials: fill material → (ptype, palette array).
+    # A palette of None means the current sand color.
+    _FILL_MATERIALS = {
+        MODE_POUR: (HEAVY, None),
+        MODE_WALL: (STATIC, np.array([_WALL_COLOR], dtype=np.uint8)),
+        MODE_WOOD: (WOOD, np.array(_WOOD_COLORS, dtype=np.uint8)),
+        MODE_CONCRETE: (CONCRETE, np.array([_CONCRETE_COLOR], dtype=np.uint8)),
+        MODE_FIRE: (FIRE, np.array(_FIRE_COLORS, dtype=np.uint8)),
+        MODE_GUNPOWDER: (GUNPOWDER, np.array(_GUNPOWDER_COLORS, dtype=np.uint8)),
+        MODE_NAPALM: (NAPALM, np.array(_NAPALM_COLORS, dtype=np.uint8)),
+        MODE_GASOLINE: (GASOLINE, np.array(_GASOLINE_COLORS, dtype=np.uint8)),
+        MODE_WATER: (WATER, np.array(_WATER_COLORS, dtype=np.uint8)),
+        MODE_DIRT: (DIRT, np.array(_DIRT_COLORS, dtype=np.uint8)),
+        MODE_GLASS: (GLASS, np.array(_GLASS_COLORS, dtype=np.uint8)),
+    }
+
+    # Spray brushes: mode → (ptype, palette, count, ±x spread, y min, y max).
+    # A palette of None means the current sand color.
+    _TAP_SPRAY = {
+        MODE_POUR: (HEAVY, None, 25, 5, -5, 2),
+        MODE_FIRE: (FIRE, _FIRE_COLORS, 15, 3, -2, 2),
+        MODE_NAPALM: (NAPALM, _NAPALM_COLORS, 15, 3, -2, 2),
+        MODE_GASOLINE: (GASOLINE, _GASOLINE_COLORS, 25, 5, -5, 2),
+        MODE_WATER: (WATER, _WATER_COLORS, 25, 5, -5, 2),
+        MODE_CONFETTI: (CONFETTI, _CONFETTI_COLORS, 25, 5, -5, 2),
+        MODE_POISON: (POISON, _POISON_COLORS, 15, 3, -3, 1),
+        MODE_HOLYWATER: (HOLYWATER, _HOLYWATER_COLORS, 20, 4, -4, 1),
+        MODE_MONEY: (MONEY, _MONEY_COLORS, 20, 4, -4, 1),
+        MODE_DIRT: (DIRT, _DIRT_COLORS, 25, 5, -5, 2),
+        MODE_MATCH: (MAGMA, _MAGMA_COLORS, 3, 1, -1, 0),
+        MODE_MAGMA: (MAGMA, _MAGMA_COLORS, 15, 3, -2, 2),
+        MODE_SEED: (SEED, _SEED_COLORS, 15, 4, -4, 2),
+        MODE_GRASS: (GRASSSEED, _GRASSSEED_COLORS, 5, 2, -2, 1),   # like regular seeds
+    }
+    # Pinch sprays are lighter — they repeat every frame while dragging
+    _PINCH_SPRAY = {
+        MODE_POUR: (HEAVY, None, 10, 3, -2, 1),
+        MODE_FIRE: (FIRE, _FIRE_COLORS, 8, 2, -2, 2),
+        MODE_NAPALM: (NAPALM, _NAPALM_COLORS, 8, 2, -2, 2),
+        MODE_GASOLINE: (GASOLINE, _GASOLINE_COLORS, 10, 3, -2, 1),
+        MODE_WATER: (WATER, _WATER_COLORS, 10, 3, -2, 1),
+        MODE_CONFETTI: (CONFETTI, _CONFETTI_COLORS, 10, 3, -2, 1),
+        MODE_POISON: (POISON, _POISON_COLORS, 8, 2, -2, 1),
+        MODE_HOLYWATER: (HOLYWATER, _HOLYWATER_COLORS, 10, 3, -2, 1),
+        MODE_MONEY: (MONEY, _MONEY_COLORS, 8, 3, -2, 1),
+        MODE_DIRT: (DIRT, _DIRT_COLORS, 10, 3, -2, 1),
+        MODE_MATCH: (MAGMA, _MAGMA_COLORS, 2, 1, -1, 0),
+        MODE_MAGMA: (MAGMA, _MAGMA_COLORS, 8, 2, -2, 2),
+        MODE_SEED: (SEED, _SEED_COLORS, 15, 4, -4, 2),             # clump per frame
+        MODE_GRASS: (GRASSSEED, _GRASSSEED_COLORS, 5, 2, -2, 1),
+    }
+
     def __init__(self, window_width, window_height):
         self.visible = False
         self._ww = window_width
@@ -3357,14 +3688,15 @@ class SandWindow:
         self._reverse_gravity = False
         self._sim_tick = 0
         self._sim_speed = 2              # modulo for sim stepping: 1=fast, 2=normal, 4=slow
+        self._sim_steps = 0              # sim steps taken — drives the crowd scan rotation
         self._last_tick = 0.0
         self._last_wall_gx = None
         self._last_wall_gy = None
         self._gnomes = []
-        self._gibs = []
-        self._sparks = []
+        self._gibs = _GibField()
+        self._sparks = _SparkField()
         self._buckshots = []
-        self._splash_drops = []
+        self._splash_drops = _SplashField()
         self._vine_tips = []
         self._worms = []
         self._bombs = []
@@ -3382,21 +3714,39 @@ class SandWindow:
         self._npc_left = pygame.image.load(_npath).convert_alpha()
         self._npc_right = pygame.transform.flip(self._npc_left, True, False)
         self._npc_cache = {}  # (w, h, dir) → scaled surface
-        self._poison_settle = {}        # (x,y) -> time when poison settled
-        self._gnome_spawned_this_pinch = False
-        self._fill_done_this_pinch = False
+        # (w, h, dir, tint) → fire-tinted sprite; sizes → parachute canopy
+        self._fire_tint_cache = {}
+        self._chute_cache = {}
+        # Per-cell time poison settled (-1 = not settled poison).  float64:
+        # time.time() values lose sub-second precision in float32
+        self._poison_settle = np.full((self._gh, self._gw), -1.0)
+        self._fill_stack = []           # flood-fill seed stack, reused per fill
+        # Brush scratch buffers (sprays use ≤ 25 points) and a dedicated RNG,
+        # so held-down brushes don't allocate fresh offset arrays every frame
+        self._rng = np.random.default_rng()
+        self._scratch_f = np.empty(64, dtype=np.float64)
+        self._scratch_x = np.empty(64, dtype=np.int32)
+        self._scratch_y = np.empty(64, dtype=np.int32)
+        self._pinch_once = 0
         self._held_gnome = None
         self._line_start_gx = None
         self._line_start_gy = None
+        # Grid image needs rebuilding; the zoomed upscale is stale until redone
+        self._sim_dirty = True
         self._pixel_surf = pygame.Surface((self._gw, self._gh))
-        self._scaled_surf = pygame.Surface((window_width, window_height))
         # Pre-allocate zoomed surface at max zoom to avoid per-frame allocation
         zw = int(window_width * _PLAYER_CAMERA_ZOOM) + 2
         zh = int(window_height * _PLAYER_CAMERA_ZOOM) + 2
         self._zoomed_surf = pygame.Surface((zw, zh))
+        self._zoomed_stale = True
         self._rgb_buf = np.zeros((self._gh, self._gw, 3), dtype=np.uint8)
+        self._mask_buf = np.zeros((self._gh, self._gw, 3), dtype=np.uint8)
+        self._mask_v3 = self._mask_buf.view('V3')[..., 0]   # (gh, gw) records
         self._font_small = pygame.font.Font(None, 24)
         self._font_title = pygame.font.Font(None, 36)
+        self._title_surf = self._font_title.render("DESERT SANDS", True, (255, 200, 100))
+        self._info_str = None            # last particle-count text and its render
+        self._info_surf = None
         self._sim_tick = 0               # frame counter for sim stepping
         self._menu_open = False          # collapsible tool menu
         self._player = None              # player-controlled character (_Player or None)
@@ -3406,7 +3756,32 @@ class SandWindow:
         self._cam_y = 0.0                # camera offset Y (pixels, smoothed)
         self._buttons = []
         self._menu_buttons = []          # buttons only visible when menu is open
+        self._ui_dirty = False           # button labels/highlights need refreshing
         self._build_buttons()
+        # Canvas tools that aren't plain sprays — mode → handler(gx, gy)
+        self._tap_handlers = {
+            self.MODE_HAND: self._grab_nearest_gnome,
+            **dict.fromkeys(self._SOLID_BRUSH, self._tap_solid),
+            self.MODE_GNOME: self._spawn_gnome,
+            self.MODE_BOMB: lambda gx, gy: self._drop_bomb(gx, gy, False),
+            self.MODE_FIREBOMB: lambda gx, gy: self._drop_bomb(gx, gy, True),
+            self.MODE_TREE: self._drop_tree_seed,
+            self.MODE_FILL: self._flood_fill,
+            self.MODE_BEE: self._spawn_beehive,
+        }
+        self._pinch_handlers = {
+            self.MODE_HAND: self._carry_gnome,
+            **dict.fromkeys(self._SOLID_BRUSH, self._pinch_solid),
+            self.MODE_ERASE: lambda gx, gy: self._state.erase_circle(gx, gy, 6),
+            # One-shot tools — fire once per pinch, not every frame
+            self.MODE_GNOME: lambda gx, gy: self._once_per_pinch(_PINCH_SPAWNED, self._spawn_gnome, gx, gy),
+            self.MODE_BOMB: lambda gx, gy: self._once_per_pinch(_PINCH_SPAWNED, self._drop_bomb, gx, gy, False),
+            self.MODE_FIREBOMB: lambda gx, gy: self._once_per_pinch(_PINCH_SPAWNED, self._drop_bomb, gx, gy, True),
+            self.MODE_TREE: lambda gx, gy: self._once_per_pinch(_PINCH_SPAWNED, self._drop_tree_seed, gx, gy),
+            self.MODE_WORM: lambda gx, gy: self._once_per_pinch(_PINCH_SPAWNED, self._spawn_worms, gx, gy),
+            self.MODE_BEE: lambda gx, gy: self._once_per_pinch(_PINCH_SPAWNED, self._spawn_beehive, gx, gy),
+            self.MODE_FILL: lambda gx, gy: self._once_per_pinch(_PINCH_FILLED, self._flood_fill, gx, gy),
+        }
 
     def _build_buttons(self):
         # ── Centered menu grid: 6 columns × 6 rows ──
@@ -3430,6 +3805,11 @@ class SandWindow:
         # Store panel rect for click-outside detection
         self._menu_panel_rect = pygame.Rect(ox - margin, oy - margin,
                                             grid_w + margin * 2, grid_h + margin * 2)
+        # Screen dim + panel backdrop never change size — build them once
+        self._menu_dim = pygame.Surface((self._ww, self._wh), pygame.SRCALPHA)
+        self._menu_dim.fill((0, 0, 0, 140))
+        self._menu_backdrop = pygame.Surface(self._menu_panel_rect.size, pygame.SRCALPHA)
+        self._menu_backdrop.fill((15, 15, 30, 230))
 
         def _place(row, col):
             return (ox + col * (bw + margin),
@@ -3586,6 +3966,64 @@ class SandWindow:
         # All buttons = menu toggle + menu items
         self._buttons = [self._btn_menu] + self._menu_buttons
 
+        # Tool button per mode — drives highlight and dispatch
+        self._tool_buttons = {
+            self.MODE_POUR: self._btn_pour,
+            self.MODE_HAND: self._btn_hand,
+            self.MODE_WOOD: self._btn_wood,
+            self.MODE_CONCRETE: self._btn_concrete,
+            self.MODE_ERASE: self._btn_erase,
+            self.MODE_GNOME: self._btn_gnome,
+            self.MODE_FIRE: self._btn_fire,
+            self.MODE_GUNPOWDER: self._btn_gunpowder,
+            self.MODE_NAPALM: self._btn_napalm,
+            self.MODE_GASOLINE: self._btn_gasoline,
+            self.MODE_WATER: self._btn_water,
+            self.MODE_CONFETTI: self._btn_confetti,
+            self.MODE_POISON: self._btn_poison,
+            self.MODE_HOLYWATER: self._btn_holywater,
+            self.MODE_ICE: self._btn_ice,
+            self.MODE_BOMB: self._btn_bomb,
+            self.MODE_MONEY: self._btn_money,
+            self.MODE_FIREBOMB: self._btn_firebomb,
+            self.MODE_DIRT: self._btn_dirt,
+            self.MODE_MATCH: self._btn_match,
+            self.MODE_MAGMA: self._btn_magma,
+            self.MODE_FILL: self._btn_fill,
+            self.MODE_SEED: self._btn_seed,
+            self.MODE_WORM: self._btn_worm,
+            self.MODE_GLASS: self._btn_glass,
+            self.MODE_BEE: self._btn_bee,
+            self.MODE_TREE: self._btn_tree,
+            self.MODE_GRASS: self._btn_grass,
+        }
+
+        # Menu dispatch — checked in order, first hit wins (hit boxes are
+        # inflated, so neighbouring buttons can overlap slightly)
+        def _tool(mode):
+            return lambda: self._select_mode(mode)
+        self._menu_actions = [
+            (self._btn_close_menu, self._close_menu),
+            (self._btn_quit, self._quit),
+            *((btn, _tool(mode)) for mode, btn in self._tool_buttons.items()),
+            (self._btn_player1, self._spawn_player1),
+            (self._btn_color, self._next_color),
+            (self._btn_wind, self._toggle_wind),
+            (self._btn_wind_dir, self._flip_wind_dir),
+            (self._btn_gravity, self._toggle_gravity),
+            (self._btn_slow, self._slow_down),
+            (self._btn_fast, self._speed_up),
+            (self._btn_clear, self._clear_world),
+        ]
+        # Same inflated hit boxes as _Button.hit, packed (x0, y0, x1, y1)
+        # so one vectorized compare tests every menu button at once
+        hit_rects = [btn.rect.inflate(20, 20) for btn, _ in self._menu_actions]
+        self._menu_rects = np.array([(r.left, r.top, r.right, r.bottom) for r in hit_rects],
+                                    dtype=np.int32)
+        # Bounding box of every hit box (the panel plus the hit margin):
+        # taps outside it can't land on a button, so skip the array test
+        self._menu_bounds = hit_rects[0].unionall(hit_rects[1:])
+
     def open(self):
         self.visible = True
         self._state = _SandState(self._gw, self._gh)
@@ -3599,14 +4037,15 @@ class SandWindow:
         self._reverse_gravity = False
         self._sim_tick = 0
         self._sim_speed = 2
+        self._sim_steps = 0
         self._last_tick = time.time()
         self._last_wall_gx = None
         self._last_wall_gy = None
         self._gnomes = []
-        self._gibs = []
-        self._sparks = []
+        self._gibs.clear()
+        self._sparks.clear()
         self._buckshots = []
-        self._splash_drops = []
+        self._splash_drops.clear()
         self._vine_tips = []
         self._worms = []
         self._bees = []
@@ -3614,12 +4053,12 @@ class SandWindow:
         self._missiles = []
         self._flame_particles = []
         self._homing_missiles = []
-        self._poison_settle = {}
-        self._gnome_spawned_this_pinch = False
-        self._fill_done_this_pinch = False
+        self._poison_settle.fill(-1.0)
+        self._pinch_once = 0
         self._held_gnome = None
         self._line_start_gx = None
         self._line_start_gy = None
+        self._sim_dirty = True
         self._menu_open = False
         self._player = None
         self._cam_zoom = 1.0
@@ -3636,62 +4075,16 @@ class SandWindow:
         self._color = _FUN_COLORS[self._color_idx]
 
     def _update_button_states(self):
+        self._ui_dirty = False
         # Clear line-start marker when switching modes
         self._line_start_gx = None
         self._line_start_gy = None
         # Update menu button label to show current tool
-        _mode_labels = {
-            self.MODE_POUR: "☰ SND", self.MODE_HAND: "☰ HND", self.MODE_WOOD: "☰ WOD",
-            self.MODE_CONCRETE: "☰ CON", self.MODE_ERASE: "☰ ERS", self.MODE_GNOME: "☰ GNM",
-            self.MODE_FIRE: "☰ FIR", self.MODE_GUNPOWDER: "☰ GUN", self.MODE_NAPALM: "☰ NAP",
-            self.MODE_GASOLINE: "☰ GAS", self.MODE_WATER: "☰ WTR", self.MODE_CONFETTI: "☰ CNF",
-            self.MODE_POISON: "☰ ZMB", self.MODE_HOLYWATER: "☰ HLY", self.MODE_ICE: "☰ ICE",
-            self.MODE_BOMB: "☰ BMB", self.MODE_MONEY: "☰ $$$", self.MODE_FIREBOMB: "☰ FBM",
-            self.MODE_DIRT: "☰ DRT", self.MODE_MATCH: "☰ MCH", self.MODE_MAGMA: "☰ MAG",
-            self.MODE_FILL: "☰ FIL", self.MODE_SEED: "☰ SED",
-            self.MODE_WORM: "☰ WRM", self.MODE_GLASS: "☰ GLS",
-            self.MODE_BEE: "☰ BEE",
-            self.MODE_TREE: "☰ TRE", self.MODE_GRASS: "☰ GRS",
-        }
-        self._btn_menu.label = _mode_labels.get(self._mode, "☰")
-        self._btn_pour.active = (self._mode == self.MODE_POUR)
-        self._btn_hand.active = (self._mode == self.MODE_HAND)
-        self._btn_wood.active = (self._mode == self.MODE_WOOD)
-        self._btn_concrete.active = (self._mode == self.MODE_CONCRETE)
-        self._btn_erase.active = (self._mode == self.MODE_ERASE)
-        self._btn_gnome.active = (self._mode == self.MODE_GNOME)
-        self._btn_fire.active = (self._mode == self.MODE_FIRE)
-        self._btn_gunpowder.active = (self._mode == self.MODE_GUNPOWDER)
-        self._btn_napalm.active = (self._mode == self.MODE_NAPALM)
-        self._btn_gasoline.active = (self._mode == self.MODE_GASOLINE)
-        self._btn_water.active = (self._mode == self.MODE_WATER)
-        self._btn_confetti.active = (self._mode == self.MODE_CONFETTI)
-        self._btn_poison.active = (self._mode == self.MODE_POISON)
-        self._btn_holywater.active = (self._mode == self.MODE_HOLYWATER)
-        self._btn_ice.active = (self._mode == self.MODE_ICE)
-        self._btn_bomb.active = (self._mode == self.MODE_BOMB)
-        self._btn_money.active = (self._mode == self.MODE_MONEY)
-        self._btn_firebomb.active = (self._mode == self.MODE_FIREBOMB)
-        self._btn_dirt.active = (self._mode == self.MODE_DIRT)
-        self._btn_match.active = (self._mode == self.MODE_MATCH)
-        self._btn_magma.active = (self._mode == self.MODE_MAGMA)
-        self._btn_fill.active = (self._mode == self.MODE_FILL)
-        self._btn_seed.active = (self._mode == self.MODE_SEED)
-        self._btn_worm.active = (self._mode == self.MODE_WORM)
-        self._btn_glass.active = (self._mode == self.MODE_GLASS)
-        self._btn_bee.active = (self._mode == self.MODE_BEE)
-        self._btn_tree.active = (self._mode == self.MODE_TREE)
-        self._btn_grass.active = (self._mode == self.MODE_GRASS)
+        self._btn_menu.label = self._MODE_LABELS.get(self._mode, "☰")
+        for mode, btn in self._tool_buttons.items():
+            btn.active = mode == self._mode
         # Show what material fill will use
-        _fill_names = {
-            self.MODE_POUR: "FILL:S",
-            self.MODE_WOOD: "FILL:Wd", self.MODE_CONCRETE: "FILL:C",
-            self.MODE_FIRE: "FILL:F", self.MODE_GUNPOWDER: "FILL:GP",
-            self.MODE_NAPALM: "FILL:N", self.MODE_GASOLINE: "FILL:G",
-            self.MODE_WATER: "FILL:Wt", self.MODE_DIRT: "FILL:D",
-            self.MODE_GLASS: "FILL:Gl",
-        }
-        self._btn_fill.label = _fill_names.get(self._fill_material, "FILL")
+        self._btn_fill.label = self._FILL_NAMES.get(self._fill_material, "FILL")
         self._btn_wind.active = self._wind_active
         self._btn_gravity.active = self._reverse_gravity
         self._btn_wind.label = "WIND ON" if self._wind_active else "WIND"
@@ -3699,22 +4092,42 @@ class SandWindow:
         self._btn_gravity.label = "GRV UP" if self._reverse_gravity else "GRAV"
         self._btn_color.swatch_color = self._color
         # Speed buttons — highlight when not at normal speed
-        _speed_labels = {1: "2x", 2: "1x", 3: ".6x", 4: ".5x", 6: ".3x"}
-        spd = _speed_labels.get(self._sim_speed, f"{2/self._sim_speed:.1f}x")
-        self._btn_slow.active = (self._sim_speed > 2)
-        self._btn_slow.label = f"SLO {spd}" if self._sim_speed > 2 else "SLOW"
-        self._btn_fast.active = (self._sim_speed < 2)
-        self._btn_fast.label = f"FST {spd}" if self._sim_speed < 2 else "FAST"
+        (self._btn_slow.label, self._btn_slow.active,
+         self._btn_fast.label, self._btn_fast.active) = self._SPEED_BUTTONS[self._sim_speed]
+
+    def _menu_hit(self, px, py):
+        """Index into _menu_actions of the first menu button under (px, py), or -1."""
+        px, py = int(px), int(py)
+        if not self._menu_bounds.collidepoint(px, py):
+            return -1
+        r = self._menu_rects
+        hits = (px >= r[:, 0]) & (px < r[:, 2]) & (py >= r[:, 1]) & (py < r[:, 3])
+        i = int(hits.argmax())
+        return i if hits[i] else -1
 
     def _in_ui_zone(self, px, py):
         if self._btn_menu.hit(px, py):
             return True
         if self._menu_open:
-            for btn in self._menu_buttons:
-                if btn.hit(px, py):
-                    return True
+            return self._menu_hit(px, py) >= 0
         return False
 
+    def _rand_ints(self, buf, n, lo, hi):
+        """Fill buf[:n] with uniform ints in [lo, hi] without allocating."""
+        f = self._scratch_f[:n]
+        self._rng.random(out=f)
+        f *= hi - lo + 1
+        out = buf[:n]
+        out[...] = f          # float → int truncates: 0 .. hi - lo
+        out += lo
+        return out
+
+    def _spray(self, ptype, palette, gx, gy, n, rx, ry0, ry1):
+        """Scatter n particles around (gx, gy): x within ±rx, y in [ry0, ry1]."""
+        xs = self._rand_ints(self._scratch_x, n, gx - rx, gx + rx)
+        ys = self._rand_ints(self._scratch_y, n, gy + ry0, gy + ry1)
+        self._state.add_batch(ptype, xs, ys, _sample_palette(palette, n))
+
     def _flood_fill(self, gx, gy):
         """Paint-bucket flood fill: fills contiguous EMPTY cells with the
         current fill material, bounded by any non-empty cell.
@@ -3726,69 +4139,43 @@ class SandWindow:
         if g[gy, gx] != EMPTY:
             return   # must click on an empty cell
 
-        # Determine fill type and color from _fill_material
-        mat = self._fill_material
-        if mat == self.MODE_POUR:
-            ptype, color_fn = HEAVY, lambda: self._color
-        elif mat == self.MODE_WALL:
-            ptype, color_fn = STATIC, lambda: _WALL_COLOR
-        elif mat == self.MODE_WOOD:
-            ptype, color_fn = WOOD, lambda: random.choice(_WOOD_COLORS)
-        elif mat == self.MODE_CONCRETE:
-            ptype, color_fn = CONCRETE, lambda: _CONCRETE_COLOR
-        elif mat == self.MODE_FIRE:
-            ptype, color_fn = FIRE, lambda: random.choice(_FIRE_COLORS)
-        elif mat == self.MODE_GUNPOWDER:
-            ptype, color_fn = GUNPOWDER, lambda: random.choice(_GUNPOWDER_COLORS)
-        elif mat == self.MODE_NAPALM:
-            ptype, color_fn = NAPALM, lambda: random.choice(_NAPALM_COLORS)
-        elif mat == self.MODE_GASOLINE:
-            ptype, color_fn = GASOLINE, lambda: random.choice(_GASOLINE_COLORS)
-        elif mat == self.MODE_WATER:
-            ptype, color_fn = WATER, lambda: random.choice(_WATER_COLORS)
-        elif mat == self.MODE_DIRT:
-            ptype, color_fn = DIRT, lambda: random.choice(_DIRT_COLORS)
-        elif mat == self.MODE_GLASS:
-            ptype, color_fn = GLASS, lambda: random.choice(_GLASS_COLORS)
-        else:
-            ptype, color_fn = HEAVY, lambda: self._color
-
-        # BFS flood fill
-        from collections import deque
-        queue = deque()
-        queue.append((gx, gy))
-        visited = set()
-        visited.add((gx, gy))
-        cap = 50000
+        # Fill type and color palette from _fill_material (None = sand color)
+        ptype, palette = self._FILL_MATERIALS.get(self._fill_material, (HEAVY, None))
+        if palette is None:
+            palette = np.array([self._color], dtype=np.uint8)
+
+        spans = _scanline_fill(g, gx, gy, ptype, 50000, self._fill_stack)
         filled = 0
-        while queue and filled < cap:
-            cx, cy = queue.popleft()
-            self._state.add(ptype, cx, cy, color_fn())
-            filled += 1
-            for dx, dy in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
-                nx, ny = cx + dx, cy + dy
-                if 0 <= nx < w and 0 <= ny < h and (nx, ny) not in visited:
-                    if g[ny, nx] == EMPTY:
-                        visited.add((nx, ny))
-                        queue.append((nx, ny))
+        if spans:
+            # Color every filled cell in one scatter: flat index of each
+            # span's cells, then a single palette draw for the lot.
+            sp = np.array(spans, dtype=np.int64)
+            lens = sp[:, 2] - sp[:, 1] + 1
+            filled = int(lens.sum())
+            first = sp[:, 0] * w + sp[:, 1]
+            idx = np.arange(filled) + np.repeat(first - (np.cumsum(lens) - lens), lens)
+            self._state.colors.reshape(-1, 3)[idx] = palette[np.random.randint(0, len(palette), filled)]
         if filled > 0:
             print(f"Flood fill: {filled} cells")
 
     def _try_destroy_parachute(self, px, py):
         """If (px, py) is near a gnome's open parachute, destroy it. Returns True if destroyed."""
-        for gnome in self._gnomes:
-            if not gnome.alive or not gnome.parachute_open:
-                continue
-            sx = int(gnome.gx * _CELL + _CELL // 2)
-            sy = int(gnome.gy * _CELL + _CELL) - 22
-            # Parachute canopy center is at roughly (sx, sy - 50)
-            chute_cx, chute_cy = sx, sy - 50
-            if math.hypot(px - chute_cx, py - chute_cy) < 30:
-                gnome.has_parachute = False
-                gnome.parachute_open = False
-                gnome.fall_start = time.time()  # reset fall timer for 1.4s death check
-                return True
-        return False
+        chutes = [g for g in self._gnomes if g.alive and g.parachute_open]
+        if not chutes:
+            return False
+        gxs, gys = _gnome_xy(chutes)
+        # Parachute canopy center is at roughly (sx, sy - 50)
+        chute_cx = np.trunc(gxs * _CELL + _CELL // 2)
+        chute_cy = np.trunc(gys * _CELL + _CELL) - 22 - 50
+        dx, dy = px - chute_cx, py - chute_cy
+        hits = np.flatnonzero(dx * dx + dy * dy < _CHUTE_RADIUS_SQ)
+        if not hits.size:
+            return False
+        gnome = chutes[hits[0]]
+        gnome.has_parachute = False
+        gnome.parachute_open = False
+        gnome.fall_start = time.time()  # reset fall timer for 1.4s death check
+        return True
 
     def _screen_to_world(self, px, py):
         """Convert screen pixel coords to world pixel coords (inverse camera)."""
@@ -3799,6 +4186,169 @@ class SandWindow:
             return wx, wy
         return px, py
 
+    # ── Menu actions ─────────────────────────────────────────────
+
+    def _select_mode(self, mode):
+        self._mode = mode
+        if mode in self._FILL_MATERIAL_MODES:
+            self._fill_material = mode
+        self._ui_dirty = True
+
+    def _close_menu(self):
+        self._menu_open = False
+        self._btn_menu.active = False
+
+    def _quit(self):
+        self.close()
+        print("Closed Sand (quit button)")
+
+    def _spawn_player1(self):
+        # Spawn player at center-top of screen
+        spawn_gx = self._gw // 2
+        spawn_gy = 10
+        self._player = _Player(spawn_gx, spawn_gy)
+        self._cam_target_zoom = _PLAYER_CAMERA_ZOOM
+        self._close_menu()
+        print("Player 1 spawned!")
+
+    def _next_color(self):
+        self.random_color()
+        self._ui_dirty = True
+
+    def _toggle_wind(self):
+        self._wind_active = not self._wind_active
+        self._ui_dirty = True
+
+    def _flip_wind_dir(self):
+        self._wind_dir *= -1
+        self._ui_dirty = True
+
+    def _toggle_gravity(self):
+        self._reverse_gravity = not self._reverse_gravity
+        self._ui_dirty = True
+
+    def _slow_down(self):
+        self._sim_speed = min(6, self._sim_speed + 1)
+        self._ui_dirty = True
+
+    def _speed_up(self):
+        self._sim_speed = max(1, self._sim_speed - 1)
+        self._ui_dirty = True
+
+    def _clear_world(self):
+        self._state.clear_all()
+        self._state.add_starting_platform()
+        self._gnomes = []
+        self._gibs.clear()
+        self._sparks.clear()
+        self._buckshots = []
+        self._splash_drops.clear()
+        self._vine_tips = []
+        self._worms = []
+        self._bees = []
+        self._bombs = []
+        self._missiles = []
+        self._flame_particles = []
+        self._homing_missiles = []
+        self._poison_settle.fill(-1.0)
+        self._player = None
+        self._cam_target_zoom = 1.0
+        self._sim_dirty = True
+        self._close_menu()
+
+    # ── Canvas tools ─────────────────────────────────────────────
+
+    def _stamp_block(self, ptype, palette, gx, gy, r):
+        """Solid square brush: 3×3 (r=1) or 5×5 (r=2) block at (gx, gy)."""
+        if r == 1:
+            dxs, dys = _BLOCK3_DX, _BLOCK3_DY
+        else:
+            dxs, dys = _BLOCK5_DX, _BLOCK5_DY
+        self._state.add_batch(ptype, gx + dxs, gy + dys, _sample_palette(palette, len(dxs)))
+
+    def _stamp_line(self, ptype, palette, x0, y0, x1, y1):
+        """3×3 block brush dragged along a Bresenham line, written in one go."""
+        lxs, lys = _bresenham(x0, y0, x1, y1)
+        xs = (lxs[:, None] + _BLOCK3_DX).ravel()
+        ys = (lys[:, None] + _BLOCK3_DY).ravel()
+        self._state.add_batch(ptype, xs, ys, _sample_palette(palette, len(xs)))
+
+    def _paint_line_brush(self, ptype, palette, gx, gy):
+        """3×3 solid brush that joins this pinch frame to the last one
+        with a Bresenham line, so fast drags leave no gaps."""
+        if (self._last_wall_gx is not None and self._last_wall_gy is not None
+                and abs(gx - self._last_wall_gx) <= 8
+                and abs(gy - self._last_wall_gy) <= 8):
+            self._stamp_line(ptype, palette, self._last_wall_gx, self._last_wall_gy, gx, gy)
+        else:
+            self._stamp_block(ptype, palette, gx, gy, 1)
+        self._last_wall_gx = gx
+        self._last_wall_gy = gy
+
+    def _tap_solid(self, gx, gy):
+        ptype, palette, r = self._SOLID_BRUSH[self._mode]
+        self._stamp_block(ptype, palette, gx, gy, r)
+
+    def _pinch_solid(self, gx, gy):
+        ptype, palette, _ = self._SOLID_BRUSH[self._mode]
+        self._paint_line_brush(ptype, palette, gx, gy)
+
+    def _grab_nearest_gnome(self, gx, gy):
+        # Pick up nearest gnome within 6 grid cells
+        if not self._gnomes:
+            return
+        gxs, gys = _gnome_xy(self._gnomes)
+        dx, dy = gxs - gx, gys - gy
+        d2 = dx * dx + dy * dy
+        i = int(d2.argmin())
+        if d2[i] < _HAND_RADIUS_SQ:
+            best = self._gnomes[i]
+            best.held = True
+            best.vy = 0.0
+            self._held_gnome = best
+
+    def _carry_gnome(self, gx, gy):
+        # Carry held gnome to cursor position, else try to grab one
+        if self._held_gnome and self._held_gnome.alive:
+            self._held_gnome.gx = float(gx)
+            self._held_gnome.gy = float(gy)
+        else:
+            self._grab_nearest_gnome(gx, gy)
+
+    def _spawn_gnome(self, gx, gy):
+        self._gnomes.append(_Gnome(gx, gy))
+
+    def _drop_bomb(self, gx, gy, is_fire):
+        self._state.erase_circle(gx, gy, 3)
+        self._bombs.append(_Bomb.spawn(gx, gy, is_fire=is_fire))
+
+    def _drop_tree_seed(self, gx, gy):
+        self._state.add(TREESEED, gx, gy, random.choice(_TREESEED_COLORS))
+
+    def _spawn_worms(self, gx, gy):
+        g = self._state.grid
+        h, w = g.shape
+        # Only spawn in dirt
+        if 0 <= gx < w and 0 <= gy < h and g[gy, gx] == DIRT:
+            worms = self._worms
+            for _ in range(3):
+                worms.append(_Worm(gx, gy))
+
+    def _spawn_beehive(self, gx, gy):
+        # Place rounded beehive (5×5 disc) in one batched write
+        self._state.add_batch(BEEHIVE, gx + _HIVE_DX, gy + _HIVE_DY,
+                              _sample_palette(_BEEHIVE_COLORS, len(_HIVE_DX)))
+        # Spawn 10-14 bees around the hive
+        bees = self._bees
+        for _ in range(random.randint(10, 14)):
+            bees.append(_Bee(gx, gy))
+
+    def _once_per_pinch(self, flag, fn, *args):
+        # Don't spawn continuously while pinching — only on first frame
+        if not self._pinch_once & flag:
+            fn(*args)
+            self._pinch_once |= flag
+
     def handle_tap(self, px, py):
         # Menu toggle — always active
         if self._btn_menu.hit(px, py):
@@ -3807,159 +4357,12 @@ class SandWindow:
             return
         # If menu is open, check menu buttons
         if self._menu_open:
-            if self._btn_close_menu.hit(px, py):
-                self._menu_open = False
-                self._btn_menu.active = False
-                return
-            if self._btn_quit.hit(px, py):
-                self.close()
-                print("Closed Sand (quit button)")
-                return
-            if self._btn_pour.hit(px, py):
-                self._mode = self.MODE_POUR
-                self._fill_material = self.MODE_POUR
-                self._update_button_states(); return
-            if self._btn_hand.hit(px, py):
-                self._mode = self.MODE_HAND
-                self._update_button_states(); return
-            if self._btn_wood.hit(px, py):
-                self._mode = self.MODE_WOOD
-                self._fill_material = self.MODE_WOOD
-                self._update_button_states(); return
-            if self._btn_concrete.hit(px, py):
-                self._mode = self.MODE_CONCRETE
-                self._fill_material = self.MODE_CONCRETE
-                self._update_button_states(); return
-            if self._btn_erase.hit(px, py):
-                self._mode = self.MODE_ERASE
-                self._update_button_states(); return
-            if self._btn_gnome.hit(px, py):
-                self._mode = self.MODE_GNOME
-                self._update_button_states(); return
-            if self._btn_fire.hit(px, py):
-                self._mode = self.MODE_FIRE
-                self._fill_material = self.MODE_FIRE
-                self._update_button_states(); return
-            if self._btn_gunpowder.hit(px, py):
-                self._mode = self.MODE_GUNPOWDER
-                self._fill_material = self.MODE_GUNPOWDER
-                self._update_button_states(); return
-            if self._btn_napalm.hit(px, py):
-                self._mode = self.MODE_NAPALM
-                self._fill_material = self.MODE_NAPALM
-                self._update_button_states(); return
-            if self._btn_gasoline.hit(px, py):
-                self._mode = self.MODE_GASOLINE
-                self._fill_material = self.MODE_GASOLINE
-                self._update_button_states(); return
-            if self._btn_water.hit(px, py):
-                self._mode = self.MODE_WATER
-                self._fill_material = self.MODE_WATER
-                self._update_button_states(); return
-            if self._btn_confetti.hit(px, py):
-                self._mode = self.MODE_CONFETTI
-                self._update_button_states(); return
-            if self._btn_poison.hit(px, py):
-                self._mode = self.MODE_POISON
-                self._update_button_states(); return
-            if self._btn_holywater.hit(px, py):
-                self._mode = self.MODE_HOLYWATER
-                self._update_button_states(); return
-            if self._btn_ice.hit(px, py):
-                self._mode = self.MODE_ICE
-                self._update_button_states(); return
-            if self._btn_bomb.hit(px, py):
-                self._mode = self.MODE_BOMB
-                self._update_button_states(); return
-            if self._btn_money.hit(px, py):
-                self._mode = self.MODE_MONEY
-                self._update_button_states(); return
-            if self._btn_firebomb.hit(px, py):
-                self._mode = self.MODE_FIREBOMB
-                self._update_button_states(); return
-            if self._btn_dirt.hit(px, py):
-                self._mode = self.MODE_DIRT
-                self._fill_material = self.MODE_DIRT
-                self._update_button_states(); return
-            if self._btn_match.hit(px, py):
-                self._mode = self.MODE_MATCH
-                self._update_button_states(); return
-            if self._btn_magma.hit(px, py):
-                self._mode = self.MODE_MAGMA
-                self._update_button_states(); return
-            if self._btn_fill.hit(px, py):
-                self._mode = self.MODE_FILL
-                self._update_button_states(); return
-            if self._btn_seed.hit(px, py):
-                self._mode = self.MODE_SEED
-                self._update_button_states(); return
-            if self._btn_worm.hit(px, py):
-                self._mode = self.MODE_WORM
-                self._update_button_states(); return
-            if self._btn_glass.hit(px, py):
-                self._mode = self.MODE_GLASS
-                self._fill_material = self.MODE_GLASS
-                self._update_button_states(); return
-            if self._btn_bee.hit(px, py):
-                self._mode = self.MODE_BEE
-                self._update_button_states(); return
-            if self._btn_tree.hit(px, py):
-                self._mode = self.MODE_TREE
-                self._update_button_states(); return
-            if self._btn_grass.hit(px, py):
-                self._mode = self.MODE_GRASS
-                self._update_button_states(); return
-            if self._btn_player1.hit(px, py):
-                # Spawn player at center-top of screen
-                spawn_gx = self._gw // 2
-                spawn_gy = 10
-                self._player = _Player(spawn_gx, spawn_gy)
-                self._cam_target_zoom = _PLAYER_CAMERA_ZOOM
-                self._menu_open = False
-                self._btn_menu.active = False
-                print("Player 1 spawned!")
-                return
-            if self._btn_color.hit(px, py):
-                self.random_color()
-                self._update_button_states(); return
-            if self._btn_wind.hit(px, py):
-                self._wind_active = not self._wind_active
-                self._update_button_states(); return
-            if self._btn_wind_dir.hit(px, py):
-                self._wind_dir *= -1
-                self._update_button_states(); return
-            if self._btn_gravity.hit(px, py):
-                self._reverse_gravity = not self._reverse_gravity
-                self._update_button_states(); return
-            if self._btn_slow.hit(px, py):
-                self._sim_speed = min(6, self._sim_speed + 1)
-                self._update_button_states(); return
-            if self._btn_fast.hit(px, py):
-                self._sim_speed = max(1, self._sim_speed - 1)
-                self._update_button_states(); return
-            if self._btn_clear.hit(px, py):
-                self._state.clear_all()
-                self._state.add_starting_platform()
-                self._gnomes = []
-                self._gibs = []
-                self._sparks = []
-                self._buckshots = []
-                self._splash_drops = []
-                self._vine_tips = []
-                self._worms = []
-                self._bees = []
-                self._bombs = []
-                self._missiles = []
-                self._flame_particles = []
-                self._homing_missiles = []
-                self._poison_settle = {}
-                self._player = None
-                self._cam_target_zoom = 1.0
-                self._menu_open = False; self._btn_menu.active = False
+            i = self._menu_hit(px, py)
+            if i >= 0:
+                self._menu_actions[i][1]()
                 return
             # Click outside menu panel closes it
-            self._menu_open = False
-            self._btn_menu.active = False
+            self._close_menu()
             return
         # Menu is closed — canvas interaction
         # Transform screen coords to world coords (inverse camera transform)
@@ -3968,141 +4371,17 @@ class SandWindow:
             # Check if clicking on a parachute — destroy it regardless of mode
             if self._try_destroy_parachute(px, py):
                 return
+            self._sim_dirty = True
             gx, gy = int(px) // _CELL, int(py) // _CELL
-            if self._mode == self.MODE_POUR:
-                for _ in range(25):
-                    rx = gx + random.randint(-5, 5)
-                    ry = gy + random.randint(-5, 2)
-                    self._state.add(HEAVY, rx, ry, self._color)
-            elif self._mode == self.MODE_HAND:
-                # Pick up nearest gnome within 6 grid cells
-                best, best_d = None, 6.0
-                for gnome in self._gnomes:
-                    d = math.hypot(gnome.gx - gx, gnome.gy - gy)
-                    if d < best_d:
-                        best_d = d
-                        best = gnome
-                if best:
-                    best.held = True
-                    best.vy = 0.0
-                    self._held_gnome = best
-            elif self._mode == self.MODE_WOOD:
-                for dx in range(-1, 2):
-                    for dy in range(-1, 2):
-                        self._state.add(WOOD, gx + dx, gy + dy, random.choice(_WOOD_COLORS))
-            elif self._mode == self.MODE_CONCRETE:
-                for dx in range(-1, 2):
-                    for dy in range(-1, 2):
-                        self._state.add(CONCRETE, gx + dx, gy + dy, _CONCRETE_COLOR)
-            elif self._mode == self.MODE_GLASS:
-                for dx in range(-1, 2):
-                    for dy in range(-1, 2):
-                        self._state.add(GLASS, gx + dx, gy + dy, random.choice(_GLASS_COLORS))
-            elif self._mode == self.MODE_GNOME:
-                self._gnomes.append(_Gnome(gx, gy))
-            elif self._mode == self.MODE_FIRE:
-                for _ in range(15):
-                    rx = gx + random.randint(-3, 3)
-                    ry = gy + random.randint(-2, 2)
-                    self._state.add(FIRE, rx, ry, random.choice(_FIRE_COLORS))
-            elif self._mode == self.MODE_GUNPOWDER:
-                # Paint gunpowder as a static fuse line (like wood)
-                for dx in range(-1, 2):
-                    for dy in range(-1, 2):
-                        self._state.add(GUNPOWDER, gx + dx, gy + dy, random.choice(_GUNPOWDER_COLORS))
-            elif self._mode == self.MODE_NAPALM:
-                for _ in range(15):
-                    rx = gx + random.randint(-3, 3)
-                    ry = gy + random.randint(-2, 2)
-                    self._state.add(NAPALM, rx, ry, random.choice(_NAPALM_COLORS))
-            elif self._mode == self.MODE_GASOLINE:
-                for _ in range(25):
-                    rx = gx + random.randint(-5, 5)
-                    ry = gy + random.randint(-5, 2)
-                    self._state.add(GASOLINE, rx, ry, random.choice(_GASOLINE_COLORS))
-            elif self._mode == self.MODE_WATER:
-                for _ in range(25):
-                    rx = gx + random.randint(-5, 5)
-                    ry = gy + random.randint(-5, 2)
-                    self._state.add(WATER, rx, ry, random.choice(_WATER_COLORS))
-            elif self._mode == self.MODE_CONFETTI:
-                for _ in range(25):
-                    rx = gx + random.randint(-5, 5)
-                    ry = gy + random.randint(-5, 2)
-                    self._state.add(CONFETTI, rx, ry, random.choice(_CONFETTI_COLORS))
-            elif self._mode == self.MODE_POISON:
-                for _ in range(15):
-                    rx = gx + random.randint(-3, 3)
-                    ry = gy + random.randint(-3, 1)
-                    self._state.add(POISON, rx, ry, random.choice(_POISON_COLORS))
-            elif self._mode == self.MODE_HOLYWATER:
-                for _ in range(20):
-                    rx = gx + random.randint(-4, 4)
-                    ry = gy + random.randint(-4, 1)
-                    self._state.add(HOLYWATER, rx, ry, random.choice(_HOLYWATER_COLORS))
-            elif self._mode == self.MODE_ICE:
-                for dx in range(-2, 3):
-                    for dy in range(-2, 3):
-                        self._state.add(ICE, gx + dx, gy + dy, random.choice(_ICE_COLORS))
-            elif self._mode == self.MODE_BOMB:
-                self._state.erase_circle(gx, gy, 3)
-                self._bombs.append(_Bomb(gx, gy))
-            elif self._mode == self.MODE_FIREBOMB:
-                self._state.erase_circle(gx, gy, 3)
-                self._bombs.append(_Bomb(gx, gy, is_fire=True))
-            elif self._mode == self.MODE_MONEY:
-                for _ in range(20):
-                    rx = gx + random.randint(-4, 4)
-                    ry = gy + random.randint(-4, 1)
-                    self._state.add(MONEY, rx, ry, random.choice(_MONEY_COLORS))
-            elif self._mode == self.MODE_DIRT:
-                for _ in range(25):
-                    rx = gx + random.randint(-5, 5)
-                    ry = gy + random.randint(-5, 2)
-                    self._state.add(DIRT, rx, ry, random.choice(_DIRT_COLORS))
-            elif self._mode == self.MODE_MATCH:
-                for _ in range(3):
-                    rx = gx + random.randint(-1, 1)
-                    ry = gy + random.randint(-1, 0)
-                    self._state.add(MAGMA, rx, ry, random.choice(_MAGMA_COLORS))
-            elif self._mode == self.MODE_MAGMA:
-                for _ in range(15):
-                    rx = gx + random.randint(-3, 3)
-                    ry = gy + random.randint(-2, 2)
-                    self._state.add(MAGMA, rx, ry, random.choice(_MAGMA_COLORS))
-            elif self._mode == self.MODE_SEED:
-                for _ in range(15):
-                    rx = gx + random.randint(-4, 4)
-                    ry = gy + random.randint(-4, 2)
-                    self._state.add(SEED, rx, ry, random.choice(_SEED_COLORS))
-            elif self._mode == self.MODE_TREE:
-                # Drop one tree seed
-                self._state.add(TREESEED, gx, gy, random.choice(_TREESEED_COLORS))
-            elif self._mode == self.MODE_GRASS:
-                # Drop grass seeds like regular seeds
-                for _ in range(5):
-                    rx = gx + random.randint(-2, 2)
-                    ry = gy + random.randint(-2, 1)
-                    self._state.add(GRASSSEED, rx, ry, random.choice(_GRASSSEED_COLORS))
-            elif self._mode == self.MODE_FILL:
-                self._flood_fill(gx, gy)
-            elif self._mode == self.MODE_BEE:
-                # Spawn beehive + bees on tap
-                g = self._state.grid
-                c = self._state.colors
-                h, w = g.shape
-                # Place rounded beehive (5×5 disc)
-                for dy in range(-2, 3):
-                    for dx in range(-2, 3):
-                        if abs(dx) == 2 and abs(dy) == 2:
-                            continue  # skip corners for roundness
-                        bx, by = gx + dx, gy + dy
-                        if 0 <= bx < w and 0 <= by < h:
-                            g[by, bx] = BEEHIVE
-                            c[by, bx] = random.choice(_BEEHIVE_COLORS)
-                num_bees = random.randint(10, 14)
-                for _ in range(num_bees):
-                    self._bees.append(_Bee(gx, gy))
+            mode = self._mode
+            spray = self._TAP_SPRAY.get(mode)
+            if spray is not None:
+                ptype, palette, n, rx, ry0, ry1 = spray
+                self._spray(ptype, palette or (self._color,), gx, gy, n, rx, ry0, ry1)
+                return
+            handler = self._tap_handlers.get(mode)
+            if handler is not None:
+                handler(gx, gy)
 
     def handle_pinch(self, px, py):
         # Transform screen coords to world coords (inverse camera transform)
@@ -4114,277 +4393,20 @@ class SandWindow:
         gx, gy = int(px) // _CELL, int(py) // _CELL
         # Check if pinching on a parachute — destroy it regardless of mode
         self._try_destroy_parachute(px, py)
-        if self._mode == self.MODE_POUR:
-            for _ in range(10):
-                rx = gx + random.randint(-3, 3)
-                ry = gy + random.randint(-2, 1)
-                self._state.add(HEAVY, rx, ry, self._color)
-            self._last_wall_gx = None
-            self._last_wall_gy = None
-        elif self._mode == self.MODE_HAND:
-            # Carry held gnome to cursor position
-            if self._held_gnome and self._held_gnome.alive:
-                self._held_gnome.gx = float(gx)
-                self._held_gnome.gy = float(gy)
-            else:
-                # Try to grab nearest gnome
-                best, best_d = None, 6.0
-                for gnome in self._gnomes:
-                    d = math.hypot(gnome.gx - gx, gnome.gy - gy)
-                    if d < best_d:
-                        best_d = d
-                        best = gnome
-                if best:
-                    best.held = True
-                    best.vy = 0.0
-                    self._held_gnome = best
-            self._last_wall_gx = None
-            self._last_wall_gy = None
-        elif self._mode == self.MODE_WOOD:
-            if (self._last_wall_gx is not None and self._last_wall_gy is not None
-                    and abs(gx - self._last_wall_gx) <= 8
-                    and abs(gy - self._last_wall_gy) <= 8):
-                line_pts = _bresenham(self._last_wall_gx, self._last_wall_gy, gx, gy)
-                for lx, ly in line_pts:
-                    for dx in range(-1, 2):
-                        for dy in range(-1, 2):
-                            self._state.add(WOOD, lx + dx, ly + dy, random.choice(_WOOD_COLORS))
-            else:
-                for dx in range(-1, 2):
-                    for dy in range(-1, 2):
-                        self._state.add(WOOD, gx + dx, gy + dy, random.choice(_WOOD_COLORS))
-            self._last_wall_gx = gx
-            self._last_wall_gy = gy
-        elif self._mode == self.MODE_CONCRETE:
-            if (self._last_wall_gx is not None and self._last_wall_gy is not None
-                    and abs(gx - self._last_wall_gx) <= 8
-                    and abs(gy - self._last_wall_gy) <= 8):
-                line_pts = _bresenham(self._last_wall_gx, self._last_wall_gy, gx, gy)
-                for lx, ly in line_pts:
-                    for dx in range(-1, 2):
-                        for dy in range(-1, 2):
-                            self._state.add(CONCRETE, lx + dx, ly + dy, _CONCRETE_COLOR)
-            else:
-                for dx in range(-1, 2):
-                    for dy in range(-1, 2):
-                        self._state.add(CONCRETE, gx + dx, gy + dy, _CONCRETE_COLOR)
-            self._last_wall_gx = gx
-            self._last_wall_gy = gy
-        elif self._mode == self.MODE_GLASS:
-            if (self._last_wall_gx is not None and self._last_wall_gy is not None
-                    and abs(gx - self._last_wall_gx) <= 8
-                    and abs(gy - self._last_wall_gy) <= 8):
-                line_pts = _bresenham(self._last_wall_gx, self._last_wall_gy, gx, gy)
-                for lx, ly in line_pts:
-                    for dx in range(-1, 2):
-                        for dy in range(-1, 2):
-                            self._state.add(GLASS, lx + dx, ly + dy, random.choice(_GLASS_COLORS))
-            else:
-                for dx in range(-1, 2):
-                    for dy in range(-1, 2):
-                        self._state.add(GLASS, gx + dx, gy + dy, random.choice(_GLASS_COLORS))
-            self._last_wall_gx = gx
-            self._last_wall_gy = gy
-        elif self._mode == self.MODE_ERASE:
-            self._state.erase_circle(gx, gy, 6)
-            self._last_wall_gx = None
-            self._last_wall_gy = None
-        elif self._mode == self.MODE_GNOME:
-            # Don't spawn continuously while pinching — only on first frame
-            if not getattr(self, '_gnome_spawned_this_pinch', False):
-                self._gnomes.append(_Gnome(gx, gy))
-                self._gnome_spawned_this_pinch = True
-            self._last_wall_gx = None
-            self._last_wall_gy = None
-        elif self._mode == self.MODE_FIRE:
-            for _ in range(8):
-                rx = gx + random.randint(-2, 2)
-                ry = gy + random.randint(-2, 2)
-                self._state.add(FIRE, rx, ry, random.choice(_FIRE_COLORS))
-            self._last_wall_gx = None
-            self._last_wall_gy = None
-        elif self._mode == self.MODE_GUNPOWDER:
-            # Paint gunpowder as a static fuse line (like wood, with interpolation)
-            if (self._last_wall_gx is not None and self._last_wall_gy is not None
-                    and abs(gx - self._last_wall_gx) <= 8
-                    and abs(gy - self._last_wall_gy) <= 8):
-                line_pts = _bresenham(self._last_wall_gx, self._last_wall_gy, gx, gy)
-                for lx, ly in line_pts:
-                    for dx in range(-1, 2):
-                        for dy in range(-1, 2):
-                            self._state.add(GUNPOWDER, lx + dx, ly + dy, random.choice(_GUNPOWDER_COLORS))
-            else:
-                for dx in range(-1, 2):
-                    for dy in range(-1, 2):
-                        self._state.add(GUNPOWDER, gx + dx, gy + dy, random.choice(_GUNPOWDER_COLORS))
-            self._last_wall_gx = gx
-            self._last_wall_gy = gy
-        elif self._mode == self.MODE_NAPALM:
-            for _ in range(8):
-                rx = gx + random.randint(-2, 2)
-                ry = gy + random.randint(-2, 2)
-                self._state.add(NAPALM, rx, ry, random.choice(_NAPALM_COLORS))
-            self._last_wall_gx = None
-            self._last_wall_gy = None
-        elif self._mode == self.MODE_GASOLINE:
-            for _ in range(10):
-                rx = gx + random.randint(-3, 3)
-                ry = gy + random.randint(-2, 1)
-                self._state.add(GASOLINE, rx, ry, random.choice(_GASOLINE_COLORS))
-            self._last_wall_gx = None
-            self._last_wall_gy = None
-        elif self._mode == self.MODE_WATER:
-            for _ in range(10):
-                rx = gx + random.randint(-3, 3)
-                ry = gy + random.randint(-2, 1)
-                self._state.add(WATER, rx, ry, random.choice(_WATER_COLORS))
-            self._last_wall_gx = None
-            self._last_wall_gy = None
-        elif self._mode == self.MODE_CONFETTI:
-            for _ in range(10):
-                rx = gx + random.randint(-3, 3)
-                ry = gy + random.randint(-2, 1)
-                self._state.add(CONFETTI, rx, ry, random.choice(_CONFETTI_COLORS))
-            self._last_wall_gx = None
-            self._last_wall_gy = None
-        elif self._mode == self.MODE_POISON:
-            for _ in range(8):
-                rx = gx + random.randint(-2, 2)
-                ry = gy + random.randint(-2, 1)
-                self._state.add(POISON, rx, ry, random.choice(_POISON_COLORS))
-            self._last_wall_gx = None
-            self._last_wall_gy = None
-        elif self._mode == self.MODE_HOLYWATER:
-            for _ in range(10):
-                rx = gx + random.randint(-3, 3)
-                ry = gy + random.randint(-2, 1)
-                self._state.add(HOLYWATER, rx, ry, random.choice(_HOLYWATER_COLORS))
-            self._last_wall_gx = None
-            self._last_wall_gy = None
-        elif self._mode == self.MODE_ICE:
-            # Ice is placed like concrete — solid blocks, connected via bresenham
-            if (self._last_wall_gx is not None and self._last_wall_gy is not None
-                    and abs(gx - self._last_wall_gx) <= 8
-                    and abs(gy - self._last_wall_gy) <= 8):
-                line_pts = _bresenham(self._last_wall_gx, self._last_wall_gy, gx, gy)
-                for lx, ly in line_pts:
-                    for dx in range(-1, 2):
-                        for dy in range(-1, 2):
-                            self._state.add(ICE, lx + dx, ly + dy, random.choice(_ICE_COLORS))
-            else:
-                for dx in range(-1, 2):
-                    for dy in range(-1, 2):
-                        self._state.add(ICE, gx + dx, gy + dy, random.choice(_ICE_COLORS))
-            self._last_wall_gx = gx
-            self._last_wall_gy = gy
-        elif self._mode == self.MODE_BOMB:
-            # One bomb per pinch — don't spawn continuously
-            if not getattr(self, '_gnome_spawned_this_pinch', False):
-                self._state.erase_circle(gx, gy, 3)
-                self._bombs.append(_Bomb(gx, gy))
-                self._gnome_spawned_this_pinch = True
-            self._last_wall_gx = None
-            self._last_wall_gy = None
-        elif self._mode == self.MODE_FIREBOMB:
-            # One firebomb per pinch
-            if not getattr(self, '_gnome_spawned_this_pinch', False):
-                self._state.erase_circle(gx, gy, 3)
-                self._bombs.append(_Bomb(gx, gy, is_fire=True))
-                self._gnome_spawned_this_pinch = True
-            self._last_wall_gx = None
-            self._last_wall_gy = None
-        elif self._mode == self.MODE_MONEY:
-            for _ in range(8):
-                rx = gx + random.randint(-3, 3)
-                ry = gy + random.randint(-2, 1)
-                self._state.add(MONEY, rx, ry, random.choice(_MONEY_COLORS))
-            self._last_wall_gx = None
-            self._last_wall_gy = None
-        elif self._mode == self.MODE_DIRT:
-            for _ in range(10):
-                rx = gx + random.randint(-3, 3)
-                ry = gy + random.randint(-2, 1)
-                self._state.add(DIRT, rx, ry, random.choice(_DIRT_COLORS))
-            self._last_wall_gx = None
-            self._last_wall_gy = None
-        elif self._mode == self.MODE_MATCH:
-            for _ in range(2):
-                rx = gx + random.randint(-1, 1)
-                ry = gy + random.randint(-1, 0)
-                self._state.add(MAGMA, rx, ry, random.choice(_MAGMA_COLORS))
-            self._last_wall_gx = None
-            self._last_wall_gy = None
-        elif self._mode == self.MODE_MAGMA:
-            for _ in range(8):
-                rx = gx + random.randint(-2, 2)
-                ry = gy + random.randint(-2, 2)
-                self._state.add(MAGMA, rx, ry, random.choice(_MAGMA_COLORS))
-            self._last_wall_gx = None
-            self._last_wall_gy = None
-        elif self._mode == self.MODE_FILL:
-            # One-shot fill per pinch, same as gnome
-            if not getattr(self, '_fill_done_this_pinch', False):
-                self._flood_fill(gx, gy)
-                self._fill_done_this_pinch = True
-            self._last_wall_gx = None
-            self._last_wall_gy = None
-        elif self._mode == self.MODE_SEED:
-            # Drop a clump of seeds each frame while dragging
-            for _ in range(15):
-                rx = gx + random.randint(-4, 4)
-                ry = gy + random.randint(-4, 2)
-                self._state.add(SEED, rx, ry, random.choice(_SEED_COLORS))
-            self._last_wall_gx = None
-            self._last_wall_gy = None
-        elif self._mode == self.MODE_TREE:
-            # Drop one tree seed — one-shot per pinch
-            if not getattr(self, '_gnome_spawned_this_pinch', False):
-                self._state.add(TREESEED, gx, gy, random.choice(_TREESEED_COLORS))
-                self._gnome_spawned_this_pinch = True
-            self._last_wall_gx = None
-            self._last_wall_gy = None
-        elif self._mode == self.MODE_GRASS:
-            # Drop grass seeds like regular seeds
-            for _ in range(5):
-                rx = gx + random.randint(-2, 2)
-                ry = gy + random.randint(-2, 1)
-                self._state.add(GRASSSEED, rx, ry, random.choice(_GRASSSEED_COLORS))
-            self._last_wall_gx = None
-            self._last_wall_gy = None
-        elif self._mode == self.MODE_WORM:
-            # Spawn 3 worms at click location — one-shot per pinch
-            if not getattr(self, '_gnome_spawned_this_pinch', False):
-                g = self._state.grid
-                h, w = g.shape
-                # Only spawn in dirt
-                if 0 <= gx < w and 0 <= gy < h and g[gy, gx] == DIRT:
-                    for _ in range(3):
-                        self._worms.append(_Worm(gx, gy))
-                self._gnome_spawned_this_pinch = True
-            self._last_wall_gx = None
-            self._last_wall_gy = None
-        elif self._mode == self.MODE_BEE:
-            # Spawn beehive + bees — one-shot per pinch
-            if not getattr(self, '_gnome_spawned_this_pinch', False):
-                g = self._state.grid
-                c = self._state.colors
-                h, w = g.shape
-                # Place rounded beehive (5×5 disc)
-                for dy in range(-2, 3):
-                    for dx in range(-2, 3):
-                        if abs(dx) == 2 and abs(dy) == 2:
-                            continue  # skip corners for roundness
-                        bx, by = gx + dx, gy + dy
-                        if 0 <= bx < w and 0 <= by < h:
-                            g[by, bx] = BEEHIVE
-                            c[by, bx] = random.choice(_BEEHIVE_COLORS)
-                # Spawn 10-14 bees around the hive
-                num_bees = random.randint(10, 14)
-                for _ in range(num_bees):
-                    self._bees.append(_Bee(gx, gy))
-                self._gnome_spawned_this_pinch = True
+        self._sim_dirty = True
+        mode = self._mode
+        if mode not in self._SOLID_BRUSH:
+            # Only the interpolating solid brushes keep a stroke anchor
             self._last_wall_gx = None
             self._last_wall_gy = None
+        spray = self._PINCH_SPRAY.get(mode)
+        if spray is not None:
+            ptype, palette, n, rx, ry0, ry1 = spray
+            self._spray(ptype, palette or (self._color,), gx, gy, n, rx, ry0, ry1)
+            return
+        handler = self._pinch_handlers.get(mode)
+        if handler is not None:
+            handler(gx, gy)
 
     def handle_double_click(self, px, py):
         """Double-click line tool: first click sets start, second draws line."""
@@ -4393,7 +4415,7 @@ class SandWindow:
         if self._in_ui_zone(px, py):
             return
         # Only works for solid painting modes
-        if self._mode not in (self.MODE_WOOD, self.MODE_CONCRETE, self.MODE_ICE, self.MODE_GUNPOWDER, self.MODE_GLASS):
+        if self._mode not in self._SOLID_BRUSH:
             return
         gx, gy = int(px) // _CELL, int(py) // _CELL
         if self._line_start_gx is None:
@@ -4402,38 +4424,14 @@ class SandWindow:
             self._line_start_gy = gy
         else:
             # Second double-click — draw line from start to here
-            line_pts = _bresenham(self._line_start_gx, self._line_start_gy, gx, gy)
-            if self._mode == self.MODE_WOOD:
-                for lx, ly in line_pts:
-                    for dx in range(-1, 2):
-                        for dy in range(-1, 2):
-                            self._state.add(WOOD, lx + dx, ly + dy, random.choice(_WOOD_COLORS))
-            elif self._mode == self.MODE_CONCRETE:
-                for lx, ly in line_pts:
-                    for dx in range(-1, 2):
-                        for dy in range(-1, 2):
-                            self._state.add(CONCRETE, lx + dx, ly + dy, _CONCRETE_COLOR)
-            elif self._mode == self.MODE_ICE:
-                for lx, ly in line_pts:
-                    for dx in range(-1, 2):
-                        for dy in range(-1, 2):
-                            self._state.add(ICE, lx + dx, ly + dy, random.choice(_ICE_COLORS))
-            elif self._mode == self.MODE_GUNPOWDER:
-                for lx, ly in line_pts:
-                    for dx in range(-1, 2):
-                        for dy in range(-1, 2):
-                            self._state.add(GUNPOWDER, lx + dx, ly + dy, random.choice(_GUNPOWDER_COLORS))
-            elif self._mode == self.MODE_GLASS:
-                for lx, ly in line_pts:
-                    for dx in range(-1, 2):
-                        for dy in range(-1, 2):
-                            self._state.add(GLASS, lx + dx, ly + dy, random.choice(_GLASS_COLORS))
+            ptype, palette, _ = self._SOLID_BRUSH[self._mode]
+            self._stamp_line(ptype, palette, self._line_start_gx, self._line_start_gy, gx, gy)
+            self._sim_dirty = True
             self._line_start_gx = None
             self._line_start_gy = None
 
     def handle_pinch_end(self):
-        self._gnome_spawned_this_pinch = False
-        self._fill_done_this_pinch = False
+        self._pinch_once = 0
         self._last_wall_gx = None
         self._last_wall_gy = None
         # Drop held gnome
@@ -4450,19 +4448,17 @@ class SandWindow:
         MODE_GNOME, MODE_FIRE, MODE_GUNPOWDER, MODE_NAPALM, MODE_GASOLINE,
         MODE_WATER, MODE_CONFETTI, MODE_POISON, MODE_HOLYWATER, MODE_ICE, MODE_BOMB, MODE_FIREBOMB, MODE_MONEY, MODE_DIRT, MODE_MATCH, MODE_MAGMA, MODE_FILL, MODE_SEED, MODE_WORM, MODE_GLASS, MODE_BEE, MODE_TREE, MODE_GRASS,
     ]
+    _SCROLL_MODE_INDEX = {m: i for i, m in enumerate(_SCROLL_MODES)}
 
     def handle_scroll(self, direction):
         """Cycle through tool modes. direction: +1 = next, -1 = previous."""
-        try:
-            idx = self._SCROLL_MODES.index(self._mode)
-        except ValueError:
-            idx = 0
+        idx = self._SCROLL_MODE_INDEX.get(self._mode, 0)
         idx = (idx + direction) % len(self._SCROLL_MODES)
         self._mode = self._SCROLL_MODES[idx]
         # Update fill material for material modes
-        if self._mode not in (self.MODE_ERASE, self.MODE_GNOME, self.MODE_HAND, self.MODE_FILL, self.MODE_CONFETTI, self.MODE_POISON, self.MODE_HOLYWATER, self.MODE_ICE, self.MODE_BOMB, self.MODE_FIREBOMB, self.MODE_MONEY, self.MODE_MATCH, self.MODE_MAGMA, self.MODE_SEED, self.MODE_WORM, self.MODE_BEE, self.MODE_TREE, self.MODE_GRASS):
+        if self._mode in self._FILL_MATERIAL_MODES:
             self._fill_material = self._mode
-        self._update_button_states()
+        self._ui_dirty = True
 
     def handle_key(self, key, down):
         """Handle keyboard input for the player character.
@@ -4506,7 +4502,45 @@ class SandWindow:
                 # Q released — release the hook
                 self._player.release_hook()
 
+    def _fire_tinted(self, sprite, key):
+        """Burning variant of a cached sprite: one of the _FIRE_TINTS
+        multiplied in, built once per (sprite key, tint) rather than a
+        copy, overlay and blend per burning gnome every frame."""
+        tint = random.randrange(len(_FIRE_TINTS))
+        tkey = key + (tint,)
+        tinted = self._fire_tint_cache.get(tkey)
+        if tinted is None:
+            tinted = sprite.copy()
+            overlay = pygame.Surface(sprite.get_size(), pygame.SRCALPHA)
+            overlay.fill(_FIRE_TINTS[tint])
+            tinted.blit(overlay, (0, 0), special_flags=pygame.BLEND_RGBA_MULT)
+            self._fire_tint_cache[tkey] = tinted
+        return tinted
+
+    def _chute_sprite(self, z):
+        """Parachute canopy and strings at zoom z, pre-drawn once per size.
+        Blitted with its top-left at (sx - pw // 2, nsy - int(24 * z))."""
+        pw, ph = int(50 * z), int(40 * z)
+        top = int(24 * z)            # canopy top sits this far above the sprite
+        key = (pw, ph, top, int(22 * z), int(12 * z), int(6 * z), int(4 * z),
+               int(2 * z), max(2, int(3 * z)))
+        sprite = self._chute_cache.get(key)
+        if sprite is None:
+            chute_c = (240, 240, 240)
+            cx = pw // 2             # gnome center, canopy-local
+            sprite = pygame.Surface((pw + 1, max(ph, top + int(4 * z)) + 1), pygame.SRCALPHA)
+            pygame.draw.arc(sprite, chute_c, (0, 0, pw, ph), 0, math.pi, max(2, int(3 * z)))
+            pygame.draw.ellipse(sprite, (220, 220, 230), (0, 0, pw, ph // 2))
+            pygame.draw.line(sprite, chute_c, (cx - int(22 * z), int(12 * z)), (cx - int(6 * z), top + int(4 * z)), 1)
+            pygame.draw.line(sprite, chute_c, (cx + int(22 * z), int(12 * z)), (cx + int(6 * z), top + int(4 * z)), 1)
+            pygame.draw.line(sprite, chute_c, (cx, int(2 * z)), (cx, top), 1)
+            self._chute_cache[key] = sprite
+        return sprite
+
     def draw(self, surface, gui_scale):
+        # Input handlers only flag the buttons stale; relabel once per frame
+        if self._ui_dirty:
+            self._update_button_states()
         now = time.time()
         dt = now - self._last_tick if self._last_tick else 0.016
         self._last_tick = now
@@ -4515,6 +4549,8 @@ class SandWindow:
         # Main loop runs at 60fps; we step the sim every Nth frame based on speed setting.
         self._sim_tick += 1
         if self._sim_tick % self._sim_speed == 0:
+            self._sim_steps += 1
+            self._sim_dirty = True
             _step(self._state, self._wind_active, self._wind_dir, self._reverse_gravity, self._splash_drops, self._vine_tips)
             _step_fire(self._state)
             _step_napalm(self._state)
@@ -4523,92 +4559,122 @@ class SandWindow:
 
             # Poison decay — settled poison disappears after 2 seconds
             g = self._state.grid
-            h, w = g.shape
-            poison_ys, poison_xs = np.where(g == POISON)
-            new_settle = {}
-            cur_time = now
-            for i in range(len(poison_ys)):
-                py, px = int(poison_ys[i]), int(poison_xs[i])
-                # Check if settled (can't fall further)
-                below = py + 1
-                settled = (below >= h or g[below, px] != EMPTY)
-                if settled:
-                    key = (px, py)
-                    if key in self._poison_settle:
-                        if cur_time - self._poison_settle[key] >= 2.0:
-                            g[py, px] = EMPTY
-                            self._state.colors[py, px] = (0, 0, 0)
-                        else:
-                            new_settle[key] = self._poison_settle[key]
-                    else:
-                        new_settle[key] = cur_time
-            self._poison_settle = new_settle
+            settle = self._poison_settle
+            # Settled = poison that can't fall further (bottom row or blocked)
+            settled = g == POISON
+            settled[:-1] &= g[1:] != EMPTY
+            expired = settled & (settle >= 0.0) & (now - settle >= 2.0)
+            settle[~settled] = -1.0
+            settle[settled & (settle < 0.0)] = now
+            if expired.any():
+                g[expired] = EMPTY
+                self._state.colors[expired] = 0
+                settle[expired] = -1.0
 
             # Assign zombie targets — each zombie chases nearest living gnome
-            living = [g for g in self._gnomes if g.alive and not g.is_zombie and not g.frozen]
-            for gnome in self._gnomes:
-                if gnome.is_zombie and gnome.alive and not gnome.frozen:
-                    best, best_d = None, 999.0
-                    for lg in living:
-                        d = abs(gnome.gx - lg.gx) + abs(gnome.gy - lg.gy)
-                        if d < best_d:
-                            best_d = d
-                            best = lg
-                    gnome.zombie_target = best
-
-            for gnome in self._gnomes:
-                gnome.step(self._state.grid)
+            living = []
+            chasers = []
+            for gn in self._gnomes:
+                if gn.alive and not gn.frozen:
+                    (chasers if gn.is_zombie else living).append(gn)
+            if chasers:
+                if living:
+                    # Manhattan distance from every zombie to every living gnome
+                    zx, zy = _gnome_xy(chasers)
+                    lx, ly = _gnome_xy(living)
+                    d = np.abs(zx[:, None] - lx) + np.abs(zy[:, None] - ly)
+                    nearest = d.argmin(axis=1)
+                    # Gnomes 999+ cells away are out of sight
+                    in_range = d[np.arange(len(chasers)), nearest] < 999
+                    for zg, j, seen in zip(chasers, nearest.tolist(), in_range.tolist()):
+                        zg.zombie_target = living[j] if seen else None
+                else:
+                    for zg in chasers:
+                        zg.zombie_target = None
+
+            grid = self._state.grid
+            h, w = grid.shape
+            # Crowds take turns scanning: a third of the gnomes per tick
+            crowd = len(self._gnomes) > _GNOME_SCAN_CAP
+            phase = self._sim_steps % 3
+            for i, gnome in enumerate(self._gnomes):
+                gnome.step(grid, h, w, not crowd or i % 3 == phase)
 
             # Zombie bite — zombie touches living gnome: both freeze 2s, then living turns zombie
-            zombies = [g for g in self._gnomes if g.alive and g.is_zombie and not g.frozen]
-            alive_live = [g for g in self._gnomes if g.alive and not g.is_zombie and not g.frozen]
+            # One pass splits the stepped gnomes into biters, bite targets,
+            # survivors and the dead (biting never kills, so this holds)
+            zombies = []
+            alive_live = []
+            survivors = []
+            dead = []
+            for gn in self._gnomes:
+                if not gn.alive:
+                    dead.append(gn)
+                    continue
+                survivors.append(gn)
+                if not gn.frozen:
+                    (zombies if gn.is_zombie else alive_live).append(gn)
+            # Bucket living gnomes into 3-cell bins: anything within bite
+            # range (< 3 cells on both axes) is in the zombie's bin or a
+            # neighbouring one, so each zombie checks at most 9 bins
+            bins = {}
+            for i, lg in enumerate(alive_live):
+                bins.setdefault((lg.gx // 3, lg.gy // 3), []).append(i)
             for zg in zombies:
-                for lg in alive_live:
-                    if abs(zg.gx - lg.gx) < 3 and abs(zg.gy - lg.gy) < 3:
-                        # Freeze both for 2 seconds
-                        zg.frozen = True
-                        zg.freeze_start = time.time()
-                        lg.frozen = True
-                        lg.freeze_start = time.time()
-                        # Mark victim — will turn zombie when freeze ends
-                        lg.zombie_pending = True
-                        break
+                bx, by = zg.gx // 3, zg.gy // 3
+                victim = len(alive_live)   # first in list order wins
+                for ox, oy in _BITE_BINS:
+                    for i in bins.get((bx + ox, by + oy), ()):
+                        lg = alive_live[i]
+                        if i < victim and abs(zg.gx - lg.gx) < 3 and abs(zg.gy - lg.gy) < 3:
+                            victim = i
+                if victim < len(alive_live):
+                    lg = alive_live[victim]
+                    # Freeze both for 2 seconds
+                    zg.frozen = True
+                    zg.freeze_start = now
+                    lg.frozen = True
+                    lg.freeze_start = now
+                    # Mark victim — will turn zombie when freeze ends
+                    lg.zombie_pending = True
 
             # Spawn gibs when gnomes die from fire
-            new_gnomes = []
-            for gnome in self._gnomes:
-                if gnome.alive:
-                    new_gnomes.append(gnome)
-                else:
-                    # Dead gnome — spray gibs
-                    gx, gy = int(gnome.gx), int(gnome.gy)
-                    gib_color = gnome.color if not gnome.on_fire else random.choice(_GIB_COLORS)
-                    for _ in range(random.randint(6, 12)):
-                        self._gibs.append(_Gib(gx, gy, gib_color))
-            self._gnomes = new_gnomes
+            for gnome in dead:
+                gx, gy = int(gnome.gx), int(gnome.gy)
+                gib_color = gnome.color if not gnome.on_fire else random.choice(_GIB_COLORS)
+                self._gibs.burst(gx, gy, random.randint(6, 12), gib_color)
+            self._gnomes = survivors
 
             # Step gibs
-            for gib in self._gibs:
-                gib.step(self._state.grid)
-            self._gibs = [g for g in self._gibs if g.alive]
+            self._gibs.step(self._state.grid)
 
             # Step sparks
-            for spark in self._sparks:
-                spark.step(self._state.grid)
-            self._sparks = [s for s in self._sparks if s.alive]
+            self._sparks.step(self._state.grid)
 
             # Step buckshot pellets — check for gnome hits
-            for pellet in self._buckshots:
+            pellets = self._buckshots
+            overlap = None
+            if pellets and self._gnomes:
+                # Every pellet against every gnome in one broadcast: gnome
+                # body spans from gy (feet) up to gy-13 (hat tip) — X within
+                # 3 cells, Y anywhere along body height
+                n_p = len(pellets)
+                px = np.fromiter((p.x for p in pellets), np.float64, n_p)
+                py = np.fromiter((p.y for p in pellets), np.float64, n_p)
+                gx, gy = _gnome_xy(self._gnomes)
+                overlap = ((np.abs(px[:, None] - gx) < 3)
+                           & (gy - 13 <= py[:, None]) & (py[:, None] <= gy + 1))
+                struck = overlap.any(axis=1).tolist()
+            for i, pellet in enumerate(pellets):
                 if not pellet.alive:
                     continue
                 # Check gnome hits BEFORE terrain collision so bullets
                 # don't get eaten by ground near a gnome's feet
-                for gnome in self._gnomes:
-                    if not gnome.alive:
-                        continue
-                    # Gnome body spans from gy (feet) up to gy-13 (hat tip)
-                    # Check X within 3 cells, Y anywhere along body height
-                    if abs(pellet.x - gnome.gx) < 3 and (gnome.gy - 13) <= pellet.y <= (gnome.gy + 1):
+                if overlap is not None and struck[i]:
+                    for j in np.flatnonzero(overlap[i]).tolist():
+                        gnome = self._gnomes[j]
+                        if not gnome.alive:
+                            continue
                         pellet.alive = False
                         # Only deal damage once per tick (prevents shotgun multi-pellet insta-kill)
                         if gnome._last_hit_tick == self._sim_tick:
@@ -4618,30 +4684,26 @@ class SandWindow:
                         if gnome.hp <= 0:
                             gnome.alive = False
                             # Big bloody gib explosion on death
-                            for _ in range(random.randint(20, 35)):
-                                blood_c = random.choice([(200, 30, 30), (180, 20, 20), (220, 50, 40), (160, 10, 10), gnome.color])
-                                gb = _Gib(int(gnome.gx), int(gnome.gy), blood_c)
-                                gb.vx = pellet.vx * 0.3 + random.uniform(-3.5, 3.5)
-                                gb.vy = pellet.vy * 0.3 + random.uniform(-6.0, -1.0)
-                                self._gibs.append(gb)
+                            n = random.randint(20, 35)
+                            self._gibs.burst(int(gnome.gx), int(gnome.gy), n,
+                                             _sample_palette(_BLOOD_COLORS + (gnome.color,), n),
+                                             pellet.vx * 0.3 + np.random.uniform(-3.5, 3.5, n),
+                                             pellet.vy * 0.3 + np.random.uniform(-6.0, -1.0, n))
                             # Big spark burst
-                            for _ in range(random.randint(15, 25)):
-                                self._sparks.append(_Spark(gnome.gx, gnome.gy))
+                            self._sparks.burst(gnome.gx, gnome.gy, random.randint(15, 25))
                         else:
                             # Hit but not dead — blood spray
-                            for _ in range(random.randint(6, 12)):
-                                blood_c = random.choice([(200, 30, 30), (180, 20, 20), (220, 50, 40), (160, 10, 10)])
-                                gb = _Gib(int(gnome.gx), int(gnome.gy), blood_c)
-                                gb.vx = pellet.vx * 0.4 + random.uniform(-2.5, 2.5)
-                                gb.vy = pellet.vy * 0.3 + random.uniform(-4.0, -0.5)
-                                self._gibs.append(gb)
-                            for _ in range(random.randint(4, 8)):
-                                self._sparks.append(_Spark(gnome.gx, gnome.gy))
+                            n = random.randint(6, 12)
+                            self._gibs.burst(int(gnome.gx), int(gnome.gy), n,
+                                             _sample_palette(_BLOOD_COLORS, n),
+                                             pellet.vx * 0.4 + np.random.uniform(-2.5, 2.5, n),
+                                             pellet.vy * 0.3 + np.random.uniform(-4.0, -0.5, n))
+                            self._sparks.burst(gnome.gx, gnome.gy, random.randint(4, 8))
                         break
                 # Move pellet (terrain collision) only if it didn't hit a gnome
                 if pellet.alive:
                     pellet.step(self._state.grid)
-            self._buckshots = [b for b in self._buckshots if b.alive]
+            self._buckshots = _Buckshot.recycle(self._buckshots)
 
             # Step missiles — check for gnome hits, explode on solid terrain
             for missile in self._missiles:
@@ -4676,10 +4738,10 @@ class SandWindow:
                             continue
                         if abs(fp.x - gnome.gx) < 2 and abs(fp.y - gnome.gy) < 2:
                             gnome.on_fire = True
-                            gnome.fire_start_time = time.time()
+                            gnome.fire_start_time = now
                             fp.alive = False
                             break
-            self._flame_particles = [f for f in self._flame_particles if f.alive]
+            self._flame_particles = _FlameParticle.recycle(self._flame_particles)
 
             # Step homing missiles — update target from mouse, check gnome hits
             if self._homing_missiles:
@@ -4711,9 +4773,7 @@ class SandWindow:
                 self._homing_missiles = new_homing
 
             # Step splash drops
-            for drop in self._splash_drops:
-                drop.step(self._state.grid, self._state.colors)
-            self._splash_drops = [d for d in self._splash_drops if d.alive]
+            self._splash_drops.step(self._state.grid, self._state.colors)
 
             # Step worms
             for worm in self._worms:
@@ -4721,22 +4781,26 @@ class SandWindow:
             self._worms = [w for w in self._worms if w.alive]
 
             # Step bees
-            for bee in self._bees:
-                bee.step(self._state.grid, self._state.colors, self._gnomes)
+            if self._bees:
+                buckets = _gnome_buckets(self._gnomes)
+                # Big swarms take turns searching: a quarter of the bees per tick
+                crowd = len(self._bees) > _BEE_SEARCH_CAP
+                phase = self._sim_steps % 4
+                for i, bee in enumerate(self._bees):
+                    bee.step(self._state.grid, self._state.colors, buckets,
+                             not crowd or i % 4 == phase)
             self._bees = [b for b in self._bees if b.alive]
 
             # Step bombs — physics + fuse check
+            step_dt = self._sim_speed / _FPS_FRAME
             for bomb in self._bombs:
-                bomb.step(self._state.grid)
+                bomb.step(self._state.grid, step_dt)
             # Explode any bombs that went off
-            new_bombs = []
             for bomb in self._bombs:
                 if bomb.exploded:
                     _explode_bomb(self._state, bomb.x, bomb.y,
                                   self._gnomes, self._gibs, self._sparks, bomb.is_fire)
-                elif bomb.alive:
-                    new_bombs.append(bomb)
-            self._bombs = new_bombs
+            self._bombs = _Bomb.recycle(self._bombs)
 
             # Step player — poll keyboard directly for reliable input
             if self._player is not None:
@@ -4837,17 +4901,26 @@ class SandWindow:
             self._cam_y += (0.0 - self._cam_y) * cam_smooth
         self._cam_zoom += (self._cam_target_zoom - self._cam_zoom) * cam_smooth
 
-        surface.fill(_BLACK)
-
         # Fast pixel rendering — reuse buffer to avoid per-frame allocation
         st = self._state
         # Copy colors into pre-allocated buffer, zero out empty/tunnel cells in-place
-        np.copyto(self._rgb_buf, st.colors)
-        self._rgb_buf[st.grid == EMPTY] = 0
-        self._rgb_buf[st.grid == TUNNEL] = 0
-
-        # Blit into pre-allocated small surface, then scale with camera zoom
-        pygame.surfarray.blit_array(self._pixel_surf, self._rgb_buf.transpose(1, 0, 2))
+        # On frames where neither the sim nor a brush touched anything,
+        # the last grid image (and its upscale) is still current
+        if self._sim_dirty:
+            self._sim_dirty = False
+            # Black out empty/tunnel cells in one fused pass: gather each
+            # cell's RGB mask from the LUT, then AND it over the colors
+            np.take(_SHOWN_MASK_V3, st.grid, out=self._mask_v3)
+            np.bitwise_and(st.colors, self._mask_buf, out=self._rgb_buf)
+            # Gibs, sparks and splash drops are a cell across — draw them
+            # into the grid image so they ride along with the upscale
+            self._gibs.splat(self._rgb_buf)
+            self._sparks.splat(self._rgb_buf)
+            self._splash_drops.splat(self._rgb_buf)
+            # Blit at grid resolution (blit_array takes the transposed view
+            # as-is, no copy), then let pygame's scaler do the upscale
+            pygame.surfarray.blit_array(self._pixel_surf, self._rgb_buf.transpose(1, 0, 2))
+            self._zoomed_stale = True
         cz = self._cam_zoom
         scaled_w = int(self._ww * cz)
         scaled_h = int(self._wh * cz)
@@ -4855,16 +4928,31 @@ class SandWindow:
             # Reuse pre-allocated zoomed surface — resize only if needed
             if self._zoomed_surf.get_width() != scaled_w or self._zoomed_surf.get_height() != scaled_h:
                 self._zoomed_surf = pygame.Surface((scaled_w, scaled_h))
-            pygame.transform.scale(self._pixel_surf, (scaled_w, scaled_h), self._zoomed_surf)
+                self._zoomed_stale = True
+            if self._zoomed_stale:
+                pygame.transform.scale(self._pixel_surf, (scaled_w, scaled_h), self._zoomed_surf)
+                self._zoomed_stale = False
+            surface.fill(_BLACK)
             surface.blit(self._zoomed_surf, (int(self._cam_x), int(self._cam_y)))
         else:
-            pygame.transform.scale(self._pixel_surf, (self._ww, self._wh), self._scaled_surf)
-            surface.blit(self._scaled_surf, (0, 0))
+            # Unzoomed the upscale covers the whole window, so scale
+            # straight into it — no intermediate surface, no clear
+            pygame.transform.scale(self._pixel_surf, (self._ww, self._wh), surface)
 
         cam_ox = self._cam_x if cz > 1.01 else 0.0
         cam_oy = self._cam_y if cz > 1.01 else 0.0
         cam_z = cz if cz > 1.01 else 1.0
 
+        # Pre-sample every burning gnome's three flame flecks in one go:
+        # (dx, dy, color index, radius) per fleck, consumed in draw order
+        n_flecks = 3 * sum(1 for gn in self._gnomes if gn.on_fire)
+        if n_flecks:
+            rng = self._rng
+            flecks = zip((rng.integers(-10, 11, n_flecks) * cam_z).astype(int).tolist(),
+                         (rng.integers(-20, 11, n_flecks) * cam_z).astype(int).tolist(),
+                         rng.integers(0, len(_FIRE_COLORS), n_flecks).tolist(),
+                         rng.integers(2, max(3, int(4 * cam_z)) + 1, n_flecks).tolist())
+
         # Draw gnomes as stick figures (or zombie sprite)
         for gnome in self._gnomes:
             sx = int((gnome.gx * _CELL + _CELL // 2) * cam_z + cam_ox)
@@ -4891,19 +4979,15 @@ class SandWindow:
                 zsprite = self._zombie_cache[zkey]
                 # Fire tint
                 if gnome.on_fire:
-                    zsprite = zsprite.copy()
-                    ztint = pygame.Surface((zpw, zph), pygame.SRCALPHA)
-                    ztint.fill(random.choice([(255, 80, 0, 140), (255, 0, 0, 140), (255, 180, 0, 140)]))
-                    zsprite.blit(ztint, (0, 0), special_flags=pygame.BLEND_RGBA_MULT)
+                    zsprite = self._fire_tinted(zsprite, ('z',) + zkey)
                 surface.blit(zsprite, (zsx, zsy))
                 # Fire particles around burning zombie
                 if gnome.on_fire:
                     zcx = sx
                     zcy = zsy + zph // 2
                     for _ in range(3):
-                        fx = zcx + int(random.randint(-10, 10) * z)
-                        fy = zcy + int(random.randint(-20, 10) * z)
-                        pygame.draw.circle(surface, random.choice(_FIRE_COLORS), (fx, fy), random.randint(2, max(3, int(4 * z))))
+                        dx, dy, ci, r = next(flecks)
+                        pygame.draw.circle(surface, _FIRE_COLORS[ci], (zcx + dx, zcy + dy), r)
                 # Bee swarm around stung zombie
                 if gnome.bee_stung:
                     for _ in range(5):
@@ -4927,24 +5011,12 @@ class SandWindow:
             nsprite = self._npc_cache[nkey]
             # Fire tint
             if gnome.on_fire:
-                nsprite = nsprite.copy()
-                ntint = pygame.Surface((npw, nph), pygame.SRCALPHA)
-                ntint.fill(random.choice([(255, 80, 0, 140), (255, 0, 0, 140), (255, 180, 0, 140)]))
-                nsprite.blit(ntint, (0, 0), special_flags=pygame.BLEND_RGBA_MULT)
+                nsprite = self._fire_tinted(nsprite, ('n',) + nkey)
             surface.blit(nsprite, (nsx, nsy))
             # Parachute — drawn above sprite when deployed
             if gnome.parachute_open:
-                chute_c = (240, 240, 240)
-                pw, ph = int(50 * z), int(40 * z)
-                px0 = sx - pw // 2
-                py0 = nsy - int(24 * z)
-                pygame.draw.arc(surface, chute_c,
-                                (px0, py0, pw, ph), 0, math.pi, max(2, int(3 * z)))
-                pygame.draw.ellipse(surface, (220, 220, 230),
-                                    (px0, py0, pw, ph // 2))
-                pygame.draw.line(surface, chute_c, (sx - int(22 * z), py0 + int(12 * z)), (sx - int(6 * z), nsy + int(4 * z)), 1)
-                pygame.draw.line(surface, chute_c, (sx + int(22 * z), py0 + int(12 * z)), (sx + int(6 * z), nsy + int(4 * z)), 1)
-                pygame.draw.line(surface, chute_c, (sx, py0 + int(2 * z)), (sx, nsy), 1)
+                pw = int(50 * z)
+                surface.blit(self._chute_sprite(z), (sx - pw // 2, nsy - int(24 * z)))
             # Held indicator
             if gnome.held:
                 pygame.draw.circle(surface, (220, 180, 120), (sx, nsy - int(8 * z)), max(3, int(6 * z)))
@@ -4954,9 +5026,8 @@ class SandWindow:
                 ncx = sx
                 ncy = nsy + nph // 2
                 for _ in range(3):
-                    fx = ncx + int(random.randint(-10, 10) * z)
-                    fy = ncy + int(random.randint(-20, 10) * z)
-                    pygame.draw.circle(surface, random.choice(_FIRE_COLORS), (fx, fy), random.randint(2, max(3, int(4 * z))))
+                    dx, dy, ci, r = next(flecks)
+                    pygame.draw.circle(surface, _FIRE_COLORS[ci], (ncx + dx, ncy + dy), r)
             # Bee swarm around stung gnome
             if gnome.bee_stung:
                 for _ in range(5):
@@ -4965,19 +5036,6 @@ class SandWindow:
                     pygame.draw.circle(surface, (240, 210, 40), (bx, by), max(1, int(2 * z)))
                     pygame.draw.circle(surface, (40, 30, 5), (bx, by), max(1, int(1 * z)))
 
-        # Draw gibs (bouncing body pieces)
-        for gib in self._gibs:
-            gx_px = int(gib.x * _CELL * cam_z + _CELL // 2 * cam_z + cam_ox)
-            gy_px = int(gib.y * _CELL * cam_z + _CELL // 2 * cam_z + cam_oy)
-            sz = max(2, int(2.5 * cam_z))
-            pygame.draw.rect(surface, gib.color, (gx_px - sz, gy_px - sz, sz * 2 + 1, sz * 2 + 1))
-
-        # Draw sparks (explosion shower)
-        for spark in self._sparks:
-            sx_px = int(spark.x * _CELL * cam_z + _CELL // 2 * cam_z + cam_ox)
-            sy_px = int(spark.y * _CELL * cam_z + _CELL // 2 * cam_z + cam_oy)
-            pygame.draw.circle(surface, spark.color, (sx_px, sy_px), max(1, int(2 * cam_z)))
-
         # Draw buckshot pellets
         for pellet in self._buckshots:
             bx_px = int(pellet.x * _CELL * cam_z + _CELL // 2 * cam_z + cam_ox)
@@ -5047,12 +5105,6 @@ class SandWindow:
             ey = hy_px - int(ndy * mw)
             pygame.draw.circle(surface, random.choice(_FIRE_COLORS), (ex, ey), max(2, int(4 * cam_z)))
 
-        # Draw splash drops
-        for drop in self._splash_drops:
-            dx_px = int(drop.x * _CELL * cam_z + _CELL // 2 * cam_z + cam_ox)
-            dy_px = int(drop.y * _CELL * cam_z + _CELL // 2 * cam_z + cam_oy)
-            pygame.draw.circle(surface, drop.color, (dx_px, dy_px), max(1, int(2 * cam_z)))
-
         # Draw worms
         for worm in self._worms:
             worm.draw(surface)
@@ -5081,15 +5133,10 @@ class SandWindow:
 
         # Draw menu panel when open — centered overlay
         if self._menu_open:
-            # Dim the whole screen
-            dim = pygame.Surface((self._ww, self._wh), pygame.SRCALPHA)
-            dim.fill((0, 0, 0, 140))
-            surface.blit(dim, (0, 0))
-            # Draw the panel background
+            # Dim the whole screen, then the panel background
+            surface.blit(self._menu_dim, (0, 0))
             pr = self._menu_panel_rect
-            panel = pygame.Surface((pr.w, pr.h), pygame.SRCALPHA)
-            panel.fill((15, 15, 30, 230))
-            surface.blit(panel, (pr.x, pr.y))
+            surface.blit(self._menu_backdrop, pr.topleft)
             pygame.draw.rect(surface, (80, 80, 120), pr, 2, border_radius=8)
             for btn in self._menu_buttons:
                 btn.draw(surface)
@@ -5100,9 +5147,10 @@ class SandWindow:
         info = f"{count} particles"
         if n_gnomes:
             info += f"  |  {n_gnomes} gnomes"
-        ct = self._font_small.render(info, True, (70, 70, 70))
-        surface.blit(ct, (self._ww - 140, 16))
+        if info != self._info_str:
+            self._info_str = info
+            self._info_surf = self._font_small.render(info, True, (70, 70, 70))
+        surface.blit(self._info_surf, (self._ww - 140, 16))
 
-        # Title (cached font)
-        title = self._font_title.render("DESERT SANDS", True, (255, 200, 100))
-        surface.blit(title, (self._ww // 2 - 80, 16))
+        # Title (rendered once)
+        surface.blit(self._title_surf, (self._ww // 2 - 80, 16))